@@ -129,10 +129,9 @@ def mock_spi_with_device_info(mock_spi: MockSPI) -> MockSPI:
             0,
             0,
             0,  # lut_version "2.0"
-        ]
+        ],
+        [0x0000],  # REG_0204 read for packed write enable
     )
-    # REG_0204 read for packed write enable
-    mock_spi.set_read_data([0x0000])
     return mock_spi
 
 
@@ -114,9 +114,8 @@ def profile_display_operations() -> None:
         print(f"\n--- Image Size: {w}x{h} ---")
 
         # Create a test image
-        img = Image.new("L", (w, h))
         pixels = np.random.randint(0, 256, size=(h, w), dtype=np.uint8)
-        img.putdata(pixels.flatten().tolist())
+        img = Image.fromarray(pixels, mode="L")
 
         # Test different pixel formats
         for format_name, pixel_format in [
@@ -266,7 +266,8 @@ class DisplayConstants:
 class PerformanceConstants:
     """Performance optimization thresholds."""
 
-    NUMPY_OPTIMIZATION_THRESHOLD = 10000  # Pixel count threshold for numpy optimization
+    NUMPY_OPTIMIZATION_THRESHOLD = 4096  # Pixel count threshold for numpy optimization
+    NUMBA_OPTIMIZATION_THRESHOLD = 262144  # Pixel count threshold for numba kernels
 
 
 class MemoryConstants:
@@ -302,6 +303,7 @@ class ProtocolConstants:
 
     # Pixel packing bit shifts
     PIXEL_SHIFT_4BPP = 4  # Right shift to reduce 8-bit to 4-bit
+    HIGH_NIBBLE_MASK = 0xF0  # Upper 4 bits of a byte (4bpp first pixel)
     PIXEL_SHIFT_2BPP_1 = 6  # First pixel position in 2bpp byte
     PIXEL_SHIFT_2BPP_2 = 4  # Second pixel position in 2bpp byte
     PIXEL_SHIFT_2BPP_3 = 2  # Third pixel position in 2bpp byte
@@ -1,6 +1,7 @@
 """Core IT8951 e-paper controller driver."""
 
 import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -48,6 +49,29 @@ from IT8951_ePaper_Py.models import (
 )
 from IT8951_ePaper_Py.spi_interface import SPIInterface, create_spi_interface
 
+# Translation tables for the standard packers, one per pixel slot within a packed
+# byte: each maps an 8-bit pixel to its reduced value already shifted into place
+_PACK_4BPP_TABLES = tuple(
+    bytes((v >> ProtocolConstants.PIXEL_SHIFT_4BPP) << shift for v in range(256))
+    for shift in (ProtocolConstants.PIXEL_SHIFT_4BPP, 0)
+)
+# The first 2bpp slot's shift also reduces an 8-bit pixel to its top 2 bits
+_PACK_2BPP_TABLES = tuple(
+    bytes((v >> ProtocolConstants.PIXEL_SHIFT_2BPP_1) << shift for v in range(256))
+    for shift in (
+        ProtocolConstants.PIXEL_SHIFT_2BPP_1,
+        ProtocolConstants.PIXEL_SHIFT_2BPP_2,
+        ProtocolConstants.PIXEL_SHIFT_2BPP_3,
+        0,
+    )
+)
+_PACK_1BPP_TABLES = tuple(
+    bytes(int(v >= ProtocolConstants.PIXEL_SHIFT_1BPP_THRESHOLD) << shift for v in range(256))
+    for shift in range(ProtocolConstants.PIXEL_SHIFT_1BPP_BITS, -1, -1)
+)
+# Bit-reversed value of every byte, for swapping MSB-first and LSB-first 1bpp data
+_REVERSE_BITS_TABLE = bytes(int(f"{v:08b}"[::-1], 2) for v in range(256))
+
 
 class IT8951:
     """IT8951 e-paper controller driver.
@@ -445,17 +469,8 @@ class IT8951:
         if not reverse_bits:
             return data
 
-        # Reverse bits in each byte
-        # Pre-allocate list for better performance
-        result = [0] * len(data)
-        for idx, byte in enumerate(data):
-            # Reverse bits: 0b10110010 -> 0b01001101
-            reversed_byte = 0
-            for i in range(ProtocolConstants.BITS_PER_BYTE):
-                if byte & (1 << i):
-                    reversed_byte |= 1 << (ProtocolConstants.PIXEL_SHIFT_1BPP_BITS - i)
-            result[idx] = reversed_byte
-        return bytes(result)
+        # Reverse bits in each byte with one table lookup: 0b10110010 -> 0b01001101
+        return bytes(data).translate(_REVERSE_BITS_TABLE)
 
     @staticmethod
     def pack_pixels(pixels: bytes | NumpyArray, pixel_format: PixelFormat) -> bytes:
@@ -499,15 +514,7 @@ class IT8951:
         # Ensure we have bytes for the original packers
         pixel_bytes = pixels.tobytes() if isinstance(pixels, np.ndarray) else pixels
 
-        # Use dictionary dispatch for cleaner code
-        packers = {
-            PixelFormat.BPP_8: IT8951._pack_8bpp,
-            PixelFormat.BPP_4: IT8951._pack_4bpp,
-            PixelFormat.BPP_2: IT8951._pack_2bpp,
-            PixelFormat.BPP_1: IT8951._pack_1bpp,
-        }
-
-        packer = packers.get(pixel_format)
+        packer = _STANDARD_PACKERS.get(pixel_format)
         if not packer:
             raise InvalidParameterError(f"Pixel format {pixel_format} not yet implemented")
 
@@ -563,19 +570,7 @@ class IT8951:
             >>> hex(packed[0])  # 0x0 and 0x8 packed
             '0x8'
         """
-        # Pre-allocate list for better performance
-        num_bytes = (len(pixels) + 1) // ProtocolConstants.PIXELS_PER_BYTE_4BPP
-        packed = [0] * num_bytes
-
-        for idx, i in enumerate(range(0, len(pixels), ProtocolConstants.PIXELS_PER_BYTE_4BPP)):
-            # Each pixel is reduced to 4 bits (0-15 range)
-            pixel1 = (pixels[i] >> ProtocolConstants.PIXEL_SHIFT_4BPP) if i < len(pixels) else 0
-            pixel2 = (
-                (pixels[i + 1] >> ProtocolConstants.PIXEL_SHIFT_4BPP) if i + 1 < len(pixels) else 0
-            )
-            # Pack two pixels into one byte (pixel1 in high nibble, pixel2 in low nibble)
-            packed[idx] = (pixel1 << ProtocolConstants.PIXEL_SHIFT_4BPP) | pixel2
-        return bytes(packed)
+        return IT8951._pack_with_tables(pixels, _PACK_4BPP_TABLES)
 
     @staticmethod
     def _pack_2bpp(pixels: bytes) -> bytes:
@@ -604,51 +599,7 @@ class IT8951:
             >>> bin(packed[0])  # 00 01 10 11
             '0b11011'
         """
-        pixels_per_byte = ProtocolConstants.PIXELS_PER_BYTE_2BPP
-        # Pre-allocate list for better performance
-        num_bytes = (len(pixels) + pixels_per_byte - 1) // pixels_per_byte
-        packed = [0] * num_bytes
-
-        for idx, i in enumerate(range(0, len(pixels), pixels_per_byte)):
-            # Get pixels for this byte, with bounds checking
-            pixel_values = [IT8951._get_pixel_2bit(pixels, i + j) for j in range(pixels_per_byte)]
-
-            # Pack into byte with proper bit positions
-            packed[idx] = (
-                (pixel_values[0] << 6)
-                | (pixel_values[1] << 4)
-                | (pixel_values[2] << 2)
-                | pixel_values[3]
-            )
-
-        return bytes(packed)
-
-    @staticmethod
-    def _get_pixel_2bit(pixels: bytes, index: int) -> int:
-        """Get a pixel value reduced to 2 bits.
-
-        Helper function for 2bpp packing that safely extracts a pixel
-        value and reduces it from 8-bit to 2-bit precision.
-
-        Args:
-            pixels: Source pixel array.
-            index: Index of the pixel to extract.
-
-        Returns:
-            2-bit pixel value (0-3). Returns 0 for out-of-bounds indices.
-
-        Example:
-            >>> pixels = bytes([0xFF, 0x80, 0x40, 0x00])
-            >>> IT8951._get_pixel_2bit(pixels, 0)  # 0xFF >> 6 = 3
-            3
-            >>> IT8951._get_pixel_2bit(pixels, 1)  # 0x80 >> 6 = 2
-            2
-            >>> IT8951._get_pixel_2bit(pixels, 4)  # Out of bounds
-            0
-        """
-        if index < len(pixels):
-            return pixels[index] >> 6  # Reduce 8-bit to 2-bit
-        return 0
+        return IT8951._pack_with_tables(pixels, _PACK_2BPP_TABLES)
 
     @staticmethod
     def _pack_1bpp(pixels: bytes) -> bytes:
@@ -681,59 +632,31 @@ class IT8951:
             1bpp mode requires 32-pixel alignment on some IT8951 models
             for proper display operation.
         """
-        pixels_per_byte = ProtocolConstants.PIXELS_PER_BYTE_1BPP
-        threshold = ProtocolConstants.PIXEL_SHIFT_1BPP_THRESHOLD
-        # Pre-allocate list for better performance
-        num_bytes = (len(pixels) + pixels_per_byte - 1) // pixels_per_byte
-        packed = [0] * num_bytes
-
-        for idx, i in enumerate(range(0, len(pixels), pixels_per_byte)):
-            packed[idx] = IT8951._pack_byte_1bpp(pixels, i, pixels_per_byte, threshold)
-
-        return bytes(packed)
+        return IT8951._pack_with_tables(pixels, _PACK_1BPP_TABLES)
 
     @staticmethod
-    def _pack_byte_1bpp(pixels: bytes, start_idx: int, pixels_per_byte: int, threshold: int) -> int:
-        """Pack up to 8 pixels into a single byte for 1bpp format.
+    def _pack_with_tables(pixels: bytes, tables: tuple[bytes, ...]) -> bytes:
+        """Pack pixels using one translation table per pixel slot.
 
-        Helper function that packs a group of pixels into a single byte
-        for 1bpp format. Each pixel is converted to a single bit based
-        on a threshold value.
+        Slot ``k`` holds pixels ``k, k + n, k + 2n, ...`` where ``n`` is the
+        number of pixels per packed byte. Each slot is translated to its shifted
+        bit pattern with ``bytes.translate`` and the slots are OR-ed together as
+        big integers, so the per-pixel work runs in C rather than the interpreter.
 
         Args:
-            pixels: Source pixel array.
-            start_idx: Starting index in the pixel array.
-            pixels_per_byte: Number of pixels to pack (typically 8).
-            threshold: Threshold for black/white decision (typically 128).
-                Pixels >= threshold become 1 (white), others become 0 (black).
+            pixels: Raw pixel data where each byte represents one pixel.
+            tables: Translation tables ordered from the MSB slot to the LSB slot.
 
         Returns:
-            Packed byte containing up to 8 pixels as bits.
-
-        Example:
-            >>> pixels = bytes([0, 255, 128, 127, 200, 50, 255, 0])
-            >>> IT8951._pack_byte_1bpp(pixels, 0, 8, 128)
-            0b01110100  # Binary: 01110100
-
-            Explanation:
-            - 0 < 128 -> 0
-            - 255 >= 128 -> 1
-            - 128 >= 128 -> 1
-            - 127 < 128 -> 0
-            - etc.
-        """
-        packed_byte = 0
-
-        for j in range(pixels_per_byte):
-            idx = start_idx + j
-            if idx < len(pixels):
-                # Convert to 1-bit (0 or 1) using threshold
-                bit = 1 if pixels[idx] >= threshold else 0
-                # Pack bit into byte (MSB first)
-                bit_position = 7 - j
-                packed_byte |= bit << bit_position
-
-        return packed_byte
+            Packed data, zero-padded to a whole number of bytes.
+        """
+        pixels_per_byte = len(tables)
+        num_bytes = -(-len(pixels) // pixels_per_byte)
+        combined = 0
+        for offset, table in enumerate(tables):
+            slot = bytes(pixels[offset::pixels_per_byte]).translate(table)
+            combined |= int.from_bytes(slot.ljust(num_bytes, b"\x00"), "big")
+        return combined.to_bytes(num_bytes, "big")
 
     def load_image_end(self) -> None:
         """End image loading operation."""
@@ -849,3 +772,12 @@ class IT8951:
         if not self._device_info:
             raise InitializationError("Device info not available")
         return self._device_info
+
+
+# Dictionary dispatch for the standard packers, built once rather than per call
+_STANDARD_PACKERS: dict[PixelFormat, Callable[[bytes], bytes]] = {
+    PixelFormat.BPP_8: IT8951._pack_8bpp,
+    PixelFormat.BPP_4: IT8951._pack_4bpp,
+    PixelFormat.BPP_2: IT8951._pack_2bpp,
+    PixelFormat.BPP_1: IT8951._pack_1bpp,
+}
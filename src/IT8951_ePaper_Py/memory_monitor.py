@@ -5,6 +5,8 @@ during e-paper display operations to help optimize memory consumption.
 """
 
 import gc
+import mmap
+import sys
 import tracemalloc
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -13,6 +15,11 @@ from typing import Any
 
 import psutil
 
+# On Linux, /proc/self/statm reports "size resident ..." in pages, which is
+# much cheaper to read than going through psutil for the rss/vms pair.
+_STATM_PATH = "/proc/self/statm"
+_USE_STATM = sys.platform.startswith("linux")
+
 
 @dataclass
 class MemorySnapshot:
@@ -46,6 +53,26 @@ class MemoryMonitor:
         self.process = psutil.Process()
         self.snapshots: list[tuple[str, MemorySnapshot]] = []
         self._tracemalloc_started = False
+        self._use_statm = _USE_STATM
+
+    def _read_rss_vms(self) -> tuple[int, int]:
+        """Read process resident and virtual memory sizes.
+
+        Uses /proc/self/statm when available and falls back to psutil.
+
+        Returns:
+            Tuple of (rss, vms) in bytes.
+        """
+        if self._use_statm:
+            try:
+                with open(_STATM_PATH, "rb") as statm:
+                    size, resident = statm.read().split()[:2]
+                return int(resident) * mmap.PAGESIZE, int(size) * mmap.PAGESIZE
+            except (OSError, ValueError):
+                self._use_statm = False
+
+        mem_info = self.process.memory_info()
+        return mem_info.rss, mem_info.vms
 
     def start_tracking(self) -> None:
         """Start memory tracking."""
@@ -72,9 +99,9 @@ class MemoryMonitor:
         gc.collect()
 
         # Get process memory info
-        mem_info = self.process.memory_info()
-        rss_mb = mem_info.rss / 1024 / 1024
-        vms_mb = mem_info.vms / 1024 / 1024
+        rss, vms = self._read_rss_vms()
+        rss_mb = rss / 1024 / 1024
+        vms_mb = vms / 1024 / 1024
 
         # Get Python memory info
         if tracemalloc.is_tracing():
@@ -104,10 +131,10 @@ class MemoryMonitor:
         Returns:
             Dictionary with memory usage in MB.
         """
-        mem_info = self.process.memory_info()
+        rss, vms = self._read_rss_vms()
         return {
-            "rss_mb": mem_info.rss / 1024 / 1024,
-            "vms_mb": mem_info.vms / 1024 / 1024,
+            "rss_mb": rss / 1024 / 1024,
+            "vms_mb": vms / 1024 / 1024,
             "percent": self.process.memory_percent(),
         }
 
@@ -16,6 +16,8 @@ Examples:
         )
 """
 
+from itertools import takewhile
+
 from pydantic import BaseModel, Field, field_validator
 
 from IT8951_ePaper_Py.constants import (
@@ -80,12 +82,8 @@ class DeviceInfo(BaseModel):
             ValueError: If version data is invalid.
         """
         if isinstance(v, list):
-            chars: list[str] = []
-            for val in v:
-                if val == 0:
-                    break
-                chars.append(chr(val))
-            return "".join(chars)
+            # Decode up to the first NUL terminator
+            return "".join(map(chr, takewhile(bool, v)))
         return v
 
 
@@ -180,54 +178,13 @@ class DisplayArea(BaseModel):
         mode: Display refresh mode (default: GC16).
     """
 
-    x: int = Field(..., ge=0)
-    y: int = Field(..., ge=0)
-    width: int = Field(..., gt=0)
-    height: int = Field(..., gt=0)
+    # Alignment is enforced with multiple_of so pydantic-core checks it natively
+    x: int = Field(..., ge=0, multiple_of=DisplayConstants.PIXEL_ALIGNMENT)
+    y: int = Field(..., ge=0, multiple_of=DisplayConstants.PIXEL_ALIGNMENT)
+    width: int = Field(..., gt=0, multiple_of=DisplayConstants.PIXEL_ALIGNMENT)
+    height: int = Field(..., gt=0, multiple_of=DisplayConstants.PIXEL_ALIGNMENT)
     mode: DisplayMode = Field(default=DisplayMode.GC16)
 
-    @field_validator("x", "y")
-    @classmethod
-    def validate_position(cls, v: int) -> int:
-        """Validate position is aligned to 4 pixels.
-
-        The IT8951 requires all coordinates to be multiples of 4.
-
-        Args:
-            v: Position coordinate to validate.
-
-        Returns:
-            int: Validated position.
-
-        Raises:
-            ValueError: If position is not aligned to 4 pixels.
-        """
-        if v % DisplayConstants.PIXEL_ALIGNMENT != 0:
-            raise ValueError(
-                f"Position must be aligned to {DisplayConstants.PIXEL_ALIGNMENT} pixels"
-            )
-        return v
-
-    @field_validator("width", "height")
-    @classmethod
-    def validate_dimensions(cls, v: int) -> int:
-        """Validate dimensions are multiples of 4.
-
-        The IT8951 requires all dimensions to be multiples of 4.
-
-        Args:
-            v: Dimension value to validate.
-
-        Returns:
-            int: Validated dimension.
-
-        Raises:
-            ValueError: If dimension is not a multiple of 4.
-        """
-        if v % DisplayConstants.PIXEL_ALIGNMENT != 0:
-            raise ValueError(f"Dimensions must be multiples of {DisplayConstants.PIXEL_ALIGNMENT}")
-        return v
-
 
 class VCOMConfig(BaseModel):
     """VCOM voltage configuration.
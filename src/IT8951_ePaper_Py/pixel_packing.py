@@ -4,24 +4,47 @@ This module provides numpy-optimized implementations of pixel packing functions
 for improved performance when working with large images.
 """
 
+from collections.abc import Callable, Sequence
+from itertools import pairwise
 from typing import TYPE_CHECKING
 
 import numpy as np
 from numpy.typing import NDArray
 
-from IT8951_ePaper_Py.constants import PixelFormat, ProtocolConstants
+from IT8951_ePaper_Py.constants import PerformanceConstants, PixelFormat, ProtocolConstants
 from IT8951_ePaper_Py.exceptions import InvalidParameterError
-
-# Cached arrays for 1bpp packing to avoid repeated allocations
-_POWERS_OF_2_CACHE = np.array([128, 64, 32, 16, 8, 4, 2, 1], dtype=np.uint8)
+from IT8951_ePaper_Py.pixel_packing_numba import (
+    NUMBA_AVAILABLE,
+    pack_1bpp_numba,
+    pack_2bpp_numba,
+    pack_4bpp_numba,
+)
 
 if TYPE_CHECKING:
     NumpyArray = NDArray[np.uint8]
 else:
     NumpyArray = np.ndarray
 
-
-def pack_pixels_numpy(pixels: bytes | NDArray[np.generic], pixel_format: PixelFormat) -> bytes:
+# 64 KB lookup table mapping a big-endian pixel pair (first << 8 | second) to its
+# packed 4bpp byte, so packing becomes a single gather over a uint16 view
+_PAIR_INDEX = np.arange(1 << 16, dtype=np.uint32)
+_PACK_4BPP_LUT = (
+    ((_PAIR_INDEX >> ProtocolConstants.BYTE_SHIFT) & ProtocolConstants.HIGH_NIBBLE_MASK)
+    | ((_PAIR_INDEX & ProtocolConstants.BYTE_MASK) >> ProtocolConstants.PIXEL_SHIFT_4BPP)
+).astype(np.uint8)
+del _PAIR_INDEX
+
+_PIXELS_PER_BYTE = {
+    PixelFormat.BPP_8: 1,
+    PixelFormat.BPP_4: ProtocolConstants.PIXELS_PER_BYTE_4BPP,
+    PixelFormat.BPP_2: ProtocolConstants.PIXELS_PER_BYTE_2BPP,
+    PixelFormat.BPP_1: ProtocolConstants.PIXELS_PER_BYTE_1BPP,
+}
+
+
+def pack_pixels_numpy(
+    pixels: bytes | bytearray | memoryview | NDArray[np.generic], pixel_format: PixelFormat
+) -> bytes:
     """Pack pixel data using numpy optimizations.
 
     This function provides significantly faster pixel packing for large images
@@ -37,94 +60,193 @@ def pack_pixels_numpy(pixels: bytes | NDArray[np.generic], pixel_format: PixelFo
     Raises:
         InvalidParameterError: If pixel format is not supported.
     """
-    # Convert to numpy array if needed
-    if isinstance(pixels, bytes):
+    # 8bpp needs no packing, so buffers skip the round trip through numpy
+    # (bytes() returns a bytes input itself rather than a copy)
+    if pixel_format == PixelFormat.BPP_8 and isinstance(pixels, bytes | bytearray | memoryview):
+        return bytes(pixels)
+
+    return pack_pixels_numpy_buffer(pixels, pixel_format).tobytes()
+
+
+def pack_pixels_numpy_buffer(
+    pixels: bytes | bytearray | memoryview | NDArray[np.generic],
+    pixel_format: PixelFormat,
+    out: NumpyArray | None = None,
+) -> NumpyArray:
+    """Pack pixel data into a numpy array without copying it out to bytes.
+
+    Use this when the consumer accepts any buffer-protocol object (for example
+    ``memoryview(result)`` or spidev's ``writebytes2``) to skip the final copy
+    that :func:`pack_pixels_numpy` makes. For 8bpp the result may be a view of
+    the input.
+
+    Repeated-frame workloads can pass the same ``out`` array on every call to
+    avoid allocating a new result each time. The caller owns ``out``, so a
+    later call overwrites the data returned by an earlier one.
+
+    Args:
+        pixels: 8-bit pixel data (each byte is one pixel).
+        pixel_format: Target pixel format.
+        out: Optional 1-D uint8 array to write the packed data into. Its length
+            must match the packed size exactly.
+
+    Returns:
+        1-D uint8 array of packed pixel data according to format (``out`` when
+        provided).
+
+    Raises:
+        InvalidParameterError: If pixel format is not supported or ``out`` does
+            not match the packed size.
+    """
+    # Convert to numpy array if needed, viewing buffers without copying
+    if isinstance(pixels, bytes | bytearray | memoryview):
         arr = np.frombuffer(pixels, dtype=np.uint8)
     else:
-        # Ensure we have uint8 array
-        arr = pixels.astype(np.uint8)
+        # Ensure we have uint8 array (no copy when it already is one)
+        arr = np.asarray(pixels, dtype=np.uint8)
 
-    # Use dictionary dispatch
-    packers = {
-        PixelFormat.BPP_8: _pack_8bpp_numpy,
-        PixelFormat.BPP_4: _pack_4bpp_numpy,
-        PixelFormat.BPP_2: _pack_2bpp_numpy,
-        PixelFormat.BPP_1: _pack_1bpp_numpy,
-    }
+    # Very large frames use single-pass numba kernels when numba is installed
+    if NUMBA_AVAILABLE and arr.size >= PerformanceConstants.NUMBA_OPTIMIZATION_THRESHOLD:
+        packers = _NUMBA_PACKERS
+    else:
+        packers = _NUMPY_PACKERS
 
     packer = packers.get(pixel_format)
     if not packer:
         raise InvalidParameterError(f"Pixel format {pixel_format} not yet implemented")
 
-    return packer(arr)
+    if out is not None:
+        pixels_per_byte = _PIXELS_PER_BYTE[pixel_format]
+        packed_size = -(-arr.size // pixels_per_byte)
+        if out.dtype != np.uint8 or out.shape != (packed_size,):
+            raise InvalidParameterError(
+                f"Output buffer must be a 1-D uint8 array of {packed_size} bytes, "
+                f"got {out.dtype} array of shape {out.shape}"
+            )
+
+    return packer(arr, out)
+
+
+def pack_pixels_batch(
+    frames: Sequence[bytes | bytearray | memoryview | NDArray[np.generic]],
+    pixel_format: PixelFormat,
+) -> list[NumpyArray]:
+    """Pack several frames with a single packer call.
+
+    Many small frames (animation steps, partial updates) spend most of their
+    packing time in per-call numpy overhead. This copies them into one
+    contiguous buffer, packs it once, and hands back one view per frame.
+    Each frame is zero-padded to a whole packed byte before concatenation,
+    so results match packing the frames one at a time.
+
+    Args:
+        frames: 8-bit pixel data for each frame (each byte is one pixel).
+        pixel_format: Target pixel format.
+
+    Returns:
+        Packed pixel data for each frame, as views into one shared array.
+
+    Raises:
+        InvalidParameterError: If pixel format is not supported.
+    """
+    pixels_per_byte = _PIXELS_PER_BYTE.get(pixel_format)
+    if pixels_per_byte is None:
+        raise InvalidParameterError(f"Pixel format {pixel_format} not yet implemented")
+
+    arrays = [
+        np.frombuffer(frame, dtype=np.uint8)
+        if isinstance(frame, bytes | bytearray | memoryview)
+        else np.asarray(frame, dtype=np.uint8).reshape(-1)
+        for frame in frames
+    ]
+    packed_sizes = [-(-arr.size // pixels_per_byte) for arr in arrays]
+    offsets = np.cumsum([0, *packed_sizes])
 
+    combined = np.zeros(offsets[-1] * pixels_per_byte, dtype=np.uint8)
+    for arr, offset in zip(arrays, offsets[:-1], strict=True):
+        start = offset * pixels_per_byte
+        combined[start : start + arr.size] = arr
 
-def _pack_8bpp_numpy(arr: NumpyArray) -> bytes:
+    packed = pack_pixels_numpy_buffer(combined, pixel_format)
+    return [packed[start:end] for start, end in pairwise(offsets)]
+
+
+def _pack_8bpp_numpy(arr: NumpyArray, out: NumpyArray | None = None) -> NumpyArray:
     """No packing needed for 8bpp."""
-    return arr.tobytes()
+    if out is None:
+        return arr.reshape(-1)
+    np.copyto(out, arr.reshape(-1))
+    return out
 
 
-def _pack_4bpp_numpy(arr: NumpyArray) -> bytes:
+def _pack_4bpp_numpy(arr: NumpyArray, out: NumpyArray | None = None) -> NumpyArray:
     """Pack 2 pixels per byte (4 bits each) using numpy.
 
     This is ~10-20x faster than the loop-based implementation for large images.
     """
-    # Reduce to 4-bit values (0-15 range)
-    arr_4bit = arr >> ProtocolConstants.PIXEL_SHIFT_4BPP
+    flat = np.ascontiguousarray(arr).reshape(-1)
 
     # Pad array to even length if needed
-    if len(arr_4bit) % 2 != 0:
-        arr_4bit = np.pad(arr_4bit, (0, 1), mode="constant", constant_values=0)
-
-    # Reshape to pairs of pixels
-    pairs = arr_4bit.reshape(-1, 2)
+    if flat.size % 2 != 0:
+        flat = np.concatenate((flat, np.zeros(1, dtype=np.uint8)))
 
-    # Pack pairs into bytes (first pixel in high nibble, second in low nibble)
-    packed = (pairs[:, 0] << ProtocolConstants.PIXEL_SHIFT_4BPP) | pairs[:, 1]
+    # View each pixel pair as one big-endian uint16 and gather its packed byte
+    # (every uint16 is a valid index, so "clip" skips bounds checks and lets
+    # numpy write straight into ``out`` without buffering)
+    return np.take(_PACK_4BPP_LUT, flat.view(">u2"), out=out, mode="clip")
 
-    return packed.astype(np.uint8).tobytes()
 
-
-def _pack_2bpp_numpy(arr: NumpyArray) -> bytes:
+def _pack_2bpp_numpy(arr: NumpyArray, out: NumpyArray | None = None) -> NumpyArray:
     """Pack 4 pixels per byte (2 bits each) using numpy.
 
     This is ~20-30x faster than the loop-based implementation for large images.
     """
-    # Reduce to 2-bit values (0-3 range)
-    arr_2bit = arr >> 6
+    flat = arr.reshape(-1)
 
     # Pad array to multiple of 4 if needed
-    pad_size = (4 - len(arr_2bit) % 4) % 4
+    pad_size = -flat.size % ProtocolConstants.PIXELS_PER_BYTE_2BPP
     if pad_size > 0:
-        arr_2bit = np.pad(arr_2bit, (0, pad_size), mode="constant", constant_values=0)
+        flat = np.concatenate((flat, np.zeros(pad_size, dtype=np.uint8)))
 
-    # Reshape to groups of 4 pixels
-    quads = arr_2bit.reshape(-1, 4)
+    # Reduce to 2-bit values (0-3 range), reading the 4 pixels of each byte
+    # through strided views instead of shifting and reshaping a full copy
+    p0, p1, p2, p3 = (flat[offset::4] >> 6 for offset in range(4))
 
     # Pack 4 pixels into bytes with proper bit positions
-    packed = (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
-
-    return packed.astype(np.uint8).tobytes()
+    packed = np.left_shift(p0, 6, out=out)
+    packed |= p1 << 4
+    packed |= p2 << 2
+    packed |= p3
+    return packed
 
 
-def _pack_1bpp_numpy(arr: NumpyArray) -> bytes:
+def _pack_1bpp_numpy(arr: NumpyArray, out: NumpyArray | None = None) -> NumpyArray:
     """Pack 8 pixels per byte (1 bit each) using numpy.
 
     This is ~30-50x faster than the loop-based implementation for large images.
     """
-    # Convert to binary (0 or 1) using threshold
-    binary = (arr >= ProtocolConstants.PIXEL_SHIFT_1BPP_THRESHOLD).astype(np.uint8)
-
-    # Pad array to multiple of 8 if needed
-    pad_size = (8 - len(binary) % 8) % 8
-    if pad_size > 0:
-        binary = np.pad(binary, (0, pad_size), mode="constant", constant_values=0)
-
-    # Reshape to groups of 8 pixels
-    octets = binary.reshape(-1, 8)
-
-    # Pack 8 pixels into bytes (MSB first)
-    # Use cached powers array to avoid allocation
-    packed = np.sum(octets * _POWERS_OF_2_CACHE, axis=1, dtype=np.uint8)
-
-    return packed.tobytes()
+    # Threshold to a boolean mask and let packbits gather 8 pixels per byte
+    # (MSB first, trailing bits zero-padded) in a single vectorized pass
+    binary = arr >= ProtocolConstants.PIXEL_SHIFT_1BPP_THRESHOLD
+
+    packed = np.packbits(binary)
+    if out is None:
+        return packed
+    # packbits has no out parameter, so copy into the caller's buffer
+    np.copyto(out, packed)
+    return out
+
+
+# Dictionary dispatch tables, built once rather than per call
+_NUMPY_PACKERS: dict[PixelFormat, Callable[[NumpyArray, NumpyArray | None], NumpyArray]] = {
+    PixelFormat.BPP_8: _pack_8bpp_numpy,
+    PixelFormat.BPP_4: _pack_4bpp_numpy,
+    PixelFormat.BPP_2: _pack_2bpp_numpy,
+    PixelFormat.BPP_1: _pack_1bpp_numpy,
+}
+_NUMBA_PACKERS = {
+    **_NUMPY_PACKERS,
+    PixelFormat.BPP_4: pack_4bpp_numba,
+    PixelFormat.BPP_2: pack_2bpp_numba,
+    PixelFormat.BPP_1: pack_1bpp_numba,
+}
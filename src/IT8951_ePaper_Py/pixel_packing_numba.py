@@ -0,0 +1,121 @@
+"""Numba-compiled pixel packing kernels for very large frames.
+
+These kernels read each input pixel once and write each packed byte once,
+parallelized across output bytes. Numba is an optional dependency; when it is
+not installed the kernels run as plain Python and ``NUMBA_AVAILABLE`` is False,
+so callers should only dispatch here when it is True.
+"""
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+try:
+    from numba import njit, prange  # pyright: ignore[reportMissingImports]
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(**_options: bool) -> Callable[[_F], _F]:
+        """Fallback decorator leaving kernels as plain Python functions."""
+        return lambda func: func
+
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _pack_4bpp_kernel(flat: "NDArray[np.uint8]", out: "NDArray[np.uint8]") -> None:
+    size = flat.size
+    for i in prange(out.size):
+        src = 2 * i
+        high = flat[src] & 0xF0
+        low = flat[src + 1] >> 4 if src + 1 < size else 0
+        out[i] = high | low
+
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _pack_2bpp_kernel(flat: "NDArray[np.uint8]", out: "NDArray[np.uint8]") -> None:
+    size = flat.size
+    for i in prange(out.size):
+        src = 4 * i
+        value = 0
+        for offset in range(4):
+            if src + offset < size:
+                value |= (flat[src + offset] >> 6) << (6 - 2 * offset)
+        out[i] = value
+
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _pack_1bpp_kernel(flat: "NDArray[np.uint8]", out: "NDArray[np.uint8]") -> None:
+    size = flat.size
+    for i in prange(out.size):
+        src = 8 * i
+        value = 0
+        for offset in range(8):
+            if src + offset < size and flat[src + offset] >= 128:
+                value |= 0x80 >> offset
+        out[i] = value
+
+
+def pack_4bpp_numba(
+    arr: "NDArray[np.uint8]", out: "NDArray[np.uint8] | None" = None
+) -> "NDArray[np.uint8]":
+    """Pack 2 pixels per byte (4 bits each) in a single fused pass.
+
+    Args:
+        arr: 8-bit pixel data.
+        out: Optional preallocated output array of the packed size.
+
+    Returns:
+        Packed pixel data as a uint8 array, zero-padded to a whole byte.
+    """
+    flat = np.ascontiguousarray(arr).reshape(-1)
+    if out is None:
+        out = np.empty((flat.size + 1) // 2, dtype=np.uint8)
+    _pack_4bpp_kernel(flat, out)
+    return out
+
+
+def pack_2bpp_numba(
+    arr: "NDArray[np.uint8]", out: "NDArray[np.uint8] | None" = None
+) -> "NDArray[np.uint8]":
+    """Pack 4 pixels per byte (2 bits each) in a single fused pass.
+
+    Args:
+        arr: 8-bit pixel data.
+        out: Optional preallocated output array of the packed size.
+
+    Returns:
+        Packed pixel data as a uint8 array, zero-padded to a whole byte.
+    """
+    flat = np.ascontiguousarray(arr).reshape(-1)
+    if out is None:
+        out = np.empty((flat.size + 3) // 4, dtype=np.uint8)
+    _pack_2bpp_kernel(flat, out)
+    return out
+
+
+def pack_1bpp_numba(
+    arr: "NDArray[np.uint8]", out: "NDArray[np.uint8] | None" = None
+) -> "NDArray[np.uint8]":
+    """Threshold and pack 8 pixels per byte (1 bit each) in a single fused pass.
+
+    Args:
+        arr: 8-bit pixel data.
+        out: Optional preallocated output array of the packed size.
+
+    Returns:
+        Packed pixel data as a uint8 array, first pixel in the MSB and
+        zero-padded to a whole byte.
+    """
+    flat = np.ascontiguousarray(arr).reshape(-1)
+    if out is None:
+        out = np.empty((flat.size + 7) // 8, dtype=np.uint8)
+    _pack_1bpp_kernel(flat, out)
+    return out
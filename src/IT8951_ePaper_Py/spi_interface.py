@@ -28,7 +28,9 @@ Examples:
 import sys
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Sequence
+from itertools import chain
 from typing import Protocol
 
 from IT8951_ePaper_Py.constants import GPIOPin, ProtocolConstants, SPIConstants, TimingConstants
@@ -610,7 +612,7 @@ class MockSPI(SPIInterface):
         self._busy = False
         self._last_command: int | None = None
         self._data_buffer: list[int] = []
-        self._read_data: list[int] = []
+        self._read_data: deque[int] = deque()
 
     def init(self) -> None:
         """Initialize mock SPI interface."""
@@ -673,7 +675,7 @@ class MockSPI(SPIInterface):
 
         self.wait_busy()
         if self._read_data:
-            return self._read_data.pop(0)
+            return self._read_data.popleft()
         return SPIConstants.MOCK_DEFAULT_VALUE
 
     def read_data_bulk(self, length: int) -> list[int]:
@@ -682,26 +684,34 @@ class MockSPI(SPIInterface):
             raise CommunicationError("Mock SPI not initialized")
 
         self.wait_busy()
-        # Use list comprehension for better performance
-        if self._read_data:
-            # Take from _read_data as long as available, then fill with default
-            available = min(length, len(self._read_data))
-            data = self._read_data[:available]
-            self._read_data = self._read_data[available:]
-            if available < length:
-                data.extend([SPIConstants.MOCK_DEFAULT_VALUE] * (length - available))
-        else:
-            # All default values
-            data = [SPIConstants.MOCK_DEFAULT_VALUE] * length
+        # Take from _read_data as long as available, then fill with default
+        available = min(length, len(self._read_data))
+        popleft = self._read_data.popleft
+        data = [popleft() for _ in range(available)]
+        if available < length:
+            data.extend([SPIConstants.MOCK_DEFAULT_VALUE] * (length - available))
         return data
 
-    def set_read_data(self, data: list[int]) -> None:
+    def reset_state(self) -> None:
+        """Discard queued read data and the write history (for testing).
+
+        Lets a single MockSPI instance be reused across tests without
+        re-running the initialization sequence.
+        """
+        self._busy = False
+        self._last_command = None
+        self._data_buffer.clear()
+        self._read_data.clear()
+
+    def set_read_data(self, *chunks: Sequence[int]) -> None:
         """Set data to be returned by read operations (for testing).
 
+        Several chunks can be queued in one call; they are read back in order.
+
         Args:
-            data: List of data words to queue for reading.
+            *chunks: Sequences of data words to queue for reading.
         """
-        self._read_data.extend(data)
+        self._read_data.extend(chain.from_iterable(chunks))
 
     def get_last_command(self) -> int | None:
         """Get the last command written (for testing).
@@ -719,6 +729,21 @@ class MockSPI(SPIInterface):
         """
         return self._data_buffer.copy()
 
+    def wrote(self, value: int, *values: int) -> bool:
+        """Check whether all given data words were written (for testing).
+
+        Unlike get_data_buffer(), this does not copy the write history. At
+        least one word is required so an empty check can't pass vacuously.
+
+        Args:
+            value: Data word expected in the write history.
+            *values: Further data words expected in the write history.
+
+        Returns:
+            bool: True if every value has been written at least once.
+        """
+        return not {value, *values}.difference(self._data_buffer)
+
 
 def create_spi_interface(spi_speed_hz: int | None = None) -> SPIInterface:
     """Create appropriate SPI interface based on platform.
@@ -47,6 +47,9 @@ R = TypeVar("R")
 def thread_safe_method(func: Callable[P, R]) -> Callable[P, R]:
     """Decorator to make a method thread-safe using the instance's lock.
 
+    The instance must define a ``_lock`` attribute (an ``RLock``) before any
+    wrapped method is called.
+
     Args:
         func: The method to wrap with thread safety.
 
@@ -56,13 +59,9 @@ def thread_safe_method(func: Callable[P, R]) -> Callable[P, R]:
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        # First argument should be self for instance methods
-        if args and hasattr(args[0], "_lock"):
-            self = args[0]
-            # _lock is dynamically added to instances that use this decorator
-            with self._lock:  # type: ignore[attr-defined] # Dynamic attribute on thread-safe classes
-                return func(*args, **kwargs)
-        return func(*args, **kwargs)
+        # First argument is self; _lock is set in __init__ of classes using this decorator
+        with args[0]._lock:  # type: ignore[attr-defined] # Dynamic attribute on thread-safe classes
+            return func(*args, **kwargs)
 
     return wrapper
 
@@ -252,43 +251,44 @@ class ThreadSafeEPaperDisplay(EPaperDisplay):
         with self._lock:
             super().__exit__(exc_type, exc_value, traceback)
 
-    # Thread-safe property access
+    # Thread-safe property access. These getters only read cached state, so they
+    # take the lock inline rather than paying for the decorator's extra call.
 
     @property
-    @thread_safe_method
     def power_state(self) -> PowerState:
         """Thread-safe power state property."""
-        return super().power_state
+        with self._lock:
+            return super().power_state
 
     @property
-    @thread_safe_method
     def width(self) -> int:
         """Thread-safe width property."""
-        return super().width
+        with self._lock:
+            return super().width
 
     @property
-    @thread_safe_method
     def height(self) -> int:
         """Thread-safe height property."""
-        return super().height
+        with self._lock:
+            return super().height
 
     @property
-    @thread_safe_method
     def size(self) -> tuple[int, int]:
         """Thread-safe size property."""
-        return super().size
+        with self._lock:
+            return super().size
 
     @property
-    @thread_safe_method
     def a2_refresh_count(self) -> int:
         """Thread-safe A2 refresh count property."""
-        return super().a2_refresh_count
+        with self._lock:
+            return super().a2_refresh_count
 
     @property
-    @thread_safe_method
     def a2_refresh_limit(self) -> int:
         """Thread-safe A2 refresh limit property."""
-        return super().a2_refresh_limit
+        with self._lock:
+            return super().a2_refresh_limit
 
     @thread_safe_method
     def is_enhanced_driving_enabled(self) -> bool:
@@ -14,30 +14,34 @@ T = TypeVar("T")
 
 def timed_operation(
     operation_name: str | None = None,
+    log: logging.Logger | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator to measure and log operation timing.
 
     Args:
         operation_name: Optional name for the operation. If not provided,
                        uses the function name.
+        log: Optional logger to report timings to. Defaults to this
+             module's logger.
 
     Returns:
         Decorated function that logs execution time.
     """
+    active_log = log or logger
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             name = operation_name or func.__name__
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                elapsed = (time.perf_counter() - start_time) * 1000  # Convert to ms
-                logger.debug(f"{name} completed in {elapsed:.2f}ms")
+                elapsed = (time.perf_counter_ns() - start_ns) / 1_000_000  # Convert to ms
+                active_log.debug("%s completed in %.2fms", name, elapsed)
                 return result
             except Exception:
-                elapsed = (time.perf_counter() - start_time) * 1000
-                logger.debug(f"{name} failed after {elapsed:.2f}ms")
+                elapsed = (time.perf_counter_ns() - start_ns) / 1_000_000
+                active_log.debug("%s failed after %.2fms", name, elapsed)
                 raise
 
         return wrapper
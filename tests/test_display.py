@@ -300,9 +300,9 @@ class TestEPaperDisplay:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
         )
-        mock_spi.set_read_data([0x0000])
 
         # Mock _wait_display_ready to avoid timeouts in tests
         mocker.patch.object(display._controller, "_wait_display_ready")  # type: ignore[union-attr]
@@ -326,9 +326,9 @@ class TestEPaperDisplay:
         # Mock initialization with regular display size
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
         )
-        mock_spi.set_read_data([0x0000])
 
         # Mock _wait_display_ready to avoid timeouts in tests
         mocker.patch.object(display._controller, "_wait_display_ready")  # type: ignore[union-attr]
@@ -763,10 +763,10 @@ class TestEPaperDisplay:
         # Mock initialization with maximum allowed display size
         mock_spi.set_read_data(
             [2048, 2048, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         mocker.patch.object(display._controller, "_wait_display_ready")
 
@@ -1008,9 +1008,9 @@ class TestA2ModeAutoClearing:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
         )
-        mock_spi.set_read_data([0x0000])
         mocker.patch.object(display, "clear")
 
         # Mock _wait_display_ready to avoid timeouts in tests
@@ -1087,9 +1087,9 @@ class TestA2ModeAutoClearing:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
         )
-        mock_spi.set_read_data([0x0000])
 
         # Mock _wait_display_ready to avoid timeouts in tests
         mocker.patch.object(display._controller, "_wait_display_ready")
@@ -1115,9 +1115,9 @@ class TestA2ModeAutoClearing:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
         )
-        mock_spi.set_read_data([0x0000])
         mock_clear = mocker.patch.object(display, "clear")
 
         # Mock _wait_display_ready to avoid timeouts in tests
@@ -1145,10 +1145,10 @@ class TestA2ModeAutoClearing:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         # Mock _wait_display_ready and controller methods
         mocker.patch.object(display._controller, "_wait_display_ready")
@@ -1208,10 +1208,10 @@ class TestPowerManagement:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         mocker.patch.object(display, "clear")
         display.init()
@@ -1303,10 +1303,10 @@ class TestPowerManagement:
         # Set up read data for init
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         # Mock wait_display_ready to avoid timeout
         mocker.patch("IT8951_ePaper_Py.it8951.IT8951._wait_display_ready")
@@ -1331,10 +1331,10 @@ class TestPowerManagement:
         # Set up read data for init
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         # Mock wait_display_ready to avoid timeout
         mocker.patch("IT8951_ePaper_Py.it8951.IT8951._wait_display_ready")
@@ -1390,10 +1390,10 @@ class TestMemoryAndEstimation:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         mocker.patch.object(display, "clear")
         display.init()
@@ -1419,10 +1419,10 @@ class TestMemoryAndEstimation:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         mocker.patch.object(display, "clear")
         display.init()
@@ -1449,10 +1449,10 @@ class TestMemoryAndEstimation:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         mocker.patch.object(display, "clear")
         display.init()
@@ -1496,10 +1496,10 @@ class TestCloseEdgeCases:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         mocker.patch.object(display, "clear")
         display.init()
@@ -50,10 +50,10 @@ class TestPowerManagementWithDisplayModes:
         # Mock initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],  # REG_0204
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])  # REG_0204
-        mock_spi.set_read_data([2000])  # VCOM
 
         # Mock wait_display_ready to avoid timeout
         mocker.patch.object(display._controller, "_wait_display_ready")
@@ -174,10 +174,10 @@ class TestProgressiveLoadingWithBitDepth:
         # Mock large display
         mock_spi.set_read_data(
             [2048, 1536, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])
 
         mocker.patch.object(display, "clear")
         mocker.patch.object(display._controller, "_wait_display_ready")
@@ -301,10 +301,10 @@ class TestErrorRecoveryWithRetryPolicies:
         # Mock initialization
         base_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],
         )
-        base_spi.set_read_data([0x0000])
-        base_spi.set_read_data([2000])
 
         # Mock wait_display_ready and clear to avoid timeout
         mocker.patch.object(display._controller, "_wait_display_ready")
@@ -321,10 +321,10 @@ class TestErrorRecoveryWithRetryPolicies:
         # Mock partial initialization
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],  # VCOM
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])  # VCOM
 
         display = EPaperDisplay(vcom=-2.0, spi_interface=mock_spi)
 
@@ -358,10 +358,10 @@ class TestErrorRecoveryWithRetryPolicies:
         # Initialize
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])
         mocker.patch.object(display._controller, "_wait_display_ready")
         display.init()
 
@@ -406,10 +406,10 @@ class TestThreadSafetyWithConcurrentOperations:
         # Initialize
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])
         mocker.patch.object(display, "clear")
         mocker.patch.object(display._controller, "_wait_display_ready")
         display.init()
@@ -466,10 +466,10 @@ class TestThreadSafetyWithConcurrentOperations:
         # Initialize
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])
         mocker.patch.object(display, "clear")
         mocker.patch.object(display._controller, "_wait_display_ready")
         display.init()
@@ -530,10 +530,10 @@ class TestMemoryManagementWithLargeImages:
         # Initialize with large display
         mock_spi.set_read_data(
             [2048, 2048, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])
         mocker.patch.object(display, "clear")
         display.init()
 
@@ -557,10 +557,10 @@ class TestMemoryManagementWithLargeImages:
         # Initialize
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])
         mocker.patch.object(display, "clear")
         display.init()
 
@@ -634,10 +634,10 @@ class TestComplexWorkflows:
         # Mock initialization
         base_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2060],  # VCOM matches
         )
-        base_spi.set_read_data([0x0000])
-        base_spi.set_read_data([2060])  # VCOM matches
 
         # Track enhanced driving
         write_commands = []
@@ -715,10 +715,10 @@ class TestComplexWorkflows:
         # First setup successful init
         mock_spi.set_read_data(
             [1024, 768, MemoryConstants.IMAGE_BUFFER_ADDR_L, MemoryConstants.IMAGE_BUFFER_ADDR_H]
-            + [0] * 16
+            + [0] * 16,
+            [0x0000],
+            [2000],
         )
-        mock_spi.set_read_data([0x0000])
-        mock_spi.set_read_data([2000])
 
         # Mock wait_display_ready to avoid timeout
         mocker.patch.object(display._controller, "_wait_display_ready")
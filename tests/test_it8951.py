@@ -1,5 +1,8 @@
 """Tests for IT8951 core driver."""
 
+import itertools
+from unittest.mock import Mock
+
 import pytest
 
 from IT8951_ePaper_Py.constants import (
@@ -28,20 +31,74 @@ from IT8951_ePaper_Py.models import (
 )
 from IT8951_ePaper_Py.spi_interface import MockSPI
 
+# Device info payload for a 1024x768 panel, as read during init()
+INIT_READ_DATA = (1024, 768, 0, 0) + (0,) * 16
+
+# Models reused unchanged by several tests; built once to skip repeated validation
+AREA_100X100 = DisplayArea(x=0, y=0, width=100, height=100)
+LOAD_INFO_8BPP = LoadImageInfo(
+    source_buffer=b"\x00\x01\x02\x03",
+    target_memory_addr=MemoryConstants.IMAGE_BUFFER_ADDR,
+    pixel_format=PixelFormat.BPP_8,
+)
+
+
+def assert_wrote(mock_spi: MockSPI, command: int, word: int, *words: int) -> None:
+    """Assert the last command sent and that every data word was written."""
+    assert mock_spi.get_last_command() == command
+    assert mock_spi.wrote(word, *words)
+
+
+@pytest.fixture(scope="class")
+def shared_spi() -> MockSPI:
+    """Create one mock SPI interface shared by every test in a class."""
+    return MockSPI()
+
 
+@pytest.fixture(scope="class")
+def shared_driver(shared_spi: MockSPI) -> IT8951:
+    """Create one initialized IT8951 driver shared by every test in a class."""
+    driver = IT8951(shared_spi)
+    shared_spi.set_read_data(INIT_READ_DATA)
+    driver.init()
+    return driver
+
+
+# Keep the class on one xdist worker so its shared fixtures are built only once
+@pytest.mark.xdist_group(name="it8951")
 class TestIT8951:
     """Test IT8951 driver."""
 
     @pytest.fixture
-    def mock_spi(self) -> MockSPI:
-        """Create mock SPI interface."""
-        return MockSPI()
+    def mock_spi(self, shared_spi: MockSPI) -> MockSPI:
+        """Provide the shared mock SPI, initialized and with no queued or written data."""
+        shared_spi.init()
+        shared_spi.reset_state()
+        return shared_spi
 
     @pytest.fixture
     def driver(self, mock_spi: MockSPI) -> IT8951:
-        """Create IT8951 driver with mock SPI."""
+        """Create a fresh, uninitialized IT8951 driver with mock SPI."""
         return IT8951(mock_spi)
 
+    @pytest.fixture
+    def initialized_driver(self, shared_driver: IT8951, mock_spi: MockSPI) -> IT8951:
+        """Provide the shared, initialized IT8951 driver.
+
+        Tests using it must not change the driver's state; tests that close it,
+        change its power state or drop its device info use mutable_driver.
+        """
+        mock_spi.reset_state()
+        return shared_driver
+
+    @pytest.fixture
+    def mutable_driver(self, driver: IT8951, mock_spi: MockSPI) -> IT8951:
+        """Provide a freshly initialized IT8951 driver that a test may change."""
+        mock_spi.set_read_data(INIT_READ_DATA)
+        driver.init()
+        mock_spi.reset_state()
+        return driver
+
     def test_init(self, driver: IT8951, mock_spi: MockSPI) -> None:
         """Test driver initialization."""
         mock_spi.set_read_data(
@@ -68,7 +125,6 @@ class TestIT8951:
                 0,  # lut_version "2.0"
             ]
         )
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
 
         info = driver.init()
 
@@ -83,9 +139,11 @@ class TestIT8951:
         info2 = driver.init()
         assert info2 == info
 
-    def test_init_failure(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_init_failure(
+        self, driver: IT8951, mock_spi: MockSPI, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test initialization failure handling."""
-        mock_spi.init = lambda: (_ for _ in ()).throw(Exception("SPI failed"))
+        monkeypatch.setattr(mock_spi, "init", Mock(side_effect=Exception("SPI failed")))
 
         with pytest.raises(InitializationError) as exc_info:
             driver.init()
@@ -119,7 +177,6 @@ class TestIT8951:
                 0,  # lut_version "2.0"
             ]
         )
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
 
         info1 = driver.init()
 
@@ -136,103 +193,66 @@ class TestIT8951:
         assert info2 == info1
         assert last_command_after_second == last_command_after_first
 
-    def test_close(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_close(self, mutable_driver: IT8951) -> None:
         """Test driver close."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-        driver.close()
+        mutable_driver.close()
 
-        assert not driver._initialized  # type: ignore[reportPrivateUsage]
-        assert driver._device_info is None  # type: ignore[reportPrivateUsage]
+        assert not mutable_driver._initialized  # type: ignore[reportPrivateUsage]
+        assert mutable_driver._device_info is None  # type: ignore[reportPrivateUsage]
 
-    def test_operations_without_init(self, driver: IT8951) -> None:
+    @pytest.mark.parametrize("method", ["standby", "sleep", "get_vcom"])
+    def test_operations_without_init(self, driver: IT8951, method: str) -> None:
         """Test operations fail without initialization."""
         with pytest.raises(InitializationError):
-            driver.standby()
-
-        with pytest.raises(InitializationError):
-            driver.sleep()
+            getattr(driver, method)()
 
-        with pytest.raises(InitializationError):
-            driver.get_vcom()
-
-    def test_standby(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_standby(self, mutable_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test standby mode."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-        driver.standby()
+        mutable_driver.standby()
 
         assert mock_spi.get_last_command() == SystemCommand.STANDBY
 
-    def test_sleep(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_sleep(self, mutable_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test sleep mode."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-        driver.sleep()
+        mutable_driver.sleep()
 
         assert mock_spi.get_last_command() == SystemCommand.SLEEP
 
-    def test_wake(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_wake(self, mutable_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test wake from sleep/standby mode."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Put device to sleep first
-        driver.sleep()
-        assert driver.power_state == PowerState.SLEEP
+        mutable_driver.sleep()
+        assert mutable_driver.power_state == PowerState.SLEEP
 
         # Wake it up
-        driver.wake()
-        assert driver.power_state == PowerState.ACTIVE
+        mutable_driver.wake()
+        assert mutable_driver.power_state == PowerState.ACTIVE
         assert mock_spi.get_last_command() == SystemCommand.SYS_RUN
 
-    def test_vcom_operations(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_vcom_operations(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test VCOM voltage operations."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         mock_spi.set_read_data([2500])
-        voltage = driver.get_vcom()
+        voltage = initialized_driver.get_vcom()
         assert voltage == -2.5
 
-        driver.set_vcom(-3.0)
-        buffer = mock_spi.get_data_buffer()
-        assert 3000 in buffer
+        initialized_driver.set_vcom(-3.0)
+        assert mock_spi.wrote(3000)
 
         from IT8951_ePaper_Py.exceptions import VCOMError
 
         with pytest.raises(VCOMError):
-            driver.set_vcom(-6.0)
+            initialized_driver.set_vcom(-6.0)
 
-    def test_load_image(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_load_image(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test image loading operations."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
-        info = LoadImageInfo(
-            source_buffer=b"\x00\x01\x02\x03",
-            target_memory_addr=MemoryConstants.IMAGE_BUFFER_ADDR,
-            pixel_format=PixelFormat.BPP_8,
-        )
-
-        driver.load_image_start(info)
-        driver.load_image_write(info.source_buffer)
-        driver.load_image_end()
+        initialized_driver.load_image_start(LOAD_INFO_8BPP)
+        initialized_driver.load_image_write(LOAD_INFO_8BPP.source_buffer)
+        initialized_driver.load_image_end()
 
         assert mock_spi.get_last_command() == SystemCommand.LD_IMG_END
 
-    def test_display_area(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_display_area(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test display area operation."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         area = DisplayArea(
             x=0,
             y=0,
@@ -242,70 +262,58 @@ class TestIT8951:
         )
 
         mock_spi.set_read_data([0])
-        driver.display_area(area, wait=True)
-
-        assert mock_spi.get_last_command() == SystemCommand.REG_RD
-        buffer = mock_spi.get_data_buffer()
-        assert 800 in buffer
-        assert 600 in buffer
-
-    def test_display_area_validation(self, driver: IT8951, mock_spi: MockSPI) -> None:
-        """Test display area validation."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
-        area = DisplayArea(
-            x=800,
-            y=0,
-            width=800,
-            height=600,
-        )
+        initialized_driver.display_area(area, wait=True)
+
+        assert_wrote(mock_spi, SystemCommand.REG_RD, 800, 600)
+
+    @pytest.mark.parametrize(
+        ("x", "y", "width", "height", "expected_msg"),
+        [
+            (800, 0, 800, 600, "exceeds panel width"),  # 800 + 800 = 1600 > 1024
+            (0, 500, 100, 300, "exceeds panel height"),  # 500 + 300 = 800 > 768
+        ],
+    )
+    def test_display_area_validation(
+        self,
+        initialized_driver: IT8951,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        expected_msg: str,
+    ) -> None:
+        """Test display area validation against panel bounds."""
+        area = DisplayArea(x=x, y=y, width=width, height=height)
 
         with pytest.raises(InvalidParameterError) as exc_info:
-            driver.display_area(area)
+            initialized_driver.display_area(area)
 
-        assert "exceeds panel width" in str(exc_info.value)
+        assert expected_msg in str(exc_info.value)
 
     def test_device_info_property(self, driver: IT8951, mock_spi: MockSPI) -> None:
         """Test device info property."""
         with pytest.raises(InitializationError):
             _ = driver.device_info
 
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
+        mock_spi.set_read_data(INIT_READ_DATA)
         driver.init()
 
         info = driver.device_info
         assert isinstance(info, DeviceInfo)
         assert info.panel_width == 1024
 
-    def test_device_info_property_none(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_device_info_property_none(self, mutable_driver: IT8951) -> None:
         """Test device info property when info is None."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Force device_info to None
-        driver._device_info = None  # type: ignore[reportPrivateUsage]
+        mutable_driver._device_info = None  # type: ignore[reportPrivateUsage]
 
         with pytest.raises(InitializationError) as exc_info:
-            _ = driver.device_info
+            _ = mutable_driver.device_info
 
         assert "Device info not available" in str(exc_info.value)
 
-    def test_load_image_area_start(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_load_image_area_start(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test loading image area."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
-        info = LoadImageInfo(
-            source_buffer=b"test",
-            target_memory_addr=MemoryConstants.IMAGE_BUFFER_ADDR,
-            pixel_format=PixelFormat.BPP_8,
-        )
-
         area = AreaImageInfo(
             area_x=100,
             area_y=200,
@@ -313,23 +321,20 @@ class TestIT8951:
             area_h=400,
         )
 
-        driver.load_image_area_start(info, area)
+        initialized_driver.load_image_area_start(LOAD_INFO_8BPP, area)
 
-        # Verify the command was sent
-        assert mock_spi.get_last_command() == SystemCommand.LD_IMG_AREA
-        buffer = mock_spi.get_data_buffer()
-        # Check that area coordinates were sent
-        assert 100 in buffer  # x
-        assert 200 in buffer  # y
-        assert 300 in buffer  # width
-        assert 400 in buffer  # height
+        # Verify the command and area coordinates were sent
+        assert_wrote(
+            mock_spi,
+            SystemCommand.LD_IMG_AREA,
+            100,  # x
+            200,  # y
+            300,  # width
+            400,  # height
+        )
 
-    def test_display_buffer_area(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_display_buffer_area(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test display buffer area operation."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         area = DisplayArea(
             x=52,  # Must be aligned to 4 pixels
             y=100,
@@ -341,199 +346,149 @@ class TestIT8951:
         # Mock reading MISC register for wait_display_ready
         mock_spi.set_read_data([0])  # LUT state = 0 (ready)
 
-        driver.display_buffer_area(area, address=0x00123456, wait=True)
+        initialized_driver.display_buffer_area(area, address=0x00123456, wait=True)
 
         # Verify command and data
-        buffer = mock_spi.get_data_buffer()
-        assert 52 in buffer  # x (aligned to 4)
-        assert 100 in buffer  # y
-        assert 500 in buffer  # width
-        assert 400 in buffer  # height
-        assert 0x3456 in buffer  # address low
-        assert 0x0012 in buffer  # address high
-
-    def test_display_buffer_area_no_wait(self, driver: IT8951, mock_spi: MockSPI) -> None:
-        """Test display buffer area without waiting."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
-        area = DisplayArea(
-            x=0,
-            y=0,
-            width=100,
-            height=100,
+        assert mock_spi.wrote(
+            52,  # x (aligned to 4)
+            100,  # y
+            500,  # width
+            400,  # height
+            0x3456,  # address low
+            0x0012,  # address high
         )
 
-        driver.display_buffer_area(area, address=0, wait=False)
+    def test_display_buffer_area_no_wait(
+        self, initialized_driver: IT8951, mock_spi: MockSPI
+    ) -> None:
+        """Test display buffer area without waiting."""
+        initialized_driver.display_buffer_area(AREA_100X100, address=0, wait=False)
 
         # Should send command but not wait
         # The last command should be DPY_BUF_AREA
         assert mock_spi.get_last_command() == UserCommand.DPY_BUF_AREA
 
-    def test_validate_display_area_no_device_info(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_validate_display_area_no_device_info(
+        self, mutable_driver: IT8951, mock_spi: MockSPI
+    ) -> None:
         """Test display area validation without device info."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Force device_info to None
-        driver._device_info = None  # type: ignore[reportPrivateUsage]
-
-        area = DisplayArea(x=0, y=0, width=100, height=100)
+        mutable_driver._device_info = None  # type: ignore[reportPrivateUsage]
 
         with pytest.raises(DeviceError) as exc_info:
-            driver._validate_display_area(area)  # type: ignore[reportPrivateUsage]
+            mutable_driver._validate_display_area(AREA_100X100)  # type: ignore[reportPrivateUsage]
 
         assert "Device info not available" in str(exc_info.value)
 
-    def test_validate_display_area_exceeds_height(self, driver: IT8951, mock_spi: MockSPI) -> None:
-        """Test display area validation exceeding panel height."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
-        area = DisplayArea(
-            x=0,
-            y=500,
-            width=100,
-            height=300,  # 500 + 300 = 800 > 768
-        )
-
-        with pytest.raises(InvalidParameterError) as exc_info:
-            driver.display_area(area)
-
-        assert "exceeds panel height" in str(exc_info.value)
-
-    def test_wait_display_ready_timeout(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_wait_display_ready_timeout(
+        self, initialized_driver: IT8951, mock_spi: MockSPI, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test display ready timeout."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
-        # Mock MISC register to always return busy (bit 7 = 1)
-        mock_spi.set_read_data([0x80] * 10)  # LUT state = 1 (busy)
+        # Fake clock advancing 50ms per reading, and no real sleeping between polls
+        monkeypatch.setattr(
+            "IT8951_ePaper_Py.it8951.time.time", Mock(side_effect=itertools.count(0, 0.05))
+        )
+        monkeypatch.setattr("IT8951_ePaper_Py.it8951.time.sleep", lambda _: None)
+        # Mock MISC register to return busy (bit 7 = 1) for every poll before the deadline
+        mock_spi.set_read_data([0x80] * 4)  # LUT state = 1 (busy)
 
         with pytest.raises(IT8951TimeoutError) as exc_info:
-            driver._wait_display_ready(timeout_ms=100)  # type: ignore[reportPrivateUsage]
+            initialized_driver._wait_display_ready(timeout_ms=100)  # type: ignore[reportPrivateUsage]
 
         assert "Display operation timed out after 100ms" in str(exc_info.value)
 
-    def test_wait_display_ready_becomes_ready(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_wait_display_ready_becomes_ready(
+        self, initialized_driver: IT8951, mock_spi: MockSPI
+    ) -> None:
         """Test wait_display_ready when display becomes ready."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Mock MISC register to return busy then ready
         mock_spi.set_read_data([0x80, 0x00])  # First read: busy, second read: ready
 
         # Should not raise timeout
-        driver._wait_display_ready(timeout_ms=1000)  # type: ignore[reportPrivateUsage]
+        initialized_driver._wait_display_ready(timeout_ms=1000)  # type: ignore[reportPrivateUsage]
 
         # Verify it completed without timeout (success is that no exception was raised)
 
-    def test_set_target_memory_addr(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_set_target_memory_addr(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test setting target memory address."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
-        driver.set_target_memory_addr(0x12345678)
+        initialized_driver.set_target_memory_addr(0x12345678)
 
-        buffer = mock_spi.get_data_buffer()
         # Should write low 16 bits to LISAR
-        assert Register.LISAR in buffer
-        assert 0x5678 in buffer
-        # Should write high 16 bits to LISAR + 2
-        assert Register.LISAR + 2 in buffer
-        assert 0x1234 in buffer
+        assert mock_spi.wrote(
+            Register.LISAR,
+            0x5678,
+            # Should write high 16 bits to LISAR + 2
+            Register.LISAR + 2,
+            0x1234,
+        )
 
-    def test_set_target_memory_addr_invalid(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_set_target_memory_addr_invalid(
+        self, initialized_driver: IT8951, mock_spi: MockSPI
+    ) -> None:
         """Test setting invalid memory address."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Test negative address
         with pytest.raises(IT8951MemoryError) as exc_info:
-            driver.set_target_memory_addr(-1)
+            initialized_driver.set_target_memory_addr(-1)
         assert "Invalid memory address" in str(exc_info.value)
 
         # Test address > 32-bit
         with pytest.raises(IT8951MemoryError) as exc_info:
-            driver.set_target_memory_addr(0x100000000)
+            initialized_driver.set_target_memory_addr(0x100000000)
         assert "Invalid memory address" in str(exc_info.value)
 
-    def test_default_spi_interface(self) -> None:
+    def test_default_spi_interface(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test driver creation with default SPI interface."""
+        # Stub the platform factory so no hardware SPI is ever probed
+        default_spi = MockSPI()
+        monkeypatch.setattr(
+            "IT8951_ePaper_Py.it8951.create_spi_interface", Mock(return_value=default_spi)
+        )
+
         driver = IT8951()
-        assert driver._spi is not None  # type: ignore[reportPrivateUsage]
+        assert driver._spi is default_spi  # type: ignore[reportPrivateUsage]
 
-    def test_load_image_write_odd_bytes(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_load_image_write_odd_bytes(
+        self, initialized_driver: IT8951, mock_spi: MockSPI
+    ) -> None:
         """Test loading image with odd number of bytes."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Test with odd number of bytes
         data = b"\x01\x02\x03"
-        driver.load_image_write(data)
+        initialized_driver.load_image_write(data)
 
         # Should pad the last byte
-        buffer = mock_spi.get_data_buffer()
         # First word: 0x01 << 8 | 0x02 = 0x0102
-        assert 0x0102 in buffer
-        # Second word: 0x03 << 8 | 0x00 = 0x0300 (padded)
-        assert 0x0300 in buffer
+        assert mock_spi.wrote(
+            0x0102,
+            # Second word: 0x03 << 8 | 0x00 = 0x0300 (padded)
+            0x0300,
+        )
 
-    def test_read_register(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_read_register(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test reading a register value."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Set up the expected register value
         expected_value = 0x1234
         mock_spi.set_read_data([expected_value])
 
         # Read the register
-        value = driver._read_register(Register.MISC)
-
-        # Verify the correct command was sent
-        assert mock_spi.get_last_command() == SystemCommand.REG_RD
+        value = initialized_driver._read_register(Register.MISC)
 
-        # Verify the register address was sent
-        buffer = mock_spi.get_data_buffer()
-        assert Register.MISC in buffer
+        # Verify the correct command and register address were sent
+        assert_wrote(mock_spi, SystemCommand.REG_RD, Register.MISC)
 
         # Verify the returned value
         assert value == expected_value
 
-    def test_write_register(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_write_register(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test writing a register value."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Write to register
         test_value = 0x5678
-        driver._write_register(Register.REG_0204, test_value)
-
-        # Verify the correct command was sent
-        assert mock_spi.get_last_command() == SystemCommand.REG_WR
+        initialized_driver._write_register(Register.REG_0204, test_value)
 
-        # Verify both register address and value were sent
-        buffer = mock_spi.get_data_buffer()
-        assert Register.REG_0204 in buffer
-        assert test_value in buffer
+        # Verify the correct command, register address and value were sent
+        assert_wrote(mock_spi, SystemCommand.REG_WR, Register.REG_0204, test_value)
 
-    def test_dump_registers(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_dump_registers(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test register dump functionality."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Set up expected register values
         mock_spi.set_read_data(
             [
@@ -546,7 +501,7 @@ class TestIT8951:
         )
 
         # Dump registers
-        dump = driver.dump_registers()
+        dump = initialized_driver.dump_registers()
 
         # Verify all expected registers were read
         assert "LISAR" in dump
@@ -561,98 +516,81 @@ class TestIT8951:
         assert dump["MCSR"] == 0x1111
 
         # Verify read commands were sent
-        buffer = mock_spi.get_data_buffer()
-        assert Register.LISAR in buffer
-        assert Register.REG_0204 in buffer
-        assert Register.MISC in buffer
-        assert Register.PWR in buffer
-        assert Register.MCSR in buffer
-
-    def test_check_lut_busy(self, driver: IT8951, mock_spi: MockSPI) -> None:
-        """Test LUT busy check."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
+        assert mock_spi.wrote(
+            Register.LISAR, Register.REG_0204, Register.MISC, Register.PWR, Register.MCSR
+        )
 
+    def test_check_lut_busy(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
+        """Test LUT busy check."""
         # Test LUT busy (bit 7 set)
         mock_spi.set_read_data([0x80])
-        assert driver.check_lut_busy() is True
+        assert initialized_driver.check_lut_busy() is True
 
         # Test LUT not busy (bit 7 clear)
         mock_spi.set_read_data([0x00])
-        assert driver.check_lut_busy() is False
+        assert initialized_driver.check_lut_busy() is False
 
         # Test with other bits set but not bit 7
         mock_spi.set_read_data([0x7F])
-        assert driver.check_lut_busy() is False
+        assert initialized_driver.check_lut_busy() is False
 
-    def test_verify_packed_write_enabled(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_verify_packed_write_enabled(
+        self, initialized_driver: IT8951, mock_spi: MockSPI
+    ) -> None:
         """Test packed write verification."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Test packed write enabled
         mock_spi.set_read_data([ProtocolConstants.PACKED_WRITE_BIT])
-        assert driver.verify_packed_write_enabled() is True
+        assert initialized_driver.verify_packed_write_enabled() is True
 
         # Test packed write disabled
         mock_spi.set_read_data([0x0000])
-        assert driver.verify_packed_write_enabled() is False
+        assert initialized_driver.verify_packed_write_enabled() is False
 
         # Test with other bits set
         mock_spi.set_read_data([0xFFFF])
-        assert driver.verify_packed_write_enabled() is True
+        assert initialized_driver.verify_packed_write_enabled() is True
 
-    def test_get_memory_address(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_get_memory_address(self, initialized_driver: IT8951, mock_spi: MockSPI) -> None:
         """Test reading current memory address."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Test reading a 32-bit address
-        mock_spi.set_read_data([0x5678])  # Low 16 bits
-        mock_spi.set_read_data([0x1234])  # High 16 bits
+        mock_spi.set_read_data(
+            [0x5678],  # Low 16 bits
+            [0x1234],  # High 16 bits
+        )
 
-        address = driver.get_memory_address()
+        address = initialized_driver.get_memory_address()
         assert address == 0x12345678
 
         # Verify correct registers were read
-        buffer = mock_spi.get_data_buffer()
-        assert Register.LISAR in buffer
-        assert Register.LISAR + 2 in buffer
+        assert mock_spi.wrote(Register.LISAR, Register.LISAR + 2)
 
-    def test_enhance_driving_capability(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_enhance_driving_capability(
+        self, initialized_driver: IT8951, mock_spi: MockSPI
+    ) -> None:
         """Test enhanced driving capability."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Enable enhanced driving
-        driver.enhance_driving_capability()
-
-        # Verify the correct command was sent
-        assert mock_spi.get_last_command() == SystemCommand.REG_WR
-
-        # Verify register and value were sent
-        buffer = mock_spi.get_data_buffer()
-        assert Register.ENHANCE_DRIVING in buffer
-        assert ProtocolConstants.ENHANCED_DRIVING_VALUE in buffer
+        initialized_driver.enhance_driving_capability()
+
+        # Verify the correct command, register and value were sent
+        assert_wrote(
+            mock_spi,
+            SystemCommand.REG_WR,
+            Register.ENHANCE_DRIVING,
+            ProtocolConstants.ENHANCED_DRIVING_VALUE,
+        )
 
-    def test_is_enhanced_driving_enabled(self, driver: IT8951, mock_spi: MockSPI) -> None:
+    def test_is_enhanced_driving_enabled(
+        self, initialized_driver: IT8951, mock_spi: MockSPI
+    ) -> None:
         """Test checking enhanced driving status."""
-        mock_spi.set_read_data([1024, 768, 0, 0] + [0] * 16)
-        mock_spi.set_read_data([0x0000])  # REG_0204 read
-        driver.init()
-
         # Test when enhanced driving is disabled (default)
         mock_spi.set_read_data([0x0000])
-        assert driver.is_enhanced_driving_enabled() is False
+        assert initialized_driver.is_enhanced_driving_enabled() is False
 
         # Test when enhanced driving is enabled
         mock_spi.set_read_data([ProtocolConstants.ENHANCED_DRIVING_VALUE])
-        assert driver.is_enhanced_driving_enabled() is True
+        assert initialized_driver.is_enhanced_driving_enabled() is True
 
         # Test with different value
         mock_spi.set_read_data([0x1234])
-        assert driver.is_enhanced_driving_enabled() is False
+        assert initialized_driver.is_enhanced_driving_enabled() is False
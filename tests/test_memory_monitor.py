@@ -1,10 +1,21 @@
 """Tests for memory monitoring utilities."""
 
+import mmap
+import os
+import re
 import tracemalloc
-from unittest.mock import MagicMock, patch
-
+from collections.abc import Generator
+from contextlib import suppress
+from dataclasses import asdict
+from pathlib import Path
+from typing import NamedTuple
+from unittest.mock import patch
+
+import numpy as np
+import psutil
 import pytest
 
+from IT8951_ePaper_Py import memory_monitor
 from IT8951_ePaper_Py.memory_monitor import (
     MemoryMonitor,
     MemorySnapshot,
@@ -13,351 +24,450 @@ from IT8951_ePaper_Py.memory_monitor import (
     monitor_memory,
 )
 
+MB = 1024 * 1024
+
+# Only len(gc.get_objects()) is used, so ranges stand in for object lists in O(1) memory
+FAKE_OBJECTS_100 = range(100)
+FAKE_OBJECTS_200 = range(200)
+FAKE_OBJECTS_500 = range(500)
+FAKE_OBJECTS_1000 = range(1000)
+
+# Expected (input_size_mb, packed_size_mb) per pixel format for an 800x600 estimate
+ESTIMATE_WIDTH, ESTIMATE_HEIGHT = 800, 600
+ESTIMATE_EXPECTED_MB = {
+    pixel_format: (
+        ESTIMATE_WIDTH * ESTIMATE_HEIGHT / MB,
+        ESTIMATE_WIDTH * ESTIMATE_HEIGHT * bytes_per_pixel / MB,
+    )
+    for pixel_format, bytes_per_pixel in (
+        (0, 0.125),  # 1bpp
+        (1, 0.25),  # 2bpp
+        (2, 0.5),  # 4bpp
+        (3, 1.0),  # 8bpp
+    )
+}
+
+# MemorySnapshot is a plain dataclass, so one instance serves every read-only test
+SAMPLE_SNAPSHOT = MemorySnapshot(
+    rss_mb=100.5,
+    vms_mb=200.3,
+    current_mb=50.2,
+    peak_mb=75.8,
+    total_objects=1234,
+)
+
+# Printed summaries are checked in a single ordered scan of the captured output
+SUMMARY_CHANGES_RX = re.compile(
+    r"Memory Changes:.*?RSS: \+50\.0MB.*?Python: \+30\.0MB.*?Objects: \+100", re.S
+)
+CONTEXT_SUMMARY_RX = re.compile(
+    r"Memory Usage Summary:.*?Test Operation - Start.*?Test Operation - End", re.S
+)
+
+
+class FakeMemInfo(NamedTuple):
+    """Subset of psutil's memory_info() result used by the monitor."""
+
+    rss: int
+    vms: int
+
+
+class FakeVirtualMemory(NamedTuple):
+    """Subset of psutil's virtual_memory() result used by get_memory_stats."""
+
+    total: int
+    available: int
+    percent: float
+
+
+# Shared default figures returned by FakeProcess.memory_info()
+DEFAULT_MEM_INFO = FakeMemInfo(rss=100 * MB, vms=200 * MB)
+
+
+class FakeProcess:
+    """Lightweight stand-in for psutil.Process with settable memory figures."""
+
+    __slots__ = ("mem_info",)
+
+    def __init__(self) -> None:
+        """Initialize with the default memory figures."""
+        self.mem_info = DEFAULT_MEM_INFO
+
+    def reset(self) -> None:
+        """Restore the default 100 MB RSS / 200 MB VMS figures."""
+        self.mem_info = DEFAULT_MEM_INFO
+
+    def memory_info(self) -> FakeMemInfo:
+        return self.mem_info
+
+    def memory_percent(self) -> float:
+        return 5.5
+
+
+@pytest.fixture(scope="module")
+def patched_process() -> Generator[FakeProcess, None, None]:
+    """Patch psutil.Process once for the whole module with a shared FakeProcess."""
+    process = FakeProcess()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(psutil, "Process", lambda: process)
+        mp.setattr(memory_monitor, "_USE_STATM", False)
+        yield process
+
+
+@pytest.fixture
+def fake_process(patched_process: FakeProcess) -> FakeProcess:
+    """Provide the module's FakeProcess reset to its default memory figures."""
+    patched_process.reset()
+    return patched_process
+
+
+class FakeTraceback(NamedTuple):
+    """Stand-in for tracemalloc.Traceback with preset formatted lines."""
+
+    lines: list[str]
+
+    def format(self) -> list[str]:
+        return self.lines
+
+
+class FakeStatistic(NamedTuple):
+    """Stand-in for tracemalloc.Statistic."""
+
+    size: int
+    traceback: FakeTraceback
+
+
+# Deterministic top allocations of 3, 2 and 1 MB
+FAKE_STATS = [
+    FakeStatistic(size_mb * MB, FakeTraceback([f'  File "fake.py", line {size_mb}']))
+    for size_mb in (3, 2, 1)
+]
+
+
+class FakeSnapshot:
+    """Stand-in for tracemalloc.Snapshot returning preset statistics."""
+
+    def __init__(self, stats: list[object] | None = None) -> None:
+        """Initialize with the statistics to report."""
+        self.stats = stats or []
+
+    def statistics(self, key_type: str) -> list[object]:
+        return self.stats
+
+
+class FakeTracemalloc:
+    """Stand-in for the tracemalloc functions used by MemoryMonitor.
+
+    Tracks the tracing flag as plain state so tests never install the real
+    allocator hooks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with tracing stopped and nothing traced."""
+        self.tracing = False
+        self.traced_memory = (0, 0)
+        self.snapshot: object = FakeSnapshot()
+
+    def is_tracing(self) -> bool:
+        return self.tracing
+
+    def start(self, nframe: int = 1) -> None:
+        self.tracing = True
+
+    def stop(self) -> None:
+        self.tracing = False
+
+    def get_traced_memory(self) -> tuple[int, int]:
+        return self.traced_memory
+
+    def take_snapshot(self) -> object:
+        if not self.tracing:
+            raise RuntimeError("the tracemalloc module must be tracing memory allocations")
+        return self.snapshot
+
+
+@pytest.fixture
+def fake_tracemalloc(monkeypatch: pytest.MonkeyPatch) -> FakeTracemalloc:
+    """Route the tracemalloc functions MemoryMonitor calls to a FakeTracemalloc."""
+    fake = FakeTracemalloc()
+    for name in ("is_tracing", "start", "stop", "get_traced_memory", "take_snapshot"):
+        monkeypatch.setattr(tracemalloc, name, getattr(fake, name))
+    return fake
+
 
 class TestMemorySnapshot:
     """Test MemorySnapshot dataclass."""
 
     def test_memory_snapshot_creation(self) -> None:
         """Test creating a memory snapshot."""
-        snapshot = MemorySnapshot(
-            rss_mb=100.5,
-            vms_mb=200.3,
-            current_mb=50.2,
-            peak_mb=75.8,
-            total_objects=1000,
-        )
-
-        assert snapshot.rss_mb == 100.5
-        assert snapshot.vms_mb == 200.3
-        assert snapshot.current_mb == 50.2
-        assert snapshot.peak_mb == 75.8
-        assert snapshot.total_objects == 1000
+        assert asdict(SAMPLE_SNAPSHOT) == {
+            "rss_mb": 100.5,
+            "vms_mb": 200.3,
+            "current_mb": 50.2,
+            "peak_mb": 75.8,
+            "total_objects": 1234,
+        }
 
     def test_memory_snapshot_str(self) -> None:
         """Test string representation of memory snapshot."""
-        snapshot = MemorySnapshot(
-            rss_mb=100.5,
-            vms_mb=200.3,
-            current_mb=50.2,
-            peak_mb=75.8,
-            total_objects=1234,
+        assert str(SAMPLE_SNAPSHOT) == (
+            "Memory: RSS=100.5MB, VMS=200.3MB, Python=50.2MB (peak=75.8MB), Objects=1,234"
         )
 
-        result = str(snapshot)
-        assert "RSS=100.5MB" in result
-        assert "VMS=200.3MB" in result
-        assert "Python=50.2MB" in result
-        assert "peak=75.8MB" in result
-        assert "Objects=1,234" in result
-
 
+@pytest.mark.usefixtures("fake_process", "fake_tracemalloc")
 class TestMemoryMonitor:
     """Test MemoryMonitor class."""
 
-    @pytest.fixture
-    def mock_process(self) -> MagicMock:
-        """Create mock process."""
-        process = MagicMock()
-        # Mock memory_info
-        mem_info = MagicMock()
-        mem_info.rss = 100 * 1024 * 1024  # 100 MB
-        mem_info.vms = 200 * 1024 * 1024  # 200 MB
-        process.memory_info.return_value = mem_info
-        process.memory_percent.return_value = 5.5
-        return process
-
-    def test_init(self, mock_process: MagicMock) -> None:
+    def test_init(self, fake_process: FakeProcess) -> None:
         """Test MemoryMonitor initialization."""
-        with patch("psutil.Process", return_value=mock_process):
-            monitor = MemoryMonitor()
-            assert monitor.process == mock_process
-            assert monitor.snapshots == []
-            assert monitor._tracemalloc_started is False
+        monitor = MemoryMonitor()
+        assert monitor.process is fake_process
+        assert monitor.snapshots == []
+        assert monitor._tracemalloc_started is False
 
-    def test_start_tracking_not_running(self) -> None:
+    def test_start_tracking_not_running(self, fake_tracemalloc: FakeTracemalloc) -> None:
         """Test starting memory tracking when not already running."""
-        # Ensure tracemalloc is stopped
-        if tracemalloc.is_tracing():
-            tracemalloc.stop()
-
-        with patch("psutil.Process"):
-            monitor = MemoryMonitor()
-            monitor.start_tracking()
+        monitor = MemoryMonitor()
+        monitor.start_tracking()
 
-            assert tracemalloc.is_tracing()
-            assert monitor._tracemalloc_started is True
+        assert fake_tracemalloc.tracing
+        assert monitor._tracemalloc_started is True
 
-            # Clean up
-            tracemalloc.stop()
-
-    def test_start_tracking_already_running(self) -> None:
+    def test_start_tracking_already_running(self, fake_tracemalloc: FakeTracemalloc) -> None:
         """Test starting memory tracking when already running."""
-        # Start tracemalloc
-        tracemalloc.start()
-
-        with patch("psutil.Process"):
-            monitor = MemoryMonitor()
-            monitor.start_tracking()
+        fake_tracemalloc.tracing = True
 
-            assert tracemalloc.is_tracing()
-            assert monitor._tracemalloc_started is False  # Not started by us
+        monitor = MemoryMonitor()
+        monitor.start_tracking()
 
-            # Clean up
-            tracemalloc.stop()
+        assert fake_tracemalloc.tracing
+        assert monitor._tracemalloc_started is False  # Not started by us
 
-    def test_stop_tracking(self) -> None:
+    def test_stop_tracking(self, fake_tracemalloc: FakeTracemalloc) -> None:
         """Test stopping memory tracking."""
-        with patch("psutil.Process"):
-            monitor = MemoryMonitor()
-            monitor.start_tracking()
-            assert tracemalloc.is_tracing()
+        monitor = MemoryMonitor()
+        monitor.start_tracking()
+        assert fake_tracemalloc.tracing
 
-            monitor.stop_tracking()
-            assert not tracemalloc.is_tracing()
-            assert monitor._tracemalloc_started is False
+        monitor.stop_tracking()
+        assert not fake_tracemalloc.tracing
+        assert monitor._tracemalloc_started is False
 
-    def test_stop_tracking_not_started_by_us(self) -> None:
+    def test_stop_tracking_not_started_by_us(self, fake_tracemalloc: FakeTracemalloc) -> None:
         """Test stopping tracking when not started by monitor."""
-        # Start tracemalloc externally
-        tracemalloc.start()
+        # Tracing started externally
+        fake_tracemalloc.tracing = True
 
-        with patch("psutil.Process"):
-            monitor = MemoryMonitor()
-            monitor._tracemalloc_started = False
+        monitor = MemoryMonitor()
+        monitor._tracemalloc_started = False
 
-            monitor.stop_tracking()
-            # Should still be running since we didn't start it
-            assert tracemalloc.is_tracing()
-
-            # Clean up
-            tracemalloc.stop()
+        monitor.stop_tracking()
+        # Should still be running since we didn't start it
+        assert fake_tracemalloc.tracing
 
-    def test_take_snapshot_with_tracemalloc(self, mock_process: MagicMock) -> None:
+    def test_take_snapshot_with_tracemalloc(self, fake_tracemalloc: FakeTracemalloc) -> None:
         """Test taking a snapshot with tracemalloc enabled."""
-        with patch("psutil.Process", return_value=mock_process):
-            monitor = MemoryMonitor()
-            monitor.start_tracking()
-
-            with (
-                patch(
-                    "tracemalloc.get_traced_memory",
-                    return_value=(50 * 1024 * 1024, 75 * 1024 * 1024),
-                ),
-                patch("gc.get_objects", return_value=[1] * 1000),
-            ):
-                snapshot = monitor.take_snapshot("Test")
-
-            assert snapshot.rss_mb == 100.0
-            assert snapshot.vms_mb == 200.0
-            assert snapshot.current_mb == 50.0
-            assert snapshot.peak_mb == 75.0
-            assert snapshot.total_objects == 1000
-
-            assert len(monitor.snapshots) == 1
-            assert monitor.snapshots[0] == ("Test", snapshot)
-
-            # Clean up
-            monitor.stop_tracking()
+        monitor = MemoryMonitor()
+        monitor.start_tracking()
+        fake_tracemalloc.traced_memory = (50 * MB, 75 * MB)
+
+        with patch("gc.get_objects", return_value=FAKE_OBJECTS_1000):
+            snapshot = monitor.take_snapshot("Test")
+
+        assert snapshot.rss_mb == 100.0
+        assert snapshot.vms_mb == 200.0
+        assert snapshot.current_mb == 50.0
+        assert snapshot.peak_mb == 75.0
+        assert snapshot.total_objects == 1000
 
-    def test_take_snapshot_without_tracemalloc(self, mock_process: MagicMock) -> None:
+        assert len(monitor.snapshots) == 1
+        assert monitor.snapshots[0] == ("Test", snapshot)
+
+    def test_take_snapshot_without_tracemalloc(self) -> None:
         """Test taking a snapshot without tracemalloc enabled."""
-        with patch("psutil.Process", return_value=mock_process):
-            monitor = MemoryMonitor()
+        monitor = MemoryMonitor()
 
-            with patch("gc.get_objects", return_value=[1] * 500):
-                snapshot = monitor.take_snapshot("Test")
+        with patch("gc.get_objects", return_value=FAKE_OBJECTS_500):
+            snapshot = monitor.take_snapshot("Test")
 
-            assert snapshot.rss_mb == 100.0
-            assert snapshot.vms_mb == 200.0
-            assert snapshot.current_mb == 0.0  # No tracemalloc
-            assert snapshot.peak_mb == 0.0  # No tracemalloc
-            assert snapshot.total_objects == 500
+        assert snapshot.rss_mb == 100.0
+        assert snapshot.vms_mb == 200.0
+        assert snapshot.current_mb == 0.0  # No tracemalloc
+        assert snapshot.peak_mb == 0.0  # No tracemalloc
+        assert snapshot.total_objects == 500
 
-    def test_get_memory_usage(self, mock_process: MagicMock) -> None:
+    def test_get_memory_usage(self) -> None:
         """Test getting current memory usage."""
-        with patch("psutil.Process", return_value=mock_process):
-            monitor = MemoryMonitor()
-            usage = monitor.get_memory_usage()
+        monitor = MemoryMonitor()
+        usage = monitor.get_memory_usage()
+
+        assert usage["rss_mb"] == 100.0
+        assert usage["vms_mb"] == 200.0
+        assert usage["percent"] == 5.5
+
+    def test_get_memory_usage_statm(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test reading rss/vms from /proc/self/statm on Linux."""
+        statm = tmp_path / "statm"
+        statm.write_bytes(b"2048 1024 0 0 0 0 0\n")
+        monkeypatch.setattr(memory_monitor, "_USE_STATM", True)
+        monkeypatch.setattr(memory_monitor, "_STATM_PATH", str(statm))
+
+        monitor = MemoryMonitor()
+        usage = monitor.get_memory_usage()
+
+        assert usage["rss_mb"] == 1024 * mmap.PAGESIZE / MB
+        assert usage["vms_mb"] == 2048 * mmap.PAGESIZE / MB
+
+    def test_get_memory_usage_statm_unavailable(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test falling back to psutil when statm cannot be read."""
+        monkeypatch.setattr(memory_monitor, "_USE_STATM", True)
+        monkeypatch.setattr(memory_monitor, "_STATM_PATH", str(tmp_path / "missing"))
+
+        monitor = MemoryMonitor()
+        usage = monitor.get_memory_usage()
 
-            assert usage["rss_mb"] == 100.0
-            assert usage["vms_mb"] == 200.0
-            assert usage["percent"] == 5.5
+        assert usage["rss_mb"] == 100.0
+        assert usage["vms_mb"] == 200.0
+        assert monitor._use_statm is False
 
     def test_print_summary_no_snapshots(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test printing summary with no snapshots."""
-        with patch("psutil.Process"):
-            monitor = MemoryMonitor()
-            monitor.print_summary()
+        monitor = MemoryMonitor()
+        monitor.print_summary()
 
-            captured = capsys.readouterr()
-            assert "No memory snapshots taken" in captured.out
+        captured = capsys.readouterr()
+        assert "No memory snapshots taken" in captured.out
 
-    def test_print_summary_single_snapshot(
-        self, mock_process: MagicMock, capsys: pytest.CaptureFixture[str]
-    ) -> None:
+    def test_print_summary_single_snapshot(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test printing summary with single snapshot."""
-        with patch("psutil.Process", return_value=mock_process):
-            monitor = MemoryMonitor()
+        monitor = MemoryMonitor()
 
-            with patch("gc.get_objects", return_value=[1] * 100):
-                monitor.take_snapshot("Test Snapshot")
+        with patch("gc.get_objects", return_value=FAKE_OBJECTS_100):
+            monitor.take_snapshot("Test Snapshot")
 
-            monitor.print_summary()
+        monitor.print_summary()
 
-            captured = capsys.readouterr()
-            assert "Memory Usage Summary:" in captured.out
-            assert "Test Snapshot" in captured.out
-            assert "RSS=100.0MB" in captured.out
+        captured = capsys.readouterr()
+        assert "Memory Usage Summary:" in captured.out
+        assert "Test Snapshot" in captured.out
+        assert "RSS=100.0MB" in captured.out
 
     def test_print_summary_multiple_snapshots(
-        self, mock_process: MagicMock, capsys: pytest.CaptureFixture[str]
+        self,
+        fake_process: FakeProcess,
+        fake_tracemalloc: FakeTracemalloc,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test printing summary with multiple snapshots."""
-        with patch("psutil.Process", return_value=mock_process):
-            monitor = MemoryMonitor()
-            monitor.start_tracking()
-
-            # First snapshot
-            with (
-                patch(
-                    "tracemalloc.get_traced_memory",
-                    return_value=(50 * 1024 * 1024, 50 * 1024 * 1024),
-                ),
-                patch("gc.get_objects", return_value=[1] * 100),
-            ):
-                monitor.take_snapshot("Start")
-
-            # Modify mock for second snapshot
-            mock_process.memory_info.return_value.rss = 150 * 1024 * 1024  # 150 MB
-
-            # Second snapshot
-            with (
-                patch(
-                    "tracemalloc.get_traced_memory",
-                    return_value=(80 * 1024 * 1024, 80 * 1024 * 1024),
-                ),
-                patch("gc.get_objects", return_value=[1] * 200),
-            ):
-                monitor.take_snapshot("End")
-
-            monitor.print_summary()
-
-            captured = capsys.readouterr()
-            assert "Memory Changes:" in captured.out
-            assert "RSS: +50.0MB" in captured.out
-            assert "Python: +30.0MB" in captured.out
-            assert "Objects: +100" in captured.out
-
-            # Clean up
-            monitor.stop_tracking()
+        monitor = MemoryMonitor()
+        monitor.start_tracking()
 
-    def test_get_top_allocations_no_tracemalloc(self) -> None:
-        """Test getting top allocations without tracemalloc."""
-        if tracemalloc.is_tracing():
-            tracemalloc.stop()
+        # First snapshot
+        fake_tracemalloc.traced_memory = (50 * MB, 50 * MB)
+        with patch("gc.get_objects", return_value=FAKE_OBJECTS_100):
+            monitor.take_snapshot("Start")
 
-        with patch("psutil.Process"):
-            monitor = MemoryMonitor()
-            result = monitor.get_top_allocations()
+        # Modify fakes for second snapshot
+        fake_process.mem_info = DEFAULT_MEM_INFO._replace(rss=150 * MB)
+        fake_tracemalloc.traced_memory = (80 * MB, 80 * MB)
 
-            assert len(result) == 1
-            assert result[0] == "Tracemalloc not running"
+        # Second snapshot
+        with patch("gc.get_objects", return_value=FAKE_OBJECTS_200):
+            monitor.take_snapshot("End")
 
-    def test_get_top_allocations_with_tracemalloc(self) -> None:
-        """Test getting top allocations with tracemalloc."""
-        tracemalloc.start()
+        monitor.print_summary()
 
-        # Create some allocations
-        data1 = [0] * 1000
-        data2 = [1] * 2000
-        data3 = [2] * 3000
+        captured = capsys.readouterr()
+        assert SUMMARY_CHANGES_RX.search(captured.out)
 
-        with patch("psutil.Process"):
-            monitor = MemoryMonitor()
-            result = monitor.get_top_allocations(limit=5)
+    def test_get_top_allocations_no_tracemalloc(self) -> None:
+        """Test getting top allocations without tracemalloc."""
+        monitor = MemoryMonitor()
+        result = monitor.get_top_allocations()
+
+        assert len(result) == 1
+        assert result[0] == "Tracemalloc not running"
+
+    def test_get_top_allocations_with_tracemalloc(self, fake_tracemalloc: FakeTracemalloc) -> None:
+        """Test getting top allocations with tracemalloc."""
+        fake_tracemalloc.tracing = True
+        fake_tracemalloc.snapshot = FakeSnapshot(FAKE_STATS)
 
-            assert isinstance(result, list)
-            assert len(result) <= 5
-            for line in result:
-                assert line.startswith("#")
-                assert "MB" in line
+        monitor = MemoryMonitor()
+        result = monitor.get_top_allocations(limit=2)
 
-        # Clean up
-        del data1, data2, data3
-        tracemalloc.stop()
+        assert result == [
+            '#1: File "fake.py", line 3: 3.0 MB',
+            '#2: File "fake.py", line 2: 2.0 MB',
+        ]
 
-    def test_get_top_allocations_empty_formatted(self) -> None:
+    def test_get_top_allocations_empty_formatted(self, fake_tracemalloc: FakeTracemalloc) -> None:
         """Test getting top allocations with empty formatted traceback."""
-        tracemalloc.start()
+        fake_tracemalloc.tracing = True
+        fake_tracemalloc.snapshot = FakeSnapshot(
+            [FakeStatistic(MB, FakeTraceback([]))]  # 1 MB, empty formatted list
+        )
 
-        with patch("psutil.Process"):
-            monitor = MemoryMonitor()
+        monitor = MemoryMonitor()
+        result = monitor.get_top_allocations(limit=1)
 
-            # Mock the snapshot to return a stat with empty formatted traceback
-            mock_snapshot = MagicMock()
-            mock_stat = MagicMock()
-            mock_stat.size = 1024 * 1024  # 1 MB
-            mock_stat.traceback.format.return_value = []  # Empty formatted list
-            mock_snapshot.statistics.return_value = [mock_stat]
+        assert len(result) == 1
+        assert "#1: <unknown>: 1.0 MB" in result[0]
 
-            with patch("tracemalloc.take_snapshot", return_value=mock_snapshot):
-                result = monitor.get_top_allocations(limit=1)
 
-            assert len(result) == 1
-            assert "#1: <unknown>: 1.0 MB" in result[0]
+@pytest.mark.slow
+@pytest.mark.skipif(
+    os.environ.get("IT8951_TEST_REAL_TRACEMALLOC") != "1",
+    reason="Installs the global tracemalloc hook; set IT8951_TEST_REAL_TRACEMALLOC=1 to run",
+)
+class TestRealTracemalloc:
+    """Exercise MemoryMonitor against the real tracemalloc module."""
+
+    def test_get_top_allocations_real(self) -> None:
+        """Test top allocations are reported from a real tracemalloc snapshot."""
+        monitor = MemoryMonitor()
+        monitor.start_tracking()
+        try:
+            data = [bytearray(MB) for _ in range(3)]
+            result = monitor.get_top_allocations(limit=5)
+        finally:
+            monitor.stop_tracking()
 
-        tracemalloc.stop()
+        assert len(data) == 3
+        assert 0 < len(result) <= 5
+        for line in result:
+            assert line.startswith("#")
+            assert "MB" in line
 
 
+@pytest.mark.usefixtures("fake_process", "fake_tracemalloc")
 class TestContextManager:
     """Test monitor_memory context manager."""
 
-    def test_monitor_memory_context(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test monitor_memory context manager."""
-        with patch("psutil.Process") as mock_process_class:
-            mock_process = MagicMock()
-            mem_info = MagicMock()
-            mem_info.rss = 100 * 1024 * 1024
-            mem_info.vms = 200 * 1024 * 1024
-            mock_process.memory_info.return_value = mem_info
-            mock_process_class.return_value = mock_process
-
-            with monitor_memory("Test Operation") as monitor:
-                assert isinstance(monitor, MemoryMonitor)
-                assert len(monitor.snapshots) == 1  # Initial snapshot
-
-                # Take additional snapshot
-                monitor.take_snapshot("During operation")
-
-            # After exiting, should have printed summary
-            captured = capsys.readouterr()
-            assert "Memory Usage Summary:" in captured.out
-            assert "Test Operation - Start" in captured.out
-            assert "Test Operation - End" in captured.out
-            assert len(monitor.snapshots) == 3  # Start, During, End
-
-    def test_monitor_memory_with_exception(self, capsys: pytest.CaptureFixture[str]) -> None:
-        """Test monitor_memory handles exceptions properly."""
-        with patch("psutil.Process") as mock_process_class:
-            mock_process = MagicMock()
-            mem_info = MagicMock()
-            mem_info.rss = 100 * 1024 * 1024
-            mem_info.vms = 200 * 1024 * 1024
-            mock_process.memory_info.return_value = mem_info
-            mock_process_class.return_value = mock_process
-
-            try:
-                with monitor_memory("Error Test") as monitor:
-                    assert isinstance(monitor, MemoryMonitor)
-                    raise ValueError("Test error")
-            except ValueError:
-                pass
-
-            # Should still print summary even with exception
-            captured = capsys.readouterr()
-            assert "Memory Usage Summary:" in captured.out
+    @pytest.mark.parametrize("raise_error", [False, True])
+    def test_monitor_memory_context(
+        self, raise_error: bool, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test monitor_memory prints a summary, even when the body raises."""
+        with suppress(ValueError), monitor_memory("Test Operation") as monitor:
+            assert isinstance(monitor, MemoryMonitor)
+            assert len(monitor.snapshots) == 1  # Initial snapshot
+
+            # Take additional snapshot
+            monitor.take_snapshot("During operation")
+            if raise_error:
+                raise ValueError("Test error")
+
+        # After exiting, should have printed summary
+        captured = capsys.readouterr()
+        assert CONTEXT_SUMMARY_RX.search(captured.out)
+        assert len(monitor.snapshots) == 3  # Start, During, End
 
 
+@pytest.mark.usefixtures("fake_process")
 class TestUtilityFunctions:
     """Test utility functions."""
 
@@ -369,40 +479,26 @@ class TestUtilityFunctions:
         assert result["packed_size_mb"] == pytest.approx(0.476837, rel=1e-3)
         assert result["compression_ratio"] == pytest.approx(2.0)
 
-    def test_estimate_memory_usage_all_formats(self) -> None:
+    @pytest.mark.parametrize("pixel_format", sorted(ESTIMATE_EXPECTED_MB))
+    def test_estimate_memory_usage_all_formats(self, pixel_format: int) -> None:
         """Test memory estimation for all pixel formats."""
-        width, height = 800, 600
-
-        # Test each format
-        formats = [
-            (0, 0.125),  # 1bpp
-            (1, 0.25),  # 2bpp
-            (2, 0.5),  # 4bpp
-            (3, 1.0),  # 8bpp
-        ]
-
-        for pixel_format, bytes_per_pixel in formats:
-            result = estimate_memory_usage(width, height, pixel_format)
-
-            input_size = (width * height) / (1024 * 1024)
-            packed_size = (width * height * bytes_per_pixel) / (1024 * 1024)
+        result = estimate_memory_usage(ESTIMATE_WIDTH, ESTIMATE_HEIGHT, pixel_format)
 
-            assert result["input_size_mb"] == pytest.approx(input_size)
-            assert result["packed_size_mb"] == pytest.approx(packed_size)
-
-    def test_estimate_memory_usage_with_buffer(self) -> None:
-        """Test memory estimation with buffer overhead."""
-        result = estimate_memory_usage(1000, 1000, 2, include_buffer=True)
-
-        assert result["buffer_overhead_mb"] > 0
-        assert result["total_mb"] > result["input_size_mb"] + result["packed_size_mb"]
+        np.testing.assert_allclose(
+            (result["input_size_mb"], result["packed_size_mb"]),
+            ESTIMATE_EXPECTED_MB[pixel_format],
+            rtol=1e-6,
+        )
 
-    def test_estimate_memory_usage_without_buffer(self) -> None:
-        """Test memory estimation without buffer overhead."""
-        result = estimate_memory_usage(1000, 1000, 2, include_buffer=False)
+    @pytest.mark.parametrize("include_buffer", [True, False])
+    def test_estimate_memory_usage_buffer_overhead(self, include_buffer: bool) -> None:
+        """Test memory estimation with and without buffer overhead."""
+        result = estimate_memory_usage(1000, 1000, 2, include_buffer=include_buffer)
 
-        assert result["buffer_overhead_mb"] == 0
-        assert result["total_mb"] == result["input_size_mb"] + result["packed_size_mb"]
+        assert (result["buffer_overhead_mb"] > 0) is include_buffer
+        assert result["total_mb"] == pytest.approx(
+            result["input_size_mb"] + result["packed_size_mb"] + result["buffer_overhead_mb"]
+        )
 
     def test_estimate_memory_usage_zero_packed_size(self) -> None:
         """Test memory estimation with zero dimensions."""
@@ -420,27 +516,18 @@ class TestUtilityFunctions:
 
     def test_get_memory_stats(self) -> None:
         """Test getting comprehensive memory statistics."""
-        with patch("psutil.Process") as mock_process_class:
-            mock_process = MagicMock()
-            mem_info = MagicMock()
-            mem_info.rss = 100 * 1024 * 1024
-            mem_info.vms = 200 * 1024 * 1024
-            mock_process.memory_info.return_value = mem_info
-            mock_process.memory_percent.return_value = 5.5
-            mock_process_class.return_value = mock_process
-
-            with patch("psutil.virtual_memory") as mock_virtual_memory:
-                virtual_mem = MagicMock()
-                virtual_mem.total = 8 * 1024 * 1024 * 1024  # 8 GB
-                virtual_mem.available = 4 * 1024 * 1024 * 1024  # 4 GB
-                virtual_mem.percent = 50.0
-                mock_virtual_memory.return_value = virtual_mem
-
-                with (
-                    patch("gc.get_objects", return_value=[1] * 1000),
-                    patch("gc.garbage", [1, 2, 3]),
-                ):
-                    stats = get_memory_stats()
+        virtual_mem = FakeVirtualMemory(
+            total=8 * 1024 * MB,  # 8 GB
+            available=4 * 1024 * MB,  # 4 GB
+            percent=50.0,
+        )
+
+        with (
+            patch("psutil.virtual_memory", return_value=virtual_mem),
+            patch("gc.get_objects", return_value=FAKE_OBJECTS_1000),
+            patch("gc.garbage", [1, 2, 3]),
+        ):
+            stats = get_memory_stats()
 
         assert stats["process"]["rss_mb"] == 100.0
         assert stats["process"]["vms_mb"] == 200.0
@@ -1,7 +1,7 @@
 """Tests for data models."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from IT8951_ePaper_Py.constants import DisplayMode, EndianType, PixelFormat, Rotation
 from IT8951_ePaper_Py.models import (
@@ -12,6 +12,13 @@ from IT8951_ePaper_Py.models import (
     VCOMConfig,
 )
 
+# Shared adapters so the negative-path tests reuse one compiled validator per model
+DEVICE_INFO_ADAPTER = TypeAdapter(DeviceInfo)
+LOAD_IMAGE_INFO_ADAPTER = TypeAdapter(LoadImageInfo)
+AREA_IMAGE_INFO_ADAPTER = TypeAdapter(AreaImageInfo)
+DISPLAY_AREA_ADAPTER = TypeAdapter(DisplayArea)
+VCOM_CONFIG_ADAPTER = TypeAdapter(VCOMConfig)
+
 
 class TestDeviceInfo:
     """Test DeviceInfo model."""
@@ -46,13 +53,15 @@ class TestDeviceInfo:
     def test_invalid_panel_dimensions(self) -> None:
         """Test validation of panel dimensions."""
         with pytest.raises(ValidationError):
-            DeviceInfo(
-                panel_width=3000,  # Too large
-                panel_height=768,
-                memory_addr_l=0,
-                memory_addr_h=0,
-                fw_version="1.0",
-                lut_version="1.0",
+            DEVICE_INFO_ADAPTER.validate_python(
+                {
+                    "panel_width": 3000,  # Too large
+                    "panel_height": 768,
+                    "memory_addr_l": 0,
+                    "memory_addr_h": 0,
+                    "fw_version": "1.0",
+                    "lut_version": "1.0",
+                }
             )
 
     def test_memory_address_calculation(self) -> None:
@@ -100,10 +109,7 @@ class TestLoadImageInfo:
     def test_empty_buffer_validation(self) -> None:
         """Test validation rejects empty buffer."""
         with pytest.raises(ValidationError):
-            LoadImageInfo(
-                source_buffer=b"",
-                target_memory_addr=0,
-            )
+            LOAD_IMAGE_INFO_ADAPTER.validate_python({"source_buffer": b"", "target_memory_addr": 0})
 
 
 class TestAreaImageInfo:
@@ -125,21 +131,15 @@ class TestAreaImageInfo:
     def test_negative_coordinates_rejected(self) -> None:
         """Test negative coordinates are rejected."""
         with pytest.raises(ValidationError):
-            AreaImageInfo(
-                area_x=-10,
-                area_y=0,
-                area_w=100,
-                area_h=100,
+            AREA_IMAGE_INFO_ADAPTER.validate_python(
+                {"area_x": -10, "area_y": 0, "area_w": 100, "area_h": 100}
             )
 
     def test_zero_dimensions_rejected(self) -> None:
         """Test zero dimensions are rejected."""
         with pytest.raises(ValidationError):
-            AreaImageInfo(
-                area_x=0,
-                area_y=0,
-                area_w=0,
-                area_h=100,
+            AREA_IMAGE_INFO_ADAPTER.validate_python(
+                {"area_x": 0, "area_y": 0, "area_w": 0, "area_h": 100}
             )
 
 
@@ -163,20 +163,14 @@ class TestDisplayArea:
 
     def test_alignment_validation(self) -> None:
         """Test position and dimension alignment validation."""
-        with pytest.raises(ValidationError, match="aligned to 4 pixels"):
-            DisplayArea(
-                x=1,  # Not aligned to 4
-                y=0,
-                width=800,
-                height=600,
+        with pytest.raises(ValidationError, match="multiple of 4"):
+            DISPLAY_AREA_ADAPTER.validate_python(
+                {"x": 1, "y": 0, "width": 800, "height": 600}  # x not aligned to 4
             )
 
-        with pytest.raises(ValidationError, match="multiples of 4"):
-            DisplayArea(
-                x=0,
-                y=0,
-                width=801,  # Not multiple of 4
-                height=600,
+        with pytest.raises(ValidationError, match="multiple of 4"):
+            DISPLAY_AREA_ADAPTER.validate_python(
+                {"x": 0, "y": 0, "width": 801, "height": 600}  # width not multiple of 4
             )
 
     def test_default_mode(self) -> None:
@@ -201,10 +195,10 @@ class TestVCOMConfig:
     def test_vcom_range_validation(self) -> None:
         """Test VCOM voltage range validation."""
         with pytest.raises(ValidationError):
-            VCOMConfig(voltage=-6.0)  # Too low
+            VCOM_CONFIG_ADAPTER.validate_python({"voltage": -6.0})  # Too low
 
         with pytest.raises(ValidationError):
-            VCOMConfig(voltage=0.0)  # Too high
+            VCOM_CONFIG_ADAPTER.validate_python({"voltage": 0.0})  # Too high
 
     def test_vcom_rounding(self) -> None:
         """Test VCOM voltage is rounded to 2 decimal places."""
@@ -223,7 +217,7 @@ class TestVCOMConfig:
 
         # Test just outside boundaries
         with pytest.raises(ValidationError):
-            VCOMConfig(voltage=-5.01)
+            VCOM_CONFIG_ADAPTER.validate_python({"voltage": -5.01})
 
         with pytest.raises(ValidationError):
-            VCOMConfig(voltage=-0.19)
+            VCOM_CONFIG_ADAPTER.validate_python({"voltage": -0.19})
@@ -13,6 +13,15 @@ from IT8951_ePaper_Py.display import EPaperDisplay
 from IT8951_ePaper_Py.it8951 import IT8951
 from IT8951_ePaper_Py.spi_interface import MockSPI
 
+# Repeating 0-255 gradient shared by the packing timings (12800 bytes)
+GRADIENT_BYTES = bytes(range(256)) * 50
+
+
+@pytest.fixture(scope="module")
+def random_frame() -> np.ndarray:
+    """Provide one pre-randomized 600x800 frame shared by the packing timings."""
+    return np.random.default_rng(0).integers(0, 256, size=(600, 800), dtype=np.uint8)
+
 
 class TestPerformance:
     """Test performance differences between pixel formats."""
@@ -38,11 +47,9 @@ class TestPerformance:
         return display
 
     @pytest.mark.slow
-    def test_4bpp_vs_8bpp_packing_performance(self):
+    def test_4bpp_vs_8bpp_packing_performance(self, random_frame: np.ndarray):
         """Test that 4bpp packing is measurably different from 8bpp."""
-        # Create test image (reduced size for faster tests)
-        image = np.random.randint(0, 256, size=(600, 800), dtype=np.uint8)
-        image_bytes = image.flatten().tobytes()
+        image_bytes = random_frame.tobytes()
 
         # Time 8bpp packing
         start_8bpp = time.perf_counter()
@@ -100,11 +107,10 @@ class TestPerformance:
 
     @pytest.mark.slow
     @pytest.mark.parametrize("size", [(50, 50), (100, 100), (200, 200)])
-    def test_scaling_performance(self, size):
+    def test_scaling_performance(self, size, random_frame: np.ndarray):
         """Test performance scaling with different image sizes."""
         width, height = size
-        image = np.random.randint(0, 256, size=(height, width), dtype=np.uint8)
-        image_bytes = image.flatten().tobytes()
+        image_bytes = random_frame[:height, :width].tobytes()
 
         # Time 8bpp
         start_8bpp = time.perf_counter()
@@ -174,8 +180,7 @@ class TestPerformanceRegression:
         ]
 
         for size, pixel_format in test_cases:
-            test_pixels = bytes(range(256)) * (size // 256 + 1)
-            test_pixels = test_pixels[:size]
+            test_pixels = GRADIENT_BYTES[:size]
 
             # Create a closure that properly captures the loop variables
             def make_pack_func(pixels: bytes, fmt: PixelFormat) -> Callable[[], None]:
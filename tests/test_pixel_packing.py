@@ -8,6 +8,60 @@ from IT8951_ePaper_Py.exceptions import InvalidParameterError
 from IT8951_ePaper_Py.it8951 import IT8951
 from IT8951_ePaper_Py.pixel_packing import pack_pixels_numpy
 
+# Ground-truth vectors for the numpy packers, shared by the parametrized tests
+PACK_4BPP_CASES = [
+    # 0x00 >> 4 = 0x0, 0xFF >> 4 = 0xF -> 0x0F; 0x80, 0x40 -> 0x84; 0xC0, 0x20 -> 0xC2
+    pytest.param(
+        bytes([0x00, 0xFF, 0x80, 0x40, 0xC0, 0x20]), bytes([0x0F, 0x84, 0xC2]), id="bytes"
+    ),
+    pytest.param(
+        np.array([0x00, 0xFF, 0x80, 0x40, 0xC0, 0x20], dtype=np.uint8),
+        bytes([0x0F, 0x84, 0xC2]),
+        id="array",
+    ),
+    # Odd length pads the last low nibble with 0
+    pytest.param(np.array([0xF0, 0x80, 0x40], dtype=np.uint8), bytes([0xF8, 0x40]), id="odd"),
+    pytest.param(np.array([], dtype=np.uint8), b"", id="empty"),
+]
+PACK_2BPP_CASES = [
+    # 0, 3, 2, 1 -> 0b00111001 = 0x39; 3, 0, 1, 2 -> 0b11000110 = 0xC6
+    pytest.param(
+        bytes([0x00, 0xFF, 0x80, 0x40, 0xC0, 0x20, 0x60, 0xA0]), bytes([0x39, 0xC6]), id="bytes"
+    ),
+    pytest.param(
+        np.array([0x00, 0xFF, 0x80, 0x40, 0xC0, 0x20, 0x60, 0xA0], dtype=np.uint8),
+        bytes([0x39, 0xC6]),
+        id="array",
+    ),
+    pytest.param(np.array([0xC0], dtype=np.uint8), bytes([0xC0]), id="1-pixel"),  # 11000000
+    pytest.param(np.array([0xC0, 0x80], dtype=np.uint8), bytes([0xE0]), id="2-pixels"),  # 11100000
+    # 11100100
+    pytest.param(np.array([0xC0, 0x80, 0x40], dtype=np.uint8), bytes([0xE4]), id="3-pixels"),
+    pytest.param(np.array([], dtype=np.uint8), b"", id="empty"),
+]
+PACK_1BPP_CASES = [
+    # MSB first: 0, 1, 0, 1, 0, 1, 0, 1
+    pytest.param(bytes([0, 255, 100, 200, 50, 150, 0, 255]), bytes([0b01010101]), id="bytes"),
+    pytest.param(
+        np.array([0, 255, 100, 200, 50, 150, 0, 255], dtype=np.uint8),
+        bytes([0b01010101]),
+        id="array",
+    ),
+    pytest.param(np.array([255], dtype=np.uint8), bytes([0b10000000]), id="1-pixel"),
+    pytest.param(np.array([0, 255, 128], dtype=np.uint8), bytes([0b01100000]), id="3-pixels"),
+    pytest.param(
+        np.array([255, 0, 255, 0, 255, 0, 255], dtype=np.uint8),
+        bytes([0b10101010]),
+        id="7-pixels",
+    ),
+    # Threshold is 128: values below map to 0, values at or above map to 1
+    pytest.param(np.array([0, 50, 100, 127], dtype=np.uint8), bytes([0b00000000]), id="below"),
+    pytest.param(
+        np.array([128, 150, 200, 255], dtype=np.uint8), bytes([0b11110000]), id="at-or-above"
+    ),
+    pytest.param(np.array([], dtype=np.uint8), b"", id="empty"),
+]
+
 
 class TestPixelPacking:
     """Test pixel packing for different bit depths."""
@@ -120,16 +174,15 @@ class TestPixelPacking:
         # Verify we get 8 bytes (16 pixels / 2)
         assert len(packed) == 8
 
-        # Unpack and verify levels
-        unpacked = []
-        for byte in packed:
-            unpacked.append((byte >> 4) << 4)  # High nibble -> full byte
-            unpacked.append((byte & 0x0F) << 4)  # Low nibble -> full byte
+        # Unpack each nibble back to a full byte (high nibble first)
+        packed_arr = np.frombuffer(packed, dtype=np.uint8)
+        unpacked = np.empty(packed_arr.size * 2, dtype=np.uint8)
+        unpacked[0::2] = packed_arr & 0xF0
+        unpacked[1::2] = (packed_arr & 0x0F) << 4
 
         # Each original pixel should round down to nearest 16
-        for i, (original, restored) in enumerate(zip(pixels_4bit, unpacked, strict=True)):
-            expected = (original // 16) * 16
-            assert restored == expected, f"Pixel {i}: {original} -> {restored}, expected {expected}"
+        expected = np.frombuffer(pixels_4bit, dtype=np.uint8) // 16 * 16
+        np.testing.assert_array_equal(unpacked, expected)
 
     def test_convert_endian_1bpp_no_change(self) -> None:
         """Test endian conversion with no bit reversal."""
@@ -157,6 +210,14 @@ class TestPixelPacking:
         assert IT8951.convert_endian_1bpp(bytes([0x80]), reverse_bits=True) == bytes([0x01])
         assert IT8951.convert_endian_1bpp(bytes([0x01]), reverse_bits=True) == bytes([0x80])
 
+    def test_convert_endian_1bpp_reverse_all_bytes(self) -> None:
+        """Test bit reversal of every byte value matches the bit string reversed."""
+        data = bytes(range(256))
+        result = IT8951.convert_endian_1bpp(data, reverse_bits=True)
+
+        assert result == bytes(int(f"{v:08b}"[::-1], 2) for v in data)
+        assert IT8951.convert_endian_1bpp(result, reverse_bits=True) == data
+
     def test_convert_endian_1bpp_empty(self) -> None:
         """Test endian conversion with empty data."""
         assert IT8951.convert_endian_1bpp(b"", reverse_bits=False) == b""
@@ -184,124 +245,20 @@ class TestPixelPackingNumpy:
         packed = pack_pixels_numpy(pixels, PixelFormat.BPP_8)
         assert packed == bytes([0, 64, 128, 192, 255])
 
-    def test_pack_pixels_numpy_4bpp_bytes(self) -> None:
-        """Test 4bpp packing with bytes input."""
-        pixels = bytes([0x00, 0xFF, 0x80, 0x40, 0xC0, 0x20])
-        expected = bytes([0x0F, 0x84, 0xC2])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_4)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_4bpp_array(self) -> None:
-        """Test 4bpp packing with numpy array."""
-        pixels = np.array([0x00, 0xFF, 0x80, 0x40, 0xC0, 0x20], dtype=np.uint8)
-        expected = bytes([0x0F, 0x84, 0xC2])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_4)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_4bpp_odd_length(self) -> None:
-        """Test 4bpp packing with odd number of pixels."""
-        pixels = np.array([0xF0, 0x80, 0x40], dtype=np.uint8)
-        expected = bytes([0xF8, 0x40])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_4)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_4bpp_empty(self) -> None:
-        """Test 4bpp packing with empty data."""
-        pixels = np.array([], dtype=np.uint8)
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_4)
-        assert packed == b""
+    @pytest.mark.parametrize(("pixels", "expected"), PACK_4BPP_CASES)
+    def test_pack_pixels_numpy_4bpp(self, pixels: bytes | np.ndarray, expected: bytes) -> None:
+        """Test 4bpp packing of bytes and arrays, including odd lengths and empty data."""
+        assert pack_pixels_numpy(pixels, PixelFormat.BPP_4) == expected
 
-    def test_pack_pixels_numpy_2bpp_bytes(self) -> None:
-        """Test 2bpp packing with bytes input."""
-        pixels = bytes([0x00, 0xFF, 0x80, 0x40, 0xC0, 0x20, 0x60, 0xA0])
-        expected = bytes([0x39, 0xC6])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_2)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_2bpp_array(self) -> None:
-        """Test 2bpp packing with numpy array."""
-        pixels = np.array([0x00, 0xFF, 0x80, 0x40, 0xC0, 0x20, 0x60, 0xA0], dtype=np.uint8)
-        expected = bytes([0x39, 0xC6])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_2)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_2bpp_partial(self) -> None:
-        """Test 2bpp packing with less than 4 pixels."""
-        # Test with 1 pixel
-        pixels = np.array([0xC0], dtype=np.uint8)
-        expected = bytes([0xC0])  # 11000000
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_2)
-        assert packed == expected
-
-        # Test with 2 pixels
-        pixels = np.array([0xC0, 0x80], dtype=np.uint8)
-        expected = bytes([0xE0])  # 11100000
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_2)
-        assert packed == expected
+    @pytest.mark.parametrize(("pixels", "expected"), PACK_2BPP_CASES)
+    def test_pack_pixels_numpy_2bpp(self, pixels: bytes | np.ndarray, expected: bytes) -> None:
+        """Test 2bpp packing of bytes and arrays, including partial bytes and empty data."""
+        assert pack_pixels_numpy(pixels, PixelFormat.BPP_2) == expected
 
-        # Test with 3 pixels
-        pixels = np.array([0xC0, 0x80, 0x40], dtype=np.uint8)
-        expected = bytes([0xE4])  # 11100100
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_2)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_2bpp_empty(self) -> None:
-        """Test 2bpp packing with empty data."""
-        pixels = np.array([], dtype=np.uint8)
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_2)
-        assert packed == b""
-
-    def test_pack_pixels_numpy_1bpp_bytes(self) -> None:
-        """Test 1bpp packing with bytes input."""
-        pixels = bytes([0, 255, 100, 200, 50, 150, 0, 255])
-        expected = bytes([0b01010101])  # MSB first
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_1bpp_array(self) -> None:
-        """Test 1bpp packing with numpy array."""
-        pixels = np.array([0, 255, 100, 200, 50, 150, 0, 255], dtype=np.uint8)
-        expected = bytes([0b01010101])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_1bpp_partial(self) -> None:
-        """Test 1bpp packing with partial byte."""
-        # Test with 1 pixel
-        pixels = np.array([255], dtype=np.uint8)
-        expected = bytes([0b10000000])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
-        assert packed == expected
-
-        # Test with 3 pixels
-        pixels = np.array([0, 255, 128], dtype=np.uint8)
-        expected = bytes([0b01100000])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
-        assert packed == expected
-
-        # Test with 7 pixels
-        pixels = np.array([255, 0, 255, 0, 255, 0, 255], dtype=np.uint8)
-        expected = bytes([0b10101010])
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
-        assert packed == expected
-
-    def test_pack_pixels_numpy_1bpp_threshold(self) -> None:
-        """Test 1bpp threshold behavior (128)."""
-        # Values below 128 -> 0
-        pixels = np.array([0, 50, 100, 127], dtype=np.uint8)
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
-        assert packed == bytes([0b00000000])
-
-        # Values >= 128 -> 1
-        pixels = np.array([128, 150, 200, 255], dtype=np.uint8)
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
-        assert packed == bytes([0b11110000])
-
-    def test_pack_pixels_numpy_1bpp_empty(self) -> None:
-        """Test 1bpp packing with empty data."""
-        pixels = np.array([], dtype=np.uint8)
-        packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
-        assert packed == b""
+    @pytest.mark.parametrize(("pixels", "expected"), PACK_1BPP_CASES)
+    def test_pack_pixels_numpy_1bpp(self, pixels: bytes | np.ndarray, expected: bytes) -> None:
+        """Test 1bpp packing of bytes and arrays, including partial bytes and the threshold."""
+        assert pack_pixels_numpy(pixels, PixelFormat.BPP_1) == expected
 
     def test_pack_pixels_numpy_invalid_format(self) -> None:
         """Test invalid pixel format raises error."""
@@ -324,7 +281,8 @@ class TestPixelPackingNumpy:
         """Test packing with larger data to verify performance optimizations."""
         # Create a 1024x768 image worth of pixels
         size = 1024 * 768
-        pixels = np.random.randint(0, 256, size=size, dtype=np.uint8)
+        # Only lengths are checked, so a repeating 0-255 ramp is enough
+        pixels = np.resize(np.arange(256, dtype=np.uint8), size)
 
         # Test all formats work with large data
         packed_8bpp = pack_pixels_numpy(pixels, PixelFormat.BPP_8)
@@ -339,9 +297,8 @@ class TestPixelPackingNumpy:
         packed_1bpp = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
         assert len(packed_1bpp) == size // 8
 
-    def test_pack_pixels_numpy_powers_of_2_cache(self) -> None:
-        """Test that 1bpp packing uses the cached powers array correctly."""
-        # This indirectly tests the _POWERS_OF_2_CACHE usage
+    def test_pack_pixels_numpy_1bpp_bit_order(self) -> None:
+        """Test that 1bpp packing places the first pixel in the MSB."""
         pixels = np.array([255, 255, 255, 255, 255, 255, 255, 255], dtype=np.uint8)
         packed = pack_pixels_numpy(pixels, PixelFormat.BPP_1)
         assert packed == bytes([0xFF])
@@ -0,0 +1,95 @@
+"""Tests for numba pixel packing kernels."""
+
+import numpy as np
+import pytest
+
+from IT8951_ePaper_Py import pixel_packing
+from IT8951_ePaper_Py.constants import PerformanceConstants, PixelFormat
+from IT8951_ePaper_Py.pixel_packing import pack_pixels_numpy
+from IT8951_ePaper_Py.pixel_packing_numba import (
+    pack_1bpp_numba,
+    pack_2bpp_numba,
+    pack_4bpp_numba,
+)
+
+# Small sizes keep the kernels fast when numba is absent and they run as plain Python
+KERNEL_SIZES = [0, 1, 3, 4, 5, 8, 37]
+
+
+class TestNumbaPixelPacking:
+    """Test numba kernels against the numpy packers."""
+
+    @pytest.mark.parametrize("size", KERNEL_SIZES)
+    def test_pack_4bpp_numba_matches_numpy(self, size: int) -> None:
+        """Test 4bpp kernel output matches the numpy packer, including odd tails."""
+        pixels = np.random.default_rng(size).integers(0, 256, size, dtype=np.uint8)
+        assert pack_4bpp_numba(pixels).tobytes() == pack_pixels_numpy(pixels, PixelFormat.BPP_4)
+
+    @pytest.mark.parametrize("size", KERNEL_SIZES)
+    def test_pack_2bpp_numba_matches_numpy(self, size: int) -> None:
+        """Test 2bpp kernel output matches the numpy packer, including partial bytes."""
+        pixels = np.random.default_rng(size).integers(0, 256, size, dtype=np.uint8)
+        assert pack_2bpp_numba(pixels).tobytes() == pack_pixels_numpy(pixels, PixelFormat.BPP_2)
+
+    @pytest.mark.parametrize("size", KERNEL_SIZES)
+    def test_pack_1bpp_numba_matches_numpy(self, size: int) -> None:
+        """Test 1bpp kernel output matches np.packbits thresholding, including partial bytes."""
+        pixels = np.random.default_rng(size).integers(0, 256, size, dtype=np.uint8)
+        assert pack_1bpp_numba(pixels).tobytes() == pack_pixels_numpy(pixels, PixelFormat.BPP_1)
+
+    def test_pack_numba_2d_input(self) -> None:
+        """Test kernels flatten 2D frames in row-major order."""
+        frame = np.arange(16, dtype=np.uint8).reshape(4, 4) * 16
+        assert pack_4bpp_numba(frame).tobytes() == pack_pixels_numpy(
+            frame.ravel(), PixelFormat.BPP_4
+        )
+        assert pack_2bpp_numba(frame).tobytes() == pack_pixels_numpy(
+            frame.ravel(), PixelFormat.BPP_2
+        )
+
+    def test_pack_numba_into_out(self) -> None:
+        """Test kernels write into a caller-supplied output array."""
+        pixels = np.random.default_rng(5).integers(0, 256, 37, dtype=np.uint8)
+        out_4bpp = np.empty(19, dtype=np.uint8)
+        out_2bpp = np.empty(10, dtype=np.uint8)
+
+        assert pack_4bpp_numba(pixels, out_4bpp) is out_4bpp
+        assert pack_2bpp_numba(pixels, out_2bpp) is out_2bpp
+        assert out_4bpp.tobytes() == pack_pixels_numpy(pixels, PixelFormat.BPP_4)
+        assert out_2bpp.tobytes() == pack_pixels_numpy(pixels, PixelFormat.BPP_2)
+
+    @pytest.mark.parametrize(
+        ("pixel_format", "kernel"),
+        [
+            (PixelFormat.BPP_4, pack_4bpp_numba),
+            (PixelFormat.BPP_2, pack_2bpp_numba),
+            (PixelFormat.BPP_1, pack_1bpp_numba),
+        ],
+    )
+    def test_dispatch_large_frames_to_numba(
+        self, monkeypatch: pytest.MonkeyPatch, pixel_format: PixelFormat, kernel: object
+    ) -> None:
+        """Test large frames are routed to numba kernels when numba is available."""
+        calls: list[int] = []
+        assert pixel_packing._NUMBA_PACKERS[pixel_format] is kernel
+        monkeypatch.setattr(pixel_packing, "NUMBA_AVAILABLE", True)
+        monkeypatch.setitem(
+            pixel_packing._NUMBA_PACKERS,
+            pixel_format,
+            lambda arr, _out=None: calls.append(arr.size) or np.frombuffer(b"numba", np.uint8),
+        )
+        pixels = np.zeros(PerformanceConstants.NUMBA_OPTIMIZATION_THRESHOLD, dtype=np.uint8)
+
+        assert pack_pixels_numpy(pixels, pixel_format) == b"numba"
+        assert calls == [pixels.size]
+
+    def test_dispatch_small_frames_stay_on_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test frames below the threshold keep using the numpy packers."""
+        monkeypatch.setattr(pixel_packing, "NUMBA_AVAILABLE", True)
+        monkeypatch.setitem(
+            pixel_packing._NUMBA_PACKERS,
+            PixelFormat.BPP_4,
+            lambda arr, _out=None: np.frombuffer(b"numba", np.uint8),
+        )
+
+        assert pack_pixels_numpy(bytes([0xFF, 0x00]), PixelFormat.BPP_4) == bytes([0xF0])
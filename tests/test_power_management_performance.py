@@ -1,9 +1,13 @@
 """Performance tests for power management features."""
 
+import statistics
 import time
+from collections.abc import Generator
 from pathlib import Path
 from typing import BinaryIO
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from PIL import Image
 from pytest_mock import MockerFixture
@@ -19,125 +23,125 @@ from IT8951_ePaper_Py.display import EPaperDisplay
 from IT8951_ePaper_Py.models import DisplayArea
 from IT8951_ePaper_Py.spi_interface import MockSPI
 
-
-@pytest.mark.slow
-class TestPowerManagementPerformance:
-    """Performance tests for power state transitions and auto-sleep."""
-
-    @pytest.fixture
-    def mock_spi(self) -> MockSPI:
-        """Create mock SPI interface."""
-        return MockSPI()
-
-    @pytest.fixture
-    def display(self, mock_spi: MockSPI, mocker: MockerFixture) -> EPaperDisplay:
-        """Create and initialize EPaperDisplay with power management."""
-        display = EPaperDisplay(vcom=-2.0, spi_interface=mock_spi)
-
-        # Data for _get_device_info (20 values)
-        mock_spi.set_read_data(
-            [
-                1872,  # panel_width
-                1404,  # panel_height
-                MemoryConstants.IMAGE_BUFFER_ADDR_L,  # memory_addr_l
-                MemoryConstants.IMAGE_BUFFER_ADDR_H,  # memory_addr_h
-                49,
-                46,
-                48,
-                0,
-                0,
-                0,
-                0,
-                0,  # fw_version "1.0"
-                77,
-                56,
-                52,
-                49,
-                0,
-                0,
-                0,
-                0,  # lut_version "M841"
-            ]
-        )
-        # Data for _enable_packed_write register read
-        mock_spi.set_read_data([0x0000])
-
-        # Data for get_vcom() call in init() - return 2000 (2.0V)
-        mock_spi.set_read_data([2000])
-
+# Measured rounds for the sleep/wake cycle timing, after one warm-up cycle
+RAPID_CYCLE_ROUNDS = 10
+
+
+@pytest.fixture(scope="class")
+def shared_spi() -> MockSPI:
+    """Create one mock SPI interface shared by every test in a class."""
+    return MockSPI()
+
+
+@pytest.fixture(scope="class")
+def shared_display(shared_spi: MockSPI) -> Generator[EPaperDisplay, None, None]:
+    """Create one initialized display shared by every test in a class."""
+    display = EPaperDisplay(vcom=-2.0, spi_interface=shared_spi)
+
+    # Data for _get_device_info (20 values)
+    shared_spi.set_read_data(
+        [
+            1872,  # panel_width
+            1404,  # panel_height
+            MemoryConstants.IMAGE_BUFFER_ADDR_L,  # memory_addr_l
+            MemoryConstants.IMAGE_BUFFER_ADDR_H,  # memory_addr_h
+            49,
+            46,
+            48,
+            0,
+            0,
+            0,
+            0,
+            0,  # fw_version "1.0"
+            77,
+            56,
+            52,
+            49,
+            0,
+            0,
+            0,
+            0,  # lut_version "M841"
+        ]
+    )
+    # Data for _enable_packed_write register read
+    shared_spi.set_read_data([0x0000])
+
+    # Data for get_vcom() call in init() - return 2000 (2.0V)
+    shared_spi.set_read_data([2000])
+
+    with pytest.MonkeyPatch.context() as mp:
         # Mock clear to avoid complex setup
-        mocker.patch.object(display, "clear")
+        mp.setattr(display, "clear", MagicMock())
 
         display.init()
 
-        # Mock power state transitions with realistic timing using proper mocks
-        # This ensures cleanup happens automatically
-        original_sleep = display._controller.sleep
-        original_standby = display._controller.standby
-        original_wake = display._controller.wake
+        # Mock display operations to prevent timeouts
+        mp.setattr(display._controller, "_wait_display_ready", MagicMock(return_value=None))
+        mp.setattr(display._controller, "display_area", MagicMock(return_value=None))
 
-        def mock_sleep() -> None:
-            # Don't add delay in tests to avoid timeout
-            original_sleep()
+        yield display
 
-        def mock_standby() -> None:
-            # Don't add delay in tests to avoid timeout
-            original_standby()
 
-        def mock_wake() -> None:
-            # Don't add delay in tests to avoid timeout
-            original_wake()
+@pytest.fixture(scope="module")
+def gray_image() -> Image.Image:
+    """Create one solid gray test image shared by the display timing tests."""
+    return Image.new("L", (200, 200), 128)
 
-        # Use mocker.patch for proper cleanup
-        mocker.patch.object(display._controller, "sleep", side_effect=mock_sleep)
-        mocker.patch.object(display._controller, "standby", side_effect=mock_standby)
-        mocker.patch.object(display._controller, "wake", side_effect=mock_wake)
 
-        # Mock display operations to prevent timeouts
-        mocker.patch.object(display._controller, "_wait_display_ready", return_value=None)
-        mocker.patch.object(display._controller, "display_area", return_value=None)
+# Keep the class on one xdist worker so its shared display is built only once
+@pytest.mark.slow
+@pytest.mark.xdist_group(name="power_management_performance")
+class TestPowerManagementPerformance:
+    """Performance tests for power state transitions and auto-sleep."""
 
-        return display
+    @pytest.fixture
+    def display(self, shared_display: EPaperDisplay, shared_spi: MockSPI) -> EPaperDisplay:
+        """Provide the shared display awake, with auto-sleep off and no pending data."""
+        if shared_display.power_state != PowerState.ACTIVE:
+            shared_display.wake()
+        shared_display.set_auto_sleep_timeout(None)
+        shared_spi.reset_state()
+        return shared_display
 
     def test_power_state_transition_timing(self, display: EPaperDisplay):
         """Measure time for power state transitions."""
         transitions = []
 
         # Active -> Sleep
-        start = time.time()
+        start = time.perf_counter_ns()
         display.sleep()
-        sleep_time = time.time() - start
+        sleep_time = time.perf_counter_ns() - start
         transitions.append(("Active->Sleep", sleep_time))
 
         # Sleep -> Active
-        start = time.time()
+        start = time.perf_counter_ns()
         display.wake()
-        wake_time = time.time() - start
+        wake_time = time.perf_counter_ns() - start
         transitions.append(("Sleep->Active", wake_time))
 
         # Active -> Standby
-        start = time.time()
+        start = time.perf_counter_ns()
         display.standby()
-        standby_time = time.time() - start
+        standby_time = time.perf_counter_ns() - start
         transitions.append(("Active->Standby", standby_time))
 
         # Standby -> Active
-        start = time.time()
+        start = time.perf_counter_ns()
         display.wake()
-        wake_from_standby = time.time() - start
+        wake_from_standby = time.perf_counter_ns() - start
         transitions.append(("Standby->Active", wake_from_standby))
 
         # Print results
         print("\nPower state transition times:")
         for transition, duration in transitions:
-            print(f"  {transition}: {duration * 1000:.2f}ms")
+            print(f"  {transition}: {duration / 1e6:.2f}ms")
 
         # Verify operations completed successfully
         # Note: Without simulated delays, timing relationships may not hold
         # We just verify the operations completed without errors
         assert all(duration > 0 for _, duration in transitions)
 
-    def test_auto_sleep_performance(self, display: EPaperDisplay):
+    def test_auto_sleep_performance(self, display: EPaperDisplay, mocker: MockerFixture):
         """Test auto-sleep timer performance."""
         # Set very short auto-sleep timeout
         display.set_auto_sleep_timeout(0.1)  # 100ms
@@ -145,28 +149,20 @@ class TestPowerManagementPerformance:
         # Verify display is active
         assert display.power_state == PowerState.ACTIVE
 
-        # Wait for auto-sleep
-        time.sleep(0.15)
-
-        # Check if display went to sleep
-        # Note: In real hardware, this would happen automatically
-        # For test, we simulate by checking time since last activity
-        if hasattr(display, "_last_activity_time"):
-            elapsed = time.time() - display._last_activity_time
-            if elapsed > 0.1:
-                display.sleep()
+        # Advance the clock past the timeout instead of really waiting for it
+        mocker.patch("time.time", return_value=display._last_activity_time + 0.15)
+        display.check_auto_sleep()
 
         assert display.power_state == PowerState.SLEEP
 
-    def test_wake_on_demand_latency(self, display: EPaperDisplay, mocker: MockerFixture):
+    def test_wake_on_demand_latency(
+        self, display: EPaperDisplay, mocker: MockerFixture, gray_image: Image.Image
+    ):
         """Test wake-on-demand latency for operations."""
         # Put display to sleep
         display.sleep()
         assert display.power_state == PowerState.SLEEP
 
-        # Create test image
-        img = Image.new("L", (200, 200), 128)
-
         # Mock display_image to simulate wake-on-demand
         original_display_image = display.display_image
 
@@ -185,14 +181,14 @@ class TestPowerManagementPerformance:
         mocker.patch.object(display, "display_image", side_effect=mock_display_image_with_wake)
 
         # Measure time to display (includes wake time)
-        start = time.time()
-        display.display_image(img, 0, 0, DisplayMode.DU)
-        total_time = time.time() - start
+        start = time.perf_counter_ns()
+        display.display_image(gray_image, 0, 0, DisplayMode.DU)
+        total_time = time.perf_counter_ns() - start
 
         # Display should be active after operation
         assert display.power_state == PowerState.ACTIVE
 
-        print(f"\nWake-on-demand + display time: {total_time * 1000:.2f}ms")
+        print(f"\nWake-on-demand + display time: {total_time / 1e6:.2f}ms")
 
     def test_power_consumption_simulation(self):
         """Simulate power consumption in different usage patterns."""
@@ -213,7 +209,6 @@ class TestPowerManagementPerformance:
 
         for pattern in patterns:
             power_consumed = 0
-            current_time = 0
 
             if pattern == "Always Active":
                 # Stay active entire time
@@ -221,23 +216,12 @@ class TestPowerManagementPerformance:
 
             elif pattern.startswith("Auto-Sleep"):
                 timeout = 30 if "30s" in pattern else 10
-                last_update = 0
-
-                while current_time < simulation_time:
-                    time_since_update = current_time - last_update
-
-                    if current_time % update_interval == 0:
-                        # Update display
-                        power_consumed += power_active * 1  # 1 second for update
-                        last_update = current_time
-                    elif time_since_update > timeout:
-                        # In sleep mode
-                        power_consumed += power_sleep
-                    else:
-                        # Active but idle
-                        power_consumed += power_active
-
-                    current_time += 1
+                # Each update cycle: 1 second updating, then active-idle until the
+                # timeout expires, then asleep until the next update
+                updates = simulation_time // update_interval
+                active_time = 1 + min(timeout, update_interval - 1)
+                sleep_time = update_interval - active_time
+                power_consumed = updates * (power_active * active_time + power_sleep * sleep_time)
 
             elif pattern == "Manual Sleep":
                 # Update, then sleep until next update
@@ -255,36 +239,45 @@ class TestPowerManagementPerformance:
             savings = ((baseline - consumption) / baseline) * 100
             print(f"  {pattern}: {consumption} units ({savings:.1f}% savings)")
 
+        # Same totals the former second-by-second simulation produced
+        assert patterns["Auto-Sleep (30s)"] == 15645
+        assert patterns["Auto-Sleep (10s)"] == 5745
+
     def test_rapid_sleep_wake_cycles(self, display: EPaperDisplay):
         """Test performance of rapid sleep/wake cycles."""
-        cycle_times = []
-
-        # Reduce number of cycles to avoid timeout
-        for _ in range(5):
-            start = time.time()
 
-            # Sleep
+        def cycle() -> None:
             display.sleep()
             assert display.power_state == PowerState.SLEEP
-
-            # Wake
             display.wake()
             assert display.power_state == PowerState.ACTIVE
 
-            cycle_time = time.time() - start
-            cycle_times.append(cycle_time)
+        # Warm up once so first-call costs don't land in the measured rounds
+        cycle()
 
-        avg_cycle_time = sum(cycle_times) / len(cycle_times)
-        print(f"\nAverage sleep/wake cycle time: {avg_cycle_time * 1000:.2f}ms")
+        cycle_times = []
+        for _ in range(RAPID_CYCLE_ROUNDS):
+            start = time.perf_counter_ns()
+            cycle()
+            cycle_times.append(time.perf_counter_ns() - start)
+
+        median_cycle_time = statistics.median(cycle_times)
+        print(
+            f"\nSleep/wake cycle time: median {median_cycle_time / 1e6:.2f}ms, "
+            f"min {min(cycle_times) / 1e6:.2f}ms, max {max(cycle_times) / 1e6:.2f}ms"
+        )
 
-        # Verify no significant degradation
-        # Allow more variance in test environment
-        assert max(cycle_times) < avg_cycle_time * 2.0
+        # Verify no significant degradation: compare medians of the early and late
+        # rounds so a single scheduling hiccup on a busy host can't fail the test
+        half = RAPID_CYCLE_ROUNDS // 2
+        early = statistics.median(cycle_times[:half])
+        late = statistics.median(cycle_times[half:])
+        assert late < early * 2.0
 
-    def test_standby_vs_sleep_performance(self, display: EPaperDisplay, mocker: MockerFixture):
+    def test_standby_vs_sleep_performance(
+        self, display: EPaperDisplay, mocker: MockerFixture, gray_image: Image.Image
+    ):
         """Compare standby vs sleep mode performance."""
-        img = Image.new("L", (200, 200), 128)
-
         # Mock display_image to simulate wake-on-demand
         original_display_image = display.display_image
 
@@ -304,19 +297,19 @@ class TestPowerManagementPerformance:
 
         # Test wake from standby
         display.standby()
-        start = time.time()
-        display.display_image(img, 0, 0, DisplayMode.DU)
-        standby_wake_time = time.time() - start
+        start = time.perf_counter_ns()
+        display.display_image(gray_image, 0, 0, DisplayMode.DU)
+        standby_wake_time = time.perf_counter_ns() - start
 
         # Test wake from sleep
         display.sleep()
-        start = time.time()
-        display.display_image(img, 0, 0, DisplayMode.DU)
-        sleep_wake_time = time.time() - start
+        start = time.perf_counter_ns()
+        display.display_image(gray_image, 0, 0, DisplayMode.DU)
+        sleep_wake_time = time.perf_counter_ns() - start
 
         print("\nWake + display times:")
-        print(f"  From standby: {standby_wake_time * 1000:.2f}ms")
-        print(f"  From sleep: {sleep_wake_time * 1000:.2f}ms")
+        print(f"  From standby: {standby_wake_time / 1e6:.2f}ms")
+        print(f"  From sleep: {sleep_wake_time / 1e6:.2f}ms")
 
         # Both should have wake overhead, but sleep should take slightly longer
         # In mock environment, timing can vary due to Python overhead
@@ -329,25 +322,20 @@ class TestPowerManagementPerformance:
         """Test if power states affect display memory."""
         # Create test pattern
         test_area = DisplayArea(x=100, y=100, width=200, height=200)
-        test_img = Image.new("L", (test_area.width, test_area.height))
 
-        # Create checkerboard pattern
-        pixels = test_img.load()
-        if pixels is not None:
-            for y in range(test_area.height):
-                for x in range(test_area.width):
-                    pixels[x, y] = 255 if (x // 10 + y // 10) % 2 == 0 else 0
+        # Create checkerboard pattern of 10x10 squares
+        ys, xs = np.ogrid[: test_area.height, : test_area.width]
+        checker = np.where((xs // 10 + ys // 10) % 2 == 0, 255, 0).astype(np.uint8)
+        test_img = Image.fromarray(checker, mode="L")
 
         # Display pattern
         display.display_partial(test_img, test_area.x, test_area.y)
 
-        # Go through power states
+        # Go through power states (the mocked controller has no settle time to wait out)
         display.standby()
-        time.sleep(0.1)
         display.wake()
 
         display.sleep()
-        time.sleep(0.1)
         display.wake()
 
         # In real hardware, we would verify the display still shows the pattern
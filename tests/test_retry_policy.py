@@ -1,8 +1,9 @@
 """Tests for retry policy and mechanisms."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from pytest_mock import MockerFixture
 
 from IT8951_ePaper_Py.exceptions import CommunicationError, IT8951TimeoutError
 from IT8951_ePaper_Py.retry_policy import (
@@ -15,6 +16,47 @@ from IT8951_ePaper_Py.retry_policy import (
 from IT8951_ePaper_Py.spi_interface import MockSPI
 
 
+class FakeCallable:
+    """Lightweight stand-in for Mock(side_effect=[...]) in the retry tests.
+
+    Returns or raises each outcome in order, repeating the last one once the
+    sequence is exhausted, and counts calls. Use Mock where call arguments
+    matter.
+    """
+
+    __slots__ = ("call_count", "outcomes")
+
+    def __init__(self, *outcomes: object) -> None:
+        """Store the outcomes to replay."""
+        self.outcomes = outcomes
+        self.call_count = 0
+
+    def __call__(self, *_args: object, **_kwargs: object) -> object:
+        outcome = self.outcomes[min(self.call_count, len(self.outcomes) - 1)]
+        self.call_count += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def no_sleep(mocker: MockerFixture) -> MagicMock:
+    """Patch out the sleep between retry attempts."""
+    return mocker.patch("IT8951_ePaper_Py.retry_policy.time.sleep")
+
+
+@pytest.fixture
+def mock_spi() -> MockSPI:
+    """Create a mock SPI interface."""
+    return MockSPI()
+
+
+@pytest.fixture(scope="module")
+def policy() -> RetryPolicy:
+    """Create the three-attempt policy shared by the retry tests."""
+    return RetryPolicy(max_attempts=3)
+
+
 class TestRetryPolicy:
     """Test RetryPolicy configuration."""
 
@@ -75,40 +117,38 @@ class TestRetryPolicy:
             policy = RetryPolicy(backoff_strategy=strategy)
             assert policy.backoff_strategy == strategy
 
-    def test_calculate_delay_fixed(self):
-        """Test fixed backoff strategy."""
-        policy = RetryPolicy(delay=0.5, backoff_strategy=BackoffStrategy.FIXED)
-        assert policy.calculate_delay(0) == 0.5
-        assert policy.calculate_delay(1) == 0.5
-        assert policy.calculate_delay(5) == 0.5
-
-    def test_calculate_delay_linear(self):
-        """Test linear backoff strategy."""
-        policy = RetryPolicy(delay=0.1, backoff_strategy=BackoffStrategy.LINEAR)
-        assert policy.calculate_delay(0) == 0.1  # 0.1 * (0+1)
-        assert policy.calculate_delay(1) == 0.2  # 0.1 * (1+1)
-        assert abs(policy.calculate_delay(2) - 0.3) < 0.001  # 0.1 * (2+1) with float tolerance
-
-    def test_calculate_delay_exponential(self):
-        """Test exponential backoff strategy."""
-        policy = RetryPolicy(
-            delay=0.1, backoff_factor=2.0, backoff_strategy=BackoffStrategy.EXPONENTIAL
-        )
-        assert policy.calculate_delay(0) == 0.1  # 0.1 * 2^0
-        assert policy.calculate_delay(1) == 0.2  # 0.1 * 2^1
-        assert policy.calculate_delay(2) == 0.4  # 0.1 * 2^2
-
-    def test_calculate_delay_with_max_delay(self):
-        """Test that max_delay caps the calculated delay."""
+    @pytest.mark.parametrize(
+        ("strategy", "delay", "factor", "max_delay", "attempt", "expected"),
+        [
+            pytest.param(BackoffStrategy.FIXED, 0.5, 2.0, 10.0, 0, 0.5, id="fixed-0"),
+            pytest.param(BackoffStrategy.FIXED, 0.5, 2.0, 10.0, 1, 0.5, id="fixed-1"),
+            pytest.param(BackoffStrategy.FIXED, 0.5, 2.0, 10.0, 5, 0.5, id="fixed-5"),
+            pytest.param(BackoffStrategy.LINEAR, 0.1, 2.0, 10.0, 0, 0.1, id="linear-0"),  # 0.1 * 1
+            pytest.param(BackoffStrategy.LINEAR, 0.1, 2.0, 10.0, 1, 0.2, id="linear-1"),  # 0.1 * 2
+            pytest.param(BackoffStrategy.LINEAR, 0.1, 2.0, 10.0, 2, 0.3, id="linear-2"),  # 0.1 * 3
+            pytest.param(BackoffStrategy.EXPONENTIAL, 0.1, 2.0, 10.0, 0, 0.1, id="exp-0"),  # 2^0
+            pytest.param(BackoffStrategy.EXPONENTIAL, 0.1, 2.0, 10.0, 1, 0.2, id="exp-1"),  # 2^1
+            pytest.param(BackoffStrategy.EXPONENTIAL, 0.1, 2.0, 10.0, 2, 0.4, id="exp-2"),  # 2^2
+            # max_delay caps the calculated delay
+            pytest.param(BackoffStrategy.EXPONENTIAL, 1.0, 10.0, 5.0, 0, 1.0, id="capped-0"),
+            pytest.param(BackoffStrategy.EXPONENTIAL, 1.0, 10.0, 5.0, 1, 5.0, id="capped-1"),
+            pytest.param(BackoffStrategy.EXPONENTIAL, 1.0, 10.0, 5.0, 2, 5.0, id="capped-2"),
+        ],
+    )
+    def test_calculate_delay(
+        self,
+        strategy: BackoffStrategy,
+        delay: float,
+        factor: float,
+        max_delay: float,
+        attempt: int,
+        expected: float,
+    ) -> None:
+        """Test delay calculation for the deterministic backoff strategies."""
         policy = RetryPolicy(
-            delay=1.0,
-            backoff_factor=10.0,
-            max_delay=5.0,
-            backoff_strategy=BackoffStrategy.EXPONENTIAL,
+            delay=delay, backoff_factor=factor, max_delay=max_delay, backoff_strategy=strategy
         )
-        assert policy.calculate_delay(0) == 1.0  # 1.0 * 10^0
-        assert policy.calculate_delay(1) == 5.0  # 10.0 capped at 5.0
-        assert policy.calculate_delay(2) == 5.0  # 100.0 capped at 5.0
+        assert policy.calculate_delay(attempt) == pytest.approx(expected)
 
     def test_calculate_delay_jitter(self):
         """Test jitter backoff strategy."""
@@ -127,105 +167,94 @@ class TestRetryPolicy:
         assert len(set(delays)) > 1
 
 
+@pytest.mark.usefixtures("no_sleep")
 class TestWithRetry:
     """Test the with_retry decorator."""
 
-    def test_successful_on_first_attempt(self):
+    def test_successful_on_first_attempt(self, policy):
         """Test function that succeeds on first attempt."""
-        mock_func = Mock(return_value="success")
-        policy = RetryPolicy(max_attempts=3)
+        func = FakeCallable("success")
 
-        decorated = with_retry(policy)(mock_func)
+        decorated = with_retry(policy)(func)
         result = decorated()
 
         assert result == "success"
-        assert mock_func.call_count == 1
+        assert func.call_count == 1
 
-    def test_retry_on_failure(self):
+    def test_retry_on_failure(self, policy):
         """Test function that fails then succeeds."""
-        mock_func = Mock(side_effect=[CommunicationError("fail"), "success"])
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
+        func = FakeCallable(CommunicationError("fail"), "success")
 
-        decorated = with_retry(policy)(mock_func)
+        decorated = with_retry(policy)(func)
         result = decorated()
 
         assert result == "success"
-        assert mock_func.call_count == 2
+        assert func.call_count == 2
 
-    def test_exhaust_retries(self):
+    def test_exhaust_retries(self, policy):
         """Test function that exhausts all retries."""
-        mock_func = Mock(side_effect=CommunicationError("fail"))
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
+        func = FakeCallable(CommunicationError("fail"))
 
-        decorated = with_retry(policy)(mock_func)
+        decorated = with_retry(policy)(func)
 
         with pytest.raises(CommunicationError, match="fail"):
             decorated()
 
-        assert mock_func.call_count == 3
+        assert func.call_count == 3
 
-    def test_retry_with_backoff(self):
+    @pytest.mark.parametrize("max_attempts", [3, 5, 10])
+    def test_retry_with_backoff(self, no_sleep: MagicMock, max_attempts: int):
         """Test that backoff factor is applied correctly."""
-        mock_func = Mock(
-            side_effect=[CommunicationError("fail"), CommunicationError("fail"), "success"]
-        )
-        policy = RetryPolicy(max_attempts=3, delay=0.01, backoff_factor=2.0)
+        fail = CommunicationError("fail")
+        func = FakeCallable(*[fail] * (max_attempts - 1), "success")
+        policy = RetryPolicy(max_attempts=max_attempts, delay=0.01, backoff_factor=2.0)
 
-        # Mock time.sleep to verify delay values
-        with patch("IT8951_ePaper_Py.retry_policy.time.sleep") as mock_sleep:
-            decorated = with_retry(policy)(mock_func)
-            result = decorated()
+        decorated = with_retry(policy)(func)
+        result = decorated()
 
         assert result == "success"
-        assert mock_func.call_count == 3
+        assert func.call_count == max_attempts
 
-        # Verify sleep was called with correct delays
-        assert mock_sleep.call_count == 2
-        # First retry uses calculate_delay(0) = 0.01 * 2^0 = 0.01
-        # Second retry uses calculate_delay(1) = 0.01 * 2^1 = 0.02
-        calls = mock_sleep.call_args_list
-        assert calls[0][0][0] == 0.01  # First retry
-        assert calls[1][0][0] == 0.02  # Second retry with backoff
+        # Retry n sleeps for calculate_delay(n) = 0.01 * 2^n, in order
+        expected = [0.01 * 2.0**n for n in range(max_attempts - 1)]
+        assert [c.args[0] for c in no_sleep.call_args_list] == pytest.approx(expected)
 
-    def test_retry_with_different_strategies(self):
+    def test_retry_with_different_strategies(self, no_sleep: MagicMock):
         """Test retry with different backoff strategies."""
         # Test with fixed strategy
-        mock_func = Mock(side_effect=[CommunicationError("fail"), "success"])
+        func = FakeCallable(CommunicationError("fail"), "success")
         policy = RetryPolicy(max_attempts=2, delay=0.05, backoff_strategy=BackoffStrategy.FIXED)
 
-        with patch("IT8951_ePaper_Py.retry_policy.time.sleep") as mock_sleep:
-            decorated = with_retry(policy)(mock_func)
-            result = decorated()
+        decorated = with_retry(policy)(func)
+        result = decorated()
 
         assert result == "success"
-        mock_sleep.assert_called_once_with(0.05)
+        no_sleep.assert_called_once_with(0.05)
+        no_sleep.reset_mock()
 
         # Test with linear strategy
-        mock_func = Mock(
-            side_effect=[CommunicationError("fail"), CommunicationError("fail"), "success"]
-        )
+        fail = CommunicationError("fail")
+        func = FakeCallable(fail, fail, "success")
         policy = RetryPolicy(max_attempts=3, delay=0.01, backoff_strategy=BackoffStrategy.LINEAR)
 
-        with patch("IT8951_ePaper_Py.retry_policy.time.sleep") as mock_sleep:
-            decorated = with_retry(policy)(mock_func)
-            result = decorated()
+        decorated = with_retry(policy)(func)
+        result = decorated()
 
         assert result == "success"
-        calls = mock_sleep.call_args_list
-        assert calls[0][0][0] == 0.01  # 0.01 * 1
-        assert calls[1][0][0] == 0.02  # 0.01 * 2
+        # 0.01 * 1, then 0.01 * 2
+        assert [c.args[0] for c in no_sleep.call_args_list] == pytest.approx([0.01, 0.02])
 
     def test_only_retry_specified_exceptions(self):
         """Test that only specified exceptions are retried."""
-        mock_func = Mock(side_effect=ValueError("not retryable"))
+        func = FakeCallable(ValueError("not retryable"))
         policy = RetryPolicy(max_attempts=3, exceptions=(CommunicationError,))
 
-        decorated = with_retry(policy)(mock_func)
+        decorated = with_retry(policy)(func)
 
         with pytest.raises(ValueError, match="not retryable"):
             decorated()
 
-        assert mock_func.call_count == 1  # No retries
+        assert func.call_count == 1  # No retries
 
     def test_preserve_function_metadata(self):
         """Test that decorator preserves function metadata."""
@@ -239,18 +268,13 @@ class TestWithRetry:
         assert example_function.__doc__ == "Example function docstring."
 
 
+@pytest.mark.usefixtures("no_sleep")
 class TestRetrySPIInterface:
     """Test RetrySPIInterface wrapper."""
 
     @pytest.fixture
-    def mock_spi(self):
-        """Create a mock SPI interface."""
-        return MockSPI()
-
-    @pytest.fixture
-    def retry_spi(self, mock_spi):
-        """Create a retry SPI interface with short delays."""
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
+    def retry_spi(self, mock_spi, policy):
+        """Create a retry SPI interface."""
         return RetrySPIInterface(mock_spi, policy)
 
     def test_init_success(self, retry_spi):
@@ -258,64 +282,35 @@ class TestRetrySPIInterface:
         retry_spi.init()
         # Should succeed without issues
 
-    def test_init_retry(self, mocker):
-        """Test initialization with retry."""
-        mock_spi = Mock()
-        mock_spi.init.side_effect = [CommunicationError("fail"), None]
-
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
-        retry_spi = RetrySPIInterface(mock_spi, policy)
-
-        retry_spi.init()
-
-        assert mock_spi.init.call_count == 2
-
-    def test_write_command_retry(self, mocker):
-        """Test write_command with retry."""
-        mock_spi = Mock()
-        mock_spi.write_command.side_effect = [CommunicationError("fail"), None]
-
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
-        retry_spi = RetrySPIInterface(mock_spi, policy)
-
-        retry_spi.write_command(0x10)
-
-        assert mock_spi.write_command.call_count == 2
-        mock_spi.write_command.assert_called_with(0x10)
-
-    def test_read_data_retry(self, mocker):
-        """Test read_data with retry."""
+    @pytest.mark.parametrize(
+        ("method", "args", "ret"),
+        [
+            pytest.param("init", (), None, id="init"),
+            pytest.param("reset", (), None, id="reset"),
+            pytest.param("write_command", (0x10,), None, id="write_command"),
+            pytest.param("write_data", (0xABCD,), None, id="write_data"),
+            pytest.param("write_data_bulk", ([0x1234, 0x5678],), None, id="write_data_bulk"),
+            pytest.param("read_data", (), 0x1234, id="read_data"),
+            pytest.param("read_data_bulk", (4,), [0x12, 0x34, 0x56, 0x78], id="read_data_bulk"),
+            pytest.param("wait_busy", (1000,), None, id="wait_busy"),
+        ],
+    )
+    def test_method_retry(self, method, args, ret, policy):
+        """Test each wrapped method retries once on a communication error."""
         mock_spi = Mock()
-        mock_spi.read_data.side_effect = [CommunicationError("fail"), 0x1234]
+        getattr(mock_spi, method).side_effect = [CommunicationError("fail"), ret]
 
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
         retry_spi = RetrySPIInterface(mock_spi, policy)
 
-        result = retry_spi.read_data()
-
-        assert result == 0x1234
-        assert mock_spi.read_data.call_count == 2
-
-    def test_write_data_bulk_retry(self, mocker):
-        """Test write_data_bulk with retry."""
-        mock_spi = Mock()
-        mock_spi.write_data_bulk.side_effect = [CommunicationError("fail"), None]
-
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
-        retry_spi = RetrySPIInterface(mock_spi, policy)
-
-        data = [0x1234, 0x5678]
-        retry_spi.write_data_bulk(data)
-
-        assert mock_spi.write_data_bulk.call_count == 2
-        mock_spi.write_data_bulk.assert_called_with(data)
+        assert getattr(retry_spi, method)(*args) == ret
+        assert getattr(mock_spi, method).call_count == 2
+        getattr(mock_spi, method).assert_called_with(*args)
 
-    def test_wait_busy_no_retry_on_timeout(self, mocker):
+    def test_wait_busy_no_retry_on_timeout(self, policy):
         """Test that wait_busy doesn't retry on timeout errors."""
         mock_spi = Mock()
         mock_spi.wait_busy.side_effect = IT8951TimeoutError("timeout")
 
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
         retry_spi = RetrySPIInterface(mock_spi, policy)
 
         with pytest.raises(IT8951TimeoutError, match="timeout"):
@@ -324,24 +319,11 @@ class TestRetrySPIInterface:
         # Should not retry timeout errors
         assert mock_spi.wait_busy.call_count == 1
 
-    def test_wait_busy_retry_on_communication_error(self, mocker):
-        """Test that wait_busy retries on communication errors."""
-        mock_spi = Mock()
-        mock_spi.wait_busy.side_effect = [CommunicationError("fail"), None]
-
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
-        retry_spi = RetrySPIInterface(mock_spi, policy)
-
-        retry_spi.wait_busy(1000)
-
-        assert mock_spi.wait_busy.call_count == 2
-
-    def test_close_no_retry(self, mocker):
+    def test_close_no_retry(self, policy):
         """Test that close doesn't use retry logic."""
         mock_spi = Mock()
         mock_spi.close.side_effect = Exception("fail")
 
-        policy = RetryPolicy(max_attempts=3)
         retry_spi = RetrySPIInterface(mock_spi, policy)
 
         with pytest.raises(Exception, match="fail"):
@@ -350,56 +332,16 @@ class TestRetrySPIInterface:
         # Close should not retry
         assert mock_spi.close.call_count == 1
 
-    def test_reset_retry(self, mocker):
-        """Test reset() method with retry logic."""
-        mock_spi = Mock()
-        mock_spi.reset.side_effect = [CommunicationError("fail"), None]
-
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
-        retry_spi = RetrySPIInterface(mock_spi, policy)
-
-        retry_spi.reset()
-
-        assert mock_spi.reset.call_count == 2
-
-    def test_write_data_retry(self, mocker):
-        """Test write_data() method with retry logic."""
-        mock_spi = Mock()
-        mock_spi.write_data.side_effect = [CommunicationError("fail"), None]
-
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
-        retry_spi = RetrySPIInterface(mock_spi, policy)
-
-        retry_spi.write_data(0xABCD)
-
-        assert mock_spi.write_data.call_count == 2
-        mock_spi.write_data.assert_called_with(0xABCD)
-
-    def test_read_data_bulk_retry(self, mocker):
-        """Test read_data_bulk() method with retry logic."""
-        mock_spi = Mock()
-        expected_data = [0x12, 0x34, 0x56, 0x78]
-        mock_spi.read_data_bulk.side_effect = [CommunicationError("fail"), expected_data]
-
-        policy = RetryPolicy(max_attempts=3, delay=0.01)
-        retry_spi = RetrySPIInterface(mock_spi, policy)
-
-        result = retry_spi.read_data_bulk(4)
-
-        assert result == expected_data
-        assert mock_spi.read_data_bulk.call_count == 2
-        mock_spi.read_data_bulk.assert_called_with(4)
-
 
 class TestCreateRetrySPIInterface:
     """Test the factory function."""
 
-    def test_create_with_defaults(self, mocker):
+    def test_create_with_defaults(self, mocker, mock_spi):
         """Test creation with default parameters."""
         # Mock the create_spi_interface function
         mock_create = mocker.patch(
             "IT8951_ePaper_Py.spi_interface.create_spi_interface",
-            return_value=MockSPI(),
+            return_value=mock_spi,
         )
 
         spi = create_retry_spi_interface()
@@ -407,21 +349,20 @@ class TestCreateRetrySPIInterface:
         assert isinstance(spi, RetrySPIInterface)
         mock_create.assert_called_once_with(spi_speed_hz=None)
 
-    def test_create_with_custom_policy(self):
+    def test_create_with_custom_policy(self, mock_spi):
         """Test creation with custom retry policy."""
-        base_spi = MockSPI()
         policy = RetryPolicy(max_attempts=5, delay=0.2)
 
-        spi = create_retry_spi_interface(spi_interface=base_spi, retry_policy=policy)
+        spi = create_retry_spi_interface(spi_interface=mock_spi, retry_policy=policy)
 
         assert isinstance(spi, RetrySPIInterface)
         assert spi._policy == policy
 
-    def test_create_with_spi_speed(self, mocker):
+    def test_create_with_spi_speed(self, mocker, mock_spi):
         """Test creation with SPI speed override."""
         mock_create = mocker.patch(
             "IT8951_ePaper_Py.spi_interface.create_spi_interface",
-            return_value=MockSPI(),
+            return_value=mock_spi,
         )
 
         spi = create_retry_spi_interface(spi_speed_hz=2000000)
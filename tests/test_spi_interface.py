@@ -1,12 +1,15 @@
 """Tests for SPI interface module."""
 
+import io
+import itertools
 import sys
-import time
+from typing import NamedTuple
+from unittest.mock import Mock, call
 
 import pytest
 from pytest_mock import MockerFixture
 
-from IT8951_ePaper_Py.constants import GPIOPin, SPIConstants
+from IT8951_ePaper_Py.constants import GPIOPin, SPIConstants, TimingConstants
 from IT8951_ePaper_Py.exceptions import CommunicationError, InitializationError, IT8951TimeoutError
 from IT8951_ePaper_Py.spi_interface import (
     MockSPI,
@@ -16,6 +19,101 @@ from IT8951_ePaper_Py.spi_interface import (
     get_spi_speed_for_pi,
 )
 
+# Data transfer calls that must fail before init(), as (method, args)
+UNINITIALIZED_TRANSFERS = [
+    pytest.param("write_data", (0x1234,), id="write_data"),
+    pytest.param("write_data_bulk", ([0x1234],), id="write_data_bulk"),
+    pytest.param("read_data", (), id="read_data"),
+    pytest.param("read_data_bulk", (5,), id="read_data_bulk"),
+]
+
+# /proc/cpuinfo samples for Raspberry Pi version detection
+CPUINFO_PI3 = """processor       : 0
+model name      : ARMv7 Processor rev 4 (v7l)
+BogoMIPS        : 76.80
+Features        : half thumb fastmult vfp edsp neon vfpv3 tls vfpv4 idiva idivt vfpd32 lpae evtstrm crc32
+CPU implementer : 0x41
+CPU architecture: 7
+CPU variant     : 0x0
+CPU part        : 0xd08
+CPU revision    : 3
+
+Hardware        : BCM2835
+Revision        : a32082
+Serial          : 00000000abcdef12
+Model           : Raspberry Pi 3 Model B Rev 1.2
+"""
+
+CPUINFO_PI4 = """processor       : 0
+model name      : ARMv7 Processor rev 3 (v7l)
+BogoMIPS        : 108.00
+Features        : half thumb fastmult vfp edsp neon vfpv3 tls vfpv4 idiva idivt vfpd32 lpae evtstrm crc32
+CPU implementer : 0x41
+CPU architecture: 7
+CPU variant     : 0x0
+CPU part        : 0xd08
+CPU revision    : 3
+
+Hardware        : BCM2711
+Revision        : c03112
+Serial          : 100000001234abcd
+Model           : Raspberry Pi 4 Model B Rev 1.2
+"""
+
+CPUINFO_PI5 = """processor       : 0
+BogoMIPS        : 108.00
+Features        : fp asimd evtstrm aes pmull sha1 sha2 crc32 atomics fphp asimdhp cpuid asimdrdm lrcpc dcpop asimddp
+CPU implementer : 0x41
+CPU architecture: 8
+CPU variant     : 0x4
+CPU part        : 0xd0b
+CPU revision    : 1
+
+Hardware        : BCM2712
+Revision        : c04170
+Serial          : 100000001234abcd
+Model           : Raspberry Pi 5 Model B Rev 1.0
+"""
+
+CPUINFO_UNKNOWN = """processor       : 0
+model name      : Unknown Processor
+Revision        : unknown123
+"""
+
+CPUINFO_NO_REVISION = """processor       : 0
+model name      : ARMv7 Processor
+"""
+
+CPUINFO_SHORT_REVISION = """processor       : 0
+model name      : ARMv7 Processor
+Revision        : a32
+"""
+
+
+class FakeRPiModules(NamedTuple):
+    """Mocks behind the fake RPi.GPIO and spidev modules."""
+
+    gpio: Mock
+    spi_device: Mock
+
+
+@pytest.fixture
+def fake_rpi(mocker: MockerFixture) -> FakeRPiModules:
+    """Install fake RPi.GPIO and spidev modules and return their mocks."""
+    gpio = mocker.Mock(BCM=11, OUT=0, IN=1)
+    gpio.input.return_value = 0  # Not busy
+    spidev = mocker.Mock()
+    mocker.patch.dict(
+        "sys.modules", {"RPi": mocker.Mock(GPIO=gpio), "RPi.GPIO": gpio, "spidev": spidev}
+    )
+    return FakeRPiModules(gpio, spidev.SpiDev.return_value)
+
+
+@pytest.fixture(scope="module", params=[3, 1024, 65536])
+def bulk_payload(request: pytest.FixtureRequest) -> list[int]:
+    """Build each bulk-write payload size once per module."""
+    return list(range(request.param))
+
 
 class TestMockSPI:
     """Test MockSPI implementation."""
@@ -43,19 +141,17 @@ class TestMockSPI:
         assert spi.get_last_command() is None
         assert len(spi.get_data_buffer()) == 0
 
-    @pytest.mark.slow
-    def test_reset(self) -> None:
+    def test_reset(self, mocker: MockerFixture) -> None:
         """Test hardware reset simulation."""
+        mock_sleep = mocker.patch("IT8951_ePaper_Py.spi_interface.time.sleep")
         spi = MockSPI()
         spi.init()
         spi._busy = True  # type: ignore[reportPrivateUsage]
 
-        start = time.time()
         spi.reset()
-        elapsed = time.time() - start
 
         assert not spi._busy  # type: ignore[reportPrivateUsage]
-        assert elapsed >= 0.1
+        mock_sleep.assert_called_with(TimingConstants.RESET_DURATION_S)
 
     def test_wait_busy(self) -> None:
         """Test wait busy simulation."""
@@ -88,16 +184,43 @@ class TestMockSPI:
         buffer = spi.get_data_buffer()
         assert buffer == [0x1234, 0x5678]
 
-    def test_write_data_bulk(self) -> None:
+    def test_write_data_bulk(self, bulk_payload: list[int]) -> None:
         """Test bulk data writing."""
         spi = MockSPI()
         spi.init()
 
-        data = [0x1111, 0x2222, 0x3333]
-        spi.write_data_bulk(data)
+        spi.write_data_bulk(bulk_payload)
 
         buffer = spi.get_data_buffer()
-        assert buffer == data
+        assert buffer == bulk_payload
+
+    def test_wrote(self) -> None:
+        """Test checking the write history without copying it."""
+        spi = MockSPI()
+        spi.init()
+
+        spi.write_data_bulk([0x1111, 0x2222, 0x3333])
+
+        assert spi.wrote(0x1111, 0x3333)
+        assert not spi.wrote(0x1111, 0x4444)
+
+        # An empty check must not pass without checking anything
+        with pytest.raises(TypeError):
+            spi.wrote()  # type: ignore[reportCallIssue]
+
+    def test_reset_state(self) -> None:
+        """Test clearing queued reads and write history while staying initialized."""
+        spi = MockSPI()
+        spi.init()
+        spi.write_command(0x1234)
+        spi.write_data(0x5678)
+        spi.set_read_data([0x1111])
+
+        spi.reset_state()
+
+        assert spi.get_last_command() is None
+        assert spi.get_data_buffer() == []
+        assert spi.read_data() == 0xFFFF
 
     def test_read_data(self) -> None:
         """Test data reading."""
@@ -121,29 +244,22 @@ class TestMockSPI:
 
         assert data == [0x1111, 0x2222, 0x3333, 0xFFFF, 0xFFFF]
 
-    def test_write_data_without_init(self) -> None:
-        """Test write_data fails without initialization."""
+    def test_set_read_data_multiple_chunks(self) -> None:
+        """Test queueing several read chunks in one call."""
         spi = MockSPI()
-        with pytest.raises(CommunicationError):
-            spi.write_data(0x1234)
+        spi.init()
 
-    def test_write_data_bulk_without_init(self) -> None:
-        """Test write_data_bulk fails without initialization."""
-        spi = MockSPI()
-        with pytest.raises(CommunicationError):
-            spi.write_data_bulk([0x1234])
+        spi.set_read_data([0x1111, 0x2222], [0x3333])
+        data = spi.read_data_bulk(3)
 
-    def test_read_data_without_init(self) -> None:
-        """Test read_data fails without initialization."""
-        spi = MockSPI()
-        with pytest.raises(CommunicationError):
-            spi.read_data()
+        assert data == [0x1111, 0x2222, 0x3333]
 
-    def test_read_data_bulk_without_init(self) -> None:
-        """Test read_data_bulk fails without initialization."""
+    @pytest.mark.parametrize(("method", "args"), UNINITIALIZED_TRANSFERS)
+    def test_transfer_without_init(self, method: str, args: tuple[object, ...]) -> None:
+        """Test data transfers fail without initialization."""
         spi = MockSPI()
         with pytest.raises(CommunicationError):
-            spi.read_data_bulk(5)
+            getattr(spi, method)(*args)
 
 
 class TestRaspberryPiSPI:
@@ -183,25 +299,9 @@ class TestRaspberryPiSPI:
         with pytest.raises(CommunicationError):
             spi.write_command(0x1234)
 
-    def test_mock_gpio_operations(self, mocker: MockerFixture) -> None:
+    def test_mock_gpio_operations(self, fake_rpi: FakeRPiModules) -> None:
         """Test GPIO operations with mocked hardware."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
+        mock_gpio = fake_rpi.gpio
 
         spi = RaspberryPiSPI()
         spi.init()
@@ -213,25 +313,9 @@ class TestRaspberryPiSPI:
         spi.close()
         mock_gpio.cleanup.assert_called_once()
 
-    def test_init_already_initialized(self, mocker: MockerFixture) -> None:
+    def test_init_already_initialized(self, fake_rpi: FakeRPiModules) -> None:
         """Test init when already initialized."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
+        mock_gpio = fake_rpi.gpio
 
         spi = RaspberryPiSPI()
         spi.init()
@@ -247,23 +331,11 @@ class TestRaspberryPiSPI:
 
         spi.close()
 
-    def test_init_general_exception(self, mocker: MockerFixture) -> None:
+    def test_init_general_exception(self, fake_rpi: FakeRPiModules) -> None:
         """Test init with general exception."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
+        mock_gpio = fake_rpi.gpio
         mock_gpio.setmode.side_effect = Exception("Hardware error")
 
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mocker.MagicMock(),
-            },
-        )
-
         spi = RaspberryPiSPI()
         with pytest.raises(InitializationError) as exc_info:
             spi.init()
@@ -271,97 +343,52 @@ class TestRaspberryPiSPI:
         assert "Failed to initialize SPI" in str(exc_info.value)
         assert "Hardware error" in str(exc_info.value)
 
-    @pytest.mark.slow
-    def test_reset_with_hardware(self, mocker: MockerFixture) -> None:
+    def test_reset_with_hardware(self, mocker: MockerFixture, fake_rpi: FakeRPiModules) -> None:
         """Test hardware reset with mocked GPIO."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
+        mock_gpio = fake_rpi.gpio
+        mock_sleep = mocker.patch("IT8951_ePaper_Py.spi_interface.time.sleep")
 
         spi = RaspberryPiSPI()
         spi.init()
 
         # Clear previous calls from init
         mock_gpio.output.reset_mock()
+        mock_sleep.reset_mock()
 
         # Test reset
-        start = time.time()
         spi.reset()
-        elapsed = time.time() - start
 
         # Should set RESET low, wait, then high
-        assert mock_gpio.output.call_count == 2
-        mock_gpio.output.assert_any_call(GPIOPin.RESET, 0)
-        mock_gpio.output.assert_any_call(GPIOPin.RESET, 1)
-        assert elapsed >= 0.2  # Two 0.1s sleeps
+        assert mock_gpio.output.call_args_list == [call(GPIOPin.RESET, 0), call(GPIOPin.RESET, 1)]
+        assert mock_sleep.call_args_list == [call(TimingConstants.RESET_DURATION_S)] * 2
 
         spi.close()
 
-    def test_wait_busy_timeout(self, mocker: MockerFixture) -> None:
+    def test_wait_busy_timeout(self, mocker: MockerFixture, fake_rpi: FakeRPiModules) -> None:
         """Test wait_busy timeout scenario."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
+        mock_gpio = fake_rpi.gpio
         mock_gpio.input.return_value = 1  # Always busy
 
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
-
         spi = RaspberryPiSPI()
         spi.init()
 
+        # Advance a virtual clock 50ms per reading so the timeout passes without waiting
+        mocker.patch(
+            "IT8951_ePaper_Py.spi_interface.time.time", side_effect=itertools.count(0, 0.05)
+        )
+        mocker.patch("IT8951_ePaper_Py.spi_interface.time.sleep")
+
         with pytest.raises(IT8951TimeoutError) as exc_info:
             spi.wait_busy(timeout_ms=100)
 
         assert "Device busy timeout after 100ms" in str(exc_info.value)
         spi.close()
 
-    def test_wait_busy_success(self, mocker: MockerFixture) -> None:
+    def test_wait_busy_success(self, fake_rpi: FakeRPiModules) -> None:
         """Test successful wait_busy."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
+        mock_gpio = fake_rpi.gpio
         mock_gpio.input.side_effect = [1, 1, 0]  # Busy twice, then ready
 
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
-
         spi = RaspberryPiSPI()
         spi.init()
 
@@ -370,96 +397,43 @@ class TestRaspberryPiSPI:
 
         spi.close()
 
-    def test_write_command_with_hardware(self, mocker: MockerFixture) -> None:
+    def test_write_command_with_hardware(self, fake_rpi: FakeRPiModules) -> None:
         """Test write_command with mocked hardware."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-        mock_gpio.input.return_value = 0  # Not busy
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
+        mock_spi_instance = fake_rpi.spi_device
 
         spi = RaspberryPiSPI()
         spi.init()
 
         spi.write_command(0x1234)
 
-        # Should write preamble and command
-        assert mock_spi_instance.writebytes.call_count == 2
-        # Preamble
-        mock_spi_instance.writebytes.assert_any_call([0x60, 0x00])
-        # Command
-        mock_spi_instance.writebytes.assert_any_call([0x12, 0x34])
+        # Should write preamble, then command
+        assert mock_spi_instance.writebytes.call_args_list == [
+            call([0x60, 0x00]),
+            call([0x12, 0x34]),
+        ]
 
         spi.close()
 
-    def test_write_data_with_hardware(self, mocker: MockerFixture) -> None:
+    def test_write_data_with_hardware(self, fake_rpi: FakeRPiModules) -> None:
         """Test write_data with mocked hardware."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-        mock_gpio.input.return_value = 0  # Not busy
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
+        mock_spi_instance = fake_rpi.spi_device
 
         spi = RaspberryPiSPI()
         spi.init()
 
         spi.write_data(0x5678)
 
-        # Should write preamble and data
-        assert mock_spi_instance.writebytes.call_count == 2
-        # Preamble
-        mock_spi_instance.writebytes.assert_any_call([0x00, 0x00])
-        # Data
-        mock_spi_instance.writebytes.assert_any_call([0x56, 0x78])
+        # Should write preamble, then data
+        assert mock_spi_instance.writebytes.call_args_list == [
+            call([0x00, 0x00]),
+            call([0x56, 0x78]),
+        ]
 
         spi.close()
 
-    def test_write_data_bulk_with_hardware(self, mocker: MockerFixture) -> None:
+    def test_write_data_bulk_with_hardware(self, fake_rpi: FakeRPiModules) -> None:
         """Test write_data_bulk with mocked hardware."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-        mock_gpio.input.return_value = 0  # Not busy
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
+        mock_spi_instance = fake_rpi.spi_device
 
         spi = RaspberryPiSPI()
         spi.init()
@@ -467,50 +441,29 @@ class TestRaspberryPiSPI:
         data = [0x1111, 0x2222, 0x3333]
         spi.write_data_bulk(data)
 
-        # Should write preamble + bulk data = 2 calls (optimized)
-        assert mock_spi_instance.writebytes.call_count == 2
-        # Preamble
-        mock_spi_instance.writebytes.assert_any_call([0x00, 0x00])
-        # All data values in one call (now as bytearray for zero-copy)
-        mock_spi_instance.writebytes.assert_any_call(
-            bytearray([0x11, 0x11, 0x22, 0x22, 0x33, 0x33])
-        )
+        # Should write preamble, then all data values in one call (as bytearray for zero-copy)
+        assert mock_spi_instance.writebytes.call_args_list == [
+            call([0x00, 0x00]),
+            call(bytearray([0x11, 0x11, 0x22, 0x22, 0x33, 0x33])),
+        ]
 
         spi.close()
 
-    def test_read_data_with_hardware(self, mocker: MockerFixture) -> None:
+    def test_read_data_with_hardware(self, fake_rpi: FakeRPiModules) -> None:
         """Test read_data with mocked hardware."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-        mock_gpio.input.return_value = 0  # Not busy
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
+        mock_spi_instance = fake_rpi.spi_device
         mock_spi_instance.xfer2.return_value = [0xAB, 0xCD]
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
 
         spi = RaspberryPiSPI()
         spi.init()
 
         result = spi.read_data()
 
-        # Should write preamble and dummy, then read
-        assert mock_spi_instance.writebytes.call_count == 2
-        # Read preamble
-        mock_spi_instance.writebytes.assert_any_call([0x10, 0x00])
-        # Dummy data
-        mock_spi_instance.writebytes.assert_any_call([0x00, 0x00])
+        # Should write read preamble and dummy data, then read
+        assert mock_spi_instance.writebytes.call_args_list == [
+            call([0x10, 0x00]),
+            call([0x00, 0x00]),
+        ]
 
         # Should transfer to read result
         mock_spi_instance.xfer2.assert_called_once_with([0x00, 0x00])
@@ -518,89 +471,42 @@ class TestRaspberryPiSPI:
 
         spi.close()
 
-    def test_read_data_bulk_with_hardware(self, mocker: MockerFixture) -> None:
+    def test_read_data_bulk_with_hardware(self, fake_rpi: FakeRPiModules) -> None:
         """Test read_data_bulk with mocked hardware."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-        mock_gpio.input.return_value = 0  # Not busy
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
+        mock_spi_instance = fake_rpi.spi_device
         mock_spi_instance.xfer2.side_effect = [
             [0x11, 0x11],
             [0x22, 0x22],
             [0x33, 0x33],
         ]
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
 
         spi = RaspberryPiSPI()
         spi.init()
 
         result = spi.read_data_bulk(3)
 
-        # Should write preamble and dummy
-        assert mock_spi_instance.writebytes.call_count == 2
-        # Read preamble
-        mock_spi_instance.writebytes.assert_any_call([0x10, 0x00])
-        # Dummy data
-        mock_spi_instance.writebytes.assert_any_call([0x00, 0x00])
+        # Should write read preamble and dummy data
+        assert mock_spi_instance.writebytes.call_args_list == [
+            call([0x10, 0x00]),
+            call([0x00, 0x00]),
+        ]
 
         # Should transfer 3 times
-        assert mock_spi_instance.xfer2.call_count == 3
+        assert mock_spi_instance.xfer2.call_args_list == [call([0x00, 0x00])] * 3
         assert result == [0x1111, 0x2222, 0x3333]
 
         spi.close()
 
-    def test_write_data_without_init(self) -> None:
-        """Test write_data fails without initialization."""
-        spi = RaspberryPiSPI()
-        with pytest.raises(CommunicationError):
-            spi.write_data(0x1234)
-
-    def test_write_data_bulk_without_init(self) -> None:
-        """Test write_data_bulk fails without initialization."""
-        spi = RaspberryPiSPI()
-        with pytest.raises(CommunicationError):
-            spi.write_data_bulk([0x1234])
-
-    def test_read_data_without_init(self) -> None:
-        """Test read_data fails without initialization."""
+    @pytest.mark.parametrize(("method", "args"), UNINITIALIZED_TRANSFERS)
+    def test_transfer_without_init(self, method: str, args: tuple[object, ...]) -> None:
+        """Test data transfers fail without initialization."""
         spi = RaspberryPiSPI()
         with pytest.raises(CommunicationError):
-            spi.read_data()
+            getattr(spi, method)(*args)
 
-    def test_read_data_bulk_without_init(self) -> None:
-        """Test read_data_bulk fails without initialization."""
-        spi = RaspberryPiSPI()
-        with pytest.raises(CommunicationError):
-            spi.read_data_bulk(5)
-
-    def test_close_partial_init(self, mocker: MockerFixture) -> None:
+    def test_close_partial_init(self, fake_rpi: FakeRPiModules) -> None:
         """Test close when only partially initialized."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mocker.MagicMock(),
-            },
-        )
+        mock_gpio = fake_rpi.gpio
 
         spi = RaspberryPiSPI()
         spi._gpio = mock_gpio  # type: ignore[reportPrivateUsage]
@@ -615,18 +521,23 @@ class TestRaspberryPiSPI:
 class TestCreateSPIInterface:
     """Test SPI interface factory function."""
 
-    def test_create_mock_on_non_linux(self, mocker: MockerFixture) -> None:
-        """Test MockSPI is created on non-Linux platforms."""
-        mocker.patch("sys.platform", "darwin")
-        spi = create_spi_interface()
-        assert isinstance(spi, MockSPI)
-
-    def test_create_mock_on_non_arm_linux(self, mocker: MockerFixture) -> None:
-        """Test MockSPI is created on non-ARM Linux."""
-        mocker.patch("sys.platform", "linux")
-        mocker.patch("platform.machine", return_value="x86_64")
+    @pytest.mark.parametrize(
+        ("platform", "machine", "expected"),
+        [
+            pytest.param("darwin", "x86_64", MockSPI, id="non-linux"),
+            pytest.param("linux", "x86_64", MockSPI, id="x86_64-linux"),
+            pytest.param("linux", "armv7l", RaspberryPiSPI, id="armv7l-linux"),
+            pytest.param("linux", "aarch64", RaspberryPiSPI, id="aarch64-linux"),
+        ],
+    )
+    def test_create_for_platform(
+        self, monkeypatch: pytest.MonkeyPatch, platform: str, machine: str, expected: type
+    ) -> None:
+        """Test RaspberryPiSPI is created only on ARM Linux, MockSPI elsewhere."""
+        monkeypatch.setattr(sys, "platform", platform)
+        monkeypatch.setattr("platform.machine", lambda: machine)
         spi = create_spi_interface()
-        assert isinstance(spi, MockSPI)
+        assert isinstance(spi, expected)
 
     @pytest.mark.skipif(
         sys.platform != "linux" or "arm" not in sys.platform,
@@ -637,24 +548,10 @@ class TestCreateSPIInterface:
         spi = create_spi_interface()
         assert isinstance(spi, RaspberryPiSPI)
 
-    def test_create_raspberry_pi_on_arm_linux_mocked(self, mocker: MockerFixture) -> None:
-        """Test RaspberryPiSPI is created on ARM Linux using mocked platform."""
-        mocker.patch("sys.platform", "linux")
-        mocker.patch("platform.machine", return_value="armv7l")
-        spi = create_spi_interface()
-        assert isinstance(spi, RaspberryPiSPI)
-
-    def test_create_raspberry_pi_on_aarch64_linux_mocked(self, mocker: MockerFixture) -> None:
-        """Test RaspberryPiSPI is created on aarch64 Linux using mocked platform."""
-        mocker.patch("sys.platform", "linux")
-        mocker.patch("platform.machine", return_value="aarch64")
-        spi = create_spi_interface()
-        assert isinstance(spi, RaspberryPiSPI)
-
-    def test_create_with_speed_override(self, mocker: MockerFixture) -> None:
+    def test_create_with_speed_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test creating interface with manual speed override."""
-        mocker.patch("sys.platform", "linux")
-        mocker.patch("platform.machine", return_value="armv7l")
+        monkeypatch.setattr(sys, "platform", "linux")
+        monkeypatch.setattr("platform.machine", lambda: "armv7l")
         spi = create_spi_interface(spi_speed_hz=10000000)
         assert isinstance(spi, RaspberryPiSPI)
 
@@ -662,108 +559,22 @@ class TestCreateSPIInterface:
 class TestPiDetection:
     """Test Raspberry Pi version detection and speed selection."""
 
-    def test_detect_pi_3(self, mocker: MockerFixture) -> None:
-        """Test detecting Raspberry Pi 3."""
-        cpuinfo = """processor       : 0
-model name      : ARMv7 Processor rev 4 (v7l)
-BogoMIPS        : 76.80
-Features        : half thumb fastmult vfp edsp neon vfpv3 tls vfpv4 idiva idivt vfpd32 lpae evtstrm crc32
-CPU implementer : 0x41
-CPU architecture: 7
-CPU variant     : 0x0
-CPU part        : 0xd08
-CPU revision    : 3
-
-Hardware        : BCM2835
-Revision        : a32082
-Serial          : 00000000abcdef12
-Model           : Raspberry Pi 3 Model B Rev 1.2
-"""
-        mock_open = mocker.mock_open(read_data=cpuinfo)
-        mocker.patch("builtins.open", mock_open)
-
-        version = detect_raspberry_pi_version()
-        assert version == 3
-
-    def test_detect_pi_4(self, mocker: MockerFixture) -> None:
-        """Test detecting Raspberry Pi 4."""
-        cpuinfo = """processor       : 0
-model name      : ARMv7 Processor rev 3 (v7l)
-BogoMIPS        : 108.00
-Features        : half thumb fastmult vfp edsp neon vfpv3 tls vfpv4 idiva idivt vfpd32 lpae evtstrm crc32
-CPU implementer : 0x41
-CPU architecture: 7
-CPU variant     : 0x0
-CPU part        : 0xd08
-CPU revision    : 3
-
-Hardware        : BCM2711
-Revision        : c03112
-Serial          : 100000001234abcd
-Model           : Raspberry Pi 4 Model B Rev 1.2
-"""
-        mock_open = mocker.mock_open(read_data=cpuinfo)
-        mocker.patch("builtins.open", mock_open)
-
-        version = detect_raspberry_pi_version()
-        assert version == 4
-
-    def test_detect_pi_5(self, mocker: MockerFixture) -> None:
-        """Test detecting Raspberry Pi 5."""
-        cpuinfo = """processor       : 0
-BogoMIPS        : 108.00
-Features        : fp asimd evtstrm aes pmull sha1 sha2 crc32 atomics fphp asimdhp cpuid asimdrdm lrcpc dcpop asimddp
-CPU implementer : 0x41
-CPU architecture: 8
-CPU variant     : 0x4
-CPU part        : 0xd0b
-CPU revision    : 1
-
-Hardware        : BCM2712
-Revision        : c04170
-Serial          : 100000001234abcd
-Model           : Raspberry Pi 5 Model B Rev 1.0
-"""
-        mock_open = mocker.mock_open(read_data=cpuinfo)
-        mocker.patch("builtins.open", mock_open)
-
-        version = detect_raspberry_pi_version()
-        assert version == 5
-
-    def test_detect_unknown_pi(self, mocker: MockerFixture) -> None:
-        """Test detecting unknown Pi returns 4 (conservative)."""
-        cpuinfo = """processor       : 0
-model name      : Unknown Processor
-Revision        : unknown123
-"""
-        mock_open = mocker.mock_open(read_data=cpuinfo)
-        mocker.patch("builtins.open", mock_open)
-
-        version = detect_raspberry_pi_version()
-        assert version == 4  # Conservative default
-
-    def test_detect_no_revision(self, mocker: MockerFixture) -> None:
-        """Test handling missing revision info."""
-        cpuinfo = """processor       : 0
-model name      : ARMv7 Processor
-"""
-        mock_open = mocker.mock_open(read_data=cpuinfo)
-        mocker.patch("builtins.open", mock_open)
-
-        version = detect_raspberry_pi_version()
-        assert version == 4  # Conservative default
-
-    def test_detect_short_revision_string(self, mocker: MockerFixture) -> None:
-        """Test handling short revision strings (less than 6 chars) to cover line 64."""
-        cpuinfo = """processor       : 0
-model name      : ARMv7 Processor
-Revision        : a32
-"""
-        mock_open = mocker.mock_open(read_data=cpuinfo)
-        mocker.patch("builtins.open", mock_open)
+    @pytest.mark.parametrize(
+        ("cpuinfo", "expected"),
+        [
+            pytest.param(CPUINFO_PI3, 3, id="pi_3"),
+            pytest.param(CPUINFO_PI4, 4, id="pi_4"),
+            pytest.param(CPUINFO_PI5, 5, id="pi_5"),
+            pytest.param(CPUINFO_UNKNOWN, 4, id="unknown_pi"),
+            pytest.param(CPUINFO_NO_REVISION, 4, id="no_revision"),
+            pytest.param(CPUINFO_SHORT_REVISION, 4, id="short_revision"),
+        ],
+    )
+    def test_detect(self, mocker: MockerFixture, cpuinfo: str, expected: int) -> None:
+        """Test detecting the Pi version, falling back to 4 when it is unknown."""
+        mocker.patch("builtins.open", return_value=io.StringIO(cpuinfo))
 
-        version = detect_raspberry_pi_version()
-        assert version == 4  # Should fall back to conservative default
+        assert detect_raspberry_pi_version() == expected
 
     def test_detect_file_error(self, mocker: MockerFixture) -> None:
         """Test handling file read error."""
@@ -772,25 +583,19 @@ Revision        : a32
         version = detect_raspberry_pi_version()
         assert version == 4  # Conservative default
 
-    def test_get_spi_speed_pi3(self) -> None:
-        """Test getting SPI speed for Pi 3."""
-        speed = get_spi_speed_for_pi(pi_version=3)
-        assert speed == SPIConstants.SPI_SPEED_PI3_HZ
-
-    def test_get_spi_speed_pi4(self) -> None:
-        """Test getting SPI speed for Pi 4."""
-        speed = get_spi_speed_for_pi(pi_version=4)
-        assert speed == SPIConstants.SPI_SPEED_PI4_HZ
-
-    def test_get_spi_speed_pi5(self) -> None:
-        """Test getting SPI speed for Pi 5."""
-        speed = get_spi_speed_for_pi(pi_version=5)
-        assert speed == SPIConstants.SPI_SPEED_PI4_HZ  # Uses conservative speed
-
-    def test_get_spi_speed_override(self) -> None:
-        """Test SPI speed override."""
-        speed = get_spi_speed_for_pi(pi_version=3, override_hz=10000000)
-        assert speed == 10000000
+    @pytest.mark.parametrize(
+        ("pi_version", "override_hz", "expected"),
+        [
+            pytest.param(3, None, SPIConstants.SPI_SPEED_PI3_HZ, id="pi3"),
+            pytest.param(4, None, SPIConstants.SPI_SPEED_PI4_HZ, id="pi4"),
+            # Pi 5 uses the conservative Pi 4 speed
+            pytest.param(5, None, SPIConstants.SPI_SPEED_PI4_HZ, id="pi5"),
+            pytest.param(3, 10000000, 10000000, id="override"),
+        ],
+    )
+    def test_get_spi_speed(self, pi_version: int, override_hz: int | None, expected: int) -> None:
+        """Test SPI speed selection by Pi version and manual override."""
+        assert get_spi_speed_for_pi(pi_version=pi_version, override_hz=override_hz) == expected
 
     def test_get_spi_speed_auto_detect(self, mocker: MockerFixture) -> None:
         """Test SPI speed with auto-detection."""
@@ -803,26 +608,9 @@ Revision        : a32
 class TestRaspberryPiSPIWithSpeed:
     """Test RaspberryPiSPI with speed configuration."""
 
-    def test_init_with_auto_speed(self, mocker: MockerFixture) -> None:
+    def test_init_with_auto_speed(self, mocker: MockerFixture, fake_rpi: FakeRPiModules) -> None:
         """Test RaspberryPiSPI initialization with auto-detected speed."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-        mock_gpio.input.return_value = 0  # Not busy
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
+        mock_spi_instance = fake_rpi.spi_device
 
         # Mock Pi version detection to return Pi 3
         mocker.patch("IT8951_ePaper_Py.spi_interface.detect_raspberry_pi_version", return_value=3)
@@ -835,26 +623,9 @@ class TestRaspberryPiSPIWithSpeed:
 
         spi.close()
 
-    def test_init_with_manual_speed(self, mocker: MockerFixture) -> None:
+    def test_init_with_manual_speed(self, fake_rpi: FakeRPiModules) -> None:
         """Test RaspberryPiSPI initialization with manual speed override."""
-        mock_gpio = mocker.MagicMock()
-        mock_gpio.BCM = 11
-        mock_gpio.OUT = 0
-        mock_gpio.IN = 1
-        mock_gpio.input.return_value = 0  # Not busy
-
-        mock_spidev_class = mocker.MagicMock()
-        mock_spi_instance = mocker.MagicMock()
-        mock_spidev_class.SpiDev.return_value = mock_spi_instance
-
-        mocker.patch.dict(
-            "sys.modules",
-            {
-                "RPi": mocker.MagicMock(GPIO=mock_gpio),
-                "RPi.GPIO": mock_gpio,
-                "spidev": mock_spidev_class,
-            },
-        )
+        mock_spi_instance = fake_rpi.spi_device
 
         spi = RaspberryPiSPI(spi_speed_hz=10000000)
         spi.init()
@@ -1,53 +1,81 @@
 """Tests for utils module."""
 
 import logging
+from unittest.mock import Mock
 
 import pytest
+from pytest_mock import MockerFixture
 
+from IT8951_ePaper_Py import utils
 from IT8951_ePaper_Py.utils import timed_operation
 
 
+def logged_message(mock_debug: Mock) -> str:
+    """Render the last debug call the way a log handler would."""
+    msg, *args = mock_debug.call_args.args
+    return msg % tuple(args)
+
+
+@pytest.fixture
+def mock_logger() -> Mock:
+    """Provide a stub logger so timings are checked without log capture."""
+    return Mock(spec=logging.Logger)
+
+
 class TestTimedOperation:
     """Test the timed_operation decorator."""
 
-    def test_successful_operation(self, caplog: pytest.LogCaptureFixture) -> None:
+    def test_successful_operation(self, mock_logger: Mock) -> None:
         """Test timed operation with successful execution."""
 
-        @timed_operation("test operation")
+        @timed_operation("test operation", log=mock_logger)
         def successful_op() -> str:
             return "success"
 
-        with caplog.at_level(logging.DEBUG):
-            result = successful_op()
+        result = successful_op()
 
         assert result == "success"
-        assert "test operation completed" in caplog.text
-        assert "ms" in caplog.text
+        message = logged_message(mock_logger.debug)
+        assert "test operation completed" in message
+        assert "ms" in message
 
-    def test_operation_with_exception(self, caplog: pytest.LogCaptureFixture) -> None:
+    def test_operation_with_exception(self, mock_logger: Mock) -> None:
         """Test timed operation that raises an exception."""
 
-        @timed_operation("failing operation")
+        @timed_operation("failing operation", log=mock_logger)
         def failing_op() -> None:
             raise ValueError("Test error")
 
         # The operation should still raise the exception
-        with caplog.at_level(logging.DEBUG), pytest.raises(ValueError, match="Test error"):
+        with pytest.raises(ValueError, match="Test error"):
             failing_op()
 
         # Verify that the failure was logged
-        assert "failing operation failed" in caplog.text
-        assert "ms" in caplog.text
+        message = logged_message(mock_logger.debug)
+        assert "failing operation failed" in message
+        assert "ms" in message
 
-    def test_operation_with_args(self, caplog: pytest.LogCaptureFixture) -> None:
+    def test_operation_with_args(self, mock_logger: Mock) -> None:
         """Test timed operation with arguments."""
 
-        @timed_operation("operation with args")
+        @timed_operation("operation with args", log=mock_logger)
         def op_with_args(x: int, y: int, z: int = 3) -> int:
             return x + y + z
 
-        with caplog.at_level(logging.DEBUG):
-            result = op_with_args(1, 2, z=4)
+        result = op_with_args(1, 2, z=4)
 
         assert result == 7
-        assert "operation with args completed" in caplog.text
+        assert "operation with args completed" in logged_message(mock_logger.debug)
+
+    def test_defaults_to_module_logger(self, mocker: MockerFixture) -> None:
+        """Test that timings go to the utils module logger by default."""
+        mock_debug = mocker.patch.object(utils.logger, "debug")
+
+        @timed_operation()
+        def named_op() -> None:
+            pass
+
+        named_op()
+
+        mock_debug.assert_called_once()
+        assert "named_op completed" in logged_message(mock_debug)